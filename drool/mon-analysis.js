@@ -1,4 +1,4 @@
-import { loadFullMonsFromCsv, loadMovesFromCsv, loadAbilitiesFromCsv, loadTypeData } from "./utils.js";
+import { loadFullMonsFromCsv, loadMovesFromCsv, loadAbilitiesFromCsv, loadTypeData, loadMatchups } from "./utils.js";
 import { typeData } from "./type-data.js";
 
 document.addEventListener("DOMContentLoaded", async function () {
@@ -23,6 +23,7 @@ document.addEventListener("DOMContentLoaded", async function () {
   // Variables for move damage calculation
   let movesData = await loadMovesFromCsv();
   let typeEffectivenessData = await loadTypeData();
+  const precomputed = await loadMatchups();
 
   // Event listeners
   transposeTableCheckbox.addEventListener("change", function() {
@@ -122,6 +123,36 @@ document.addEventListener("DOMContentLoaded", async function () {
     return type1Multiplier * type2Multiplier;
   }
 
+  function monSignature(mon) {
+    return [mon.HP, mon.Attack, mon.Defense, mon.SpecialAttack, mon.SpecialDefense, mon.Type1, mon.Type2].join("|");
+  }
+
+  function moveSignature(move) {
+    return [move.Power, move.Accuracy, move.Type, move.Class].join("|");
+  }
+
+  // Look up a precomputed matchup; returns null if the row is missing or the stats were edited since
+  function lookupMoveDamage(move, attacker, defender) {
+    if (!precomputed) {
+      return null;
+    }
+    const row = precomputed.matchups[attacker.Name]?.[move.Name];
+    const defenderIndex = precomputed.defenders.indexOf(defender.Name);
+    if (!row || defenderIndex < 0 || row.signature !== moveSignature(move) ||
+        precomputed.signatures[attacker.Name] !== monSignature(attacker) ||
+        precomputed.signatures[defender.Name] !== monSignature(defender)) {
+      return null;
+    }
+    return {
+      damage: row.damage[defenderIndex],
+      typeMultiplier: row.typeMultiplier[defenderIndex],
+      minDamage: row.min[defenderIndex],
+      expectedDamage: row.expected[defenderIndex],
+      maxDamage: row.max[defenderIndex],
+      hitsToKo: row.hitsToKo[defenderIndex]
+    };
+  }
+
   // Function to calculate damage for a move
   function calculateMoveDamage(move, attacker, defender) {
     // Skip if move has no power or power is '?'
@@ -147,11 +178,15 @@ document.addEventListener("DOMContentLoaded", async function () {
     // Calculate base damage
     let baseDamage = (move.Power * attackStat) / defenseStat;
 
-    // Apply type effectiveness
-    const typeMultiplier = getTypeEffectiveness(move.Type, defender.Type1, defender.Type2);
-    const damage = baseDamage * typeMultiplier;
+    // Apply type effectiveness, unless the precomputed matchup is still current
+    const precomputedDamage = lookupMoveDamage(move, attacker, defender);
+    const typeMultiplier = precomputedDamage
+      ? precomputedDamage.typeMultiplier
+      : getTypeEffectiveness(move.Type, defender.Type1, defender.Type2);
+    const damage = precomputedDamage ? precomputedDamage.damage : baseDamage * typeMultiplier;
 
     return {
+      ...precomputedDamage,
       damage,
       baseDamage,
       moveName: move.Name,
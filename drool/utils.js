@@ -199,4 +199,16 @@ export async function loadTypeData() {
     console.error("Error loading types.csv:", error);
   }
   return {};
-}
\ No newline at end of file
+}
+// Precomputed damage for every (attacker, move, defender) triple, written by python/matchup_tensors.py
+export async function loadMatchups() {
+  try {
+    const response = await fetch("matchups/matchups.json");
+    if (response.ok) {
+      return await response.json();
+    }
+  } catch (error) {
+    console.error("Error loading matchups/matchups.json:", error);
+  }
+  return null;
+}
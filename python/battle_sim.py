@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Monte Carlo battle simulator for roster balance.
+
+Models the Engine.sol turn loop at the level that matters for balance: one active mon per
+player, stamina costs and regen, priority then speed ordering, forced switches on KO and
+game over once a team is wiped. Damage goes through damage_calc (AttackCalculator's formula).
+Custom move effects, abilities and status effects are not modelled.
+
+Run from the repository root:
+    python python/battle_sim.py --mode pairs --games 2000 --seed 0
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from damage_calc import calculate_damage, is_damaging
+from game_data import (DEFAULT_PRIORITY, DEFAULT_STAMINA, DEFAULT_VOL, MOVE_CLASS_INDEX, MonTable, MoveTable,
+                       load_mon_table, load_move_table, load_type_chart)
+
+# Mirrors src/Constants.sol (priority of switching and resting)
+SWITCH_PRIORITY = 6
+
+DRAW = 2
+DEFAULT_MAX_TURNS = 200
+DEFAULT_SHARD_SIZE = 50_000
+
+
+class BattleData:
+    """Roster tables plus the per-move/per-matchup lookups the simulator needs"""
+    def __init__(self, mons: MonTable, moves: MoveTable, type_chart: np.ndarray):
+        self.mons = mons
+        self.moves = moves
+        self.type_chart = type_chart
+
+        # Padded (num_mons, max_moves) table of move indices, -1 for empty slots
+        self.mon_moves = moves.padded_by_mon(len(mons))
+
+        self.damaging = is_damaging(moves)
+        self.priority = DEFAULT_PRIORITY + moves.priority
+        self.physical = moves.move_class == MOVE_CLASS_INDEX["Physical"]
+
+        # Expected damage of every move against every defender (no volatility, no crit), used by the policy
+        move_index, defender_index = np.meshgrid(np.arange(len(moves)), np.arange(len(mons)), indexing='ij')
+        base_damage = self.damage(move_index, defender_index, 0, 0, 0, 100, volatility=0)
+        self.expected = np.where(self.damaging[:, None], base_damage * moves.accuracy[:, None] / 100.0, 0.0)
+
+        # Best expected damage a mon can deal to each defender, used to pick switch-ins
+        padded = np.vstack([self.expected, np.zeros((1, len(mons)))])
+        self.best_expected = padded[self.mon_moves].max(axis=1)
+
+    def damage(self, move_index: np.ndarray, defender_index: np.ndarray, accuracy_roll, volatility_roll,
+               volatility_offset, crit_roll, volatility=DEFAULT_VOL) -> np.ndarray:
+        """Damage of moves[move_index] used by its owner against mons[defender_index], at base stats"""
+        attacker_index = self.moves.mon[move_index]
+        physical = self.physical[move_index]
+        attack_stat = np.where(physical, self.mons.attack[attacker_index], self.mons.special_attack[attacker_index])
+        defence_stat = np.where(physical, self.mons.defense[defender_index], self.mons.special_defense[defender_index])
+        damage, _ = calculate_damage(
+            self.type_chart, self.moves.power[move_index], self.moves.accuracy[move_index], volatility,
+            self.moves.move_type[move_index], attack_stat, defence_stat, self.mons.type1[defender_index],
+            self.mons.type2[defender_index], accuracy_roll, volatility_roll, volatility_offset, crit_roll)
+        return damage.astype(np.int64)
+
+
+def simulate_games(data: BattleData, team0: np.ndarray, team1: np.ndarray, rng: np.random.Generator,
+                   max_turns: int = DEFAULT_MAX_TURNS) -> Tuple[np.ndarray, np.ndarray]:
+    """Play a batch of games in lockstep.
+
+    Args:
+        team0, team1: (G, T) arrays of mon indices; mon 0 of each team leads
+
+    Returns:
+        tuple: (winner, turns) where winner is 0, 1 or DRAW (turn limit reached)
+    """
+    teams = np.stack([np.asarray(team0, dtype=np.int64), np.asarray(team1, dtype=np.int64)], axis=1)  # (G, 2, T)
+    num_games = teams.shape[0]
+
+    hp = data.mons.hp[teams].astype(np.int64)
+    stamina = np.full(teams.shape, DEFAULT_STAMINA, dtype=np.int64)
+    active = np.zeros((num_games, 2), dtype=np.int64)
+    winner = np.full(num_games, -1, dtype=np.int64)
+    turns = np.zeros(num_games, dtype=np.int64)
+
+    for _ in range(max_turns):
+        live = np.flatnonzero(winner < 0)
+        if len(live) == 0:
+            break
+        turns[live] += 1
+
+        # Forced switches: a KO'ed active mon is replaced by the bench mon with the best matchup
+        for player in (0, 1):
+            knocked_out = hp[live, player, active[live, player]] <= 0
+            g = live[knocked_out]
+            if len(g):
+                opponent = teams[g, 1 - player, active[g, 1 - player]]
+                score = data.best_expected[teams[g, player], opponent[:, None]]
+                score = np.where(hp[g, player] > 0, score, -np.inf)
+                active[g, player] = score.argmax(axis=1)
+
+        # Each turn draws one rng shared by both moves, as in Engine.execute. Derived residues:
+        # rng % 100 (accuracy, and its parity for speed ties), rng2 % 100 and rng2 % (vol + 1)
+        # (drawn jointly mod 1100, since 100 and 11 are coprime) and rng3 % 100 (crit).
+        accuracy_roll = rng.integers(0, 100, len(live))
+        rng2_roll = rng.integers(0, 100 * (DEFAULT_VOL + 1), len(live))
+        volatility_roll = rng2_roll % 100
+        volatility_offset = rng2_roll % (DEFAULT_VOL + 1)
+        crit_roll = rng.integers(0, 100, len(live))
+
+        mon = teams[live[:, None], [0, 1], active[live]]  # (L, 2) active mon indices
+        slot_stamina = stamina[live[:, None], [0, 1], active[live]]
+
+        # Greedy policy: best affordable damaging move by expected damage, otherwise rest
+        chosen = np.empty((len(live), 2), dtype=np.int64)
+        resting = np.empty((len(live), 2), dtype=bool)
+        for player in (0, 1):
+            candidates = data.mon_moves[mon[:, player]]
+            valid = (candidates >= 0) & data.damaging[candidates] & \
+                (data.moves.stamina[candidates] <= slot_stamina[:, player, None])
+            score = np.where(valid, data.expected[candidates, mon[:, 1 - player, None]], 0.0)
+            best = score.argmax(axis=1)
+            chosen[:, player] = candidates[np.arange(len(live)), best]
+            resting[:, player] = score.max(axis=1) <= 0
+
+        # Priority tier, then speed, then rng parity (FastValidator.computePriorityPlayerIndex)
+        priority = np.where(resting, SWITCH_PRIORITY, data.priority[chosen])
+        speed = data.mons.speed[mon]
+        first = np.where(priority[:, 0] != priority[:, 1], (priority[:, 1] > priority[:, 0]).astype(np.int64),
+                         np.where(speed[:, 0] != speed[:, 1], (speed[:, 1] > speed[:, 0]).astype(np.int64),
+                                  accuracy_roll % 2))
+
+        g = live
+        for p in (first, 1 - first):
+            own_slot = active[g, p]
+            other_slot = active[g, 1 - p]
+
+            # Moves don't run once either active mon is KO'ed this turn
+            can_act = (hp[g, p, own_slot] > 0) & (hp[g, 1 - p, other_slot] > 0)
+            rest = can_act & resting[np.arange(len(g)), p]
+            attack = can_act & ~rest
+
+            # Resting regenerates one stamina (StaminaRegen.onAfterMove)
+            r = np.flatnonzero(rest)
+            stamina[g[r], p[r], own_slot[r]] = np.minimum(stamina[g[r], p[r], own_slot[r]] + 1, DEFAULT_STAMINA)
+
+            a = np.flatnonzero(attack)
+            if len(a):
+                move = chosen[a, p[a]]
+                stamina[g[a], p[a], own_slot[a]] -= data.moves.stamina[move]
+                defender = teams[g[a], 1 - p[a], other_slot[a]]
+                damage = data.damage(move, defender, accuracy_roll[a], volatility_roll[a],
+                                     volatility_offset[a], crit_roll[a])
+                hp[g[a], 1 - p[a], other_slot[a]] -= damage
+
+                # Game over once every mon of the defending team is KO'ed
+                wiped = (hp[g[a], 1 - p[a]] <= 0).all(axis=1)
+                winner[g[a][wiped]] = p[a][wiped]
+
+        # Round end: both active mons regenerate one stamina (StaminaRegen.onRoundEnd)
+        still_live = live[winner[live] < 0]
+        for player in (0, 1):
+            slot = active[still_live, player]
+            stamina[still_live, player, slot] = np.minimum(stamina[still_live, player, slot] + 1, DEFAULT_STAMINA)
+
+    winner[winner < 0] = DRAW
+    return winner, turns
+
+
+_worker_data: Optional[BattleData] = None
+
+
+def _init_worker(data: BattleData) -> None:
+    global _worker_data
+    _worker_data = data
+
+
+def _simulate_shard(args) -> Tuple[np.ndarray, np.ndarray]:
+    team0, team1, seed_sequence, max_turns = args
+    return simulate_games(_worker_data, team0, team1, np.random.default_rng(seed_sequence), max_turns)
+
+
+def simulate_parallel(data: BattleData, team0: np.ndarray, team1: np.ndarray, seed: int,
+                      workers: Optional[int] = None, shard_size: int = DEFAULT_SHARD_SIZE,
+                      max_turns: int = DEFAULT_MAX_TURNS) -> Tuple[np.ndarray, np.ndarray]:
+    """simulate_games sharded over a process pool.
+
+    Each shard gets its own child of SeedSequence(seed), so results depend only on the seed and
+    shard_size, never on the number of workers.
+    """
+    num_games = len(team0)
+    starts = list(range(0, num_games, shard_size))
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    jobs = [(team0[s:s + shard_size], team1[s:s + shard_size], seed_sequence, max_turns)
+            for s, seed_sequence in zip(starts, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        _init_worker(data)
+        results = [_simulate_shard(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data,)) as pool:
+            results = list(pool.map(_simulate_shard, jobs))
+
+    if not results:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate([r[0] for r in results]), np.concatenate([r[1] for r in results])
+
+
+def win_rate_matrix(data: BattleData, teams: Sequence[Sequence[int]], games: int, seed: int,
+                    workers: Optional[int] = None, max_turns: int = DEFAULT_MAX_TURNS) -> np.ndarray:
+    """Win rate of teams[i] (as player 0) against teams[j], counting draws as half a win"""
+    teams = np.asarray(teams, dtype=np.int64)
+    n = len(teams)
+    row, col = np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+    row = np.repeat(row.ravel(), games)
+    col = np.repeat(col.ravel(), games)
+
+    winner, _ = simulate_parallel(data, teams[row], teams[col], seed, workers, max_turns=max_turns)
+    score = np.where(winner == 0, 1.0, np.where(winner == DRAW, 0.5, 0.0))
+    return score.reshape(n, n, games).mean(axis=2)
+
+
+def load_battle_data(base_path: str) -> BattleData:
+    """Load the roster CSVs under drool/ into a BattleData"""
+    mons = load_mon_table(os.path.join(base_path, "drool", "mons.csv"))
+    moves = load_move_table(os.path.join(base_path, "drool", "moves.csv"), mons)
+    type_chart = load_type_chart(os.path.join(base_path, "drool", "types.csv"))
+    return BattleData(mons, moves, type_chart)
+
+
+def format_matrix(labels: List[str], matrix: np.ndarray) -> str:
+    width = max(len(label) for label in labels)
+    lines = [" " * width + " " + " ".join(f"{label[:6]:>6}" for label in labels)]
+    for label, row in zip(labels, matrix):
+        lines.append(f"{label:>{width}} " + " ".join(f"{value:6.3f}" for value in row))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate battles and report win-rate matrices')
+    parser.add_argument('--mode', choices=['pairs', 'teams'], default='pairs',
+                        help='1v1 win rates for every mon pair, or win rates between teams')
+    parser.add_argument('--games', type=int, default=1000, help='Games per matchup')
+    parser.add_argument('--team', action='append', default=[],
+                        help='Comma-separated mon names for --mode teams (repeatable)')
+    parser.add_argument('--random-teams', type=int, default=8,
+                        help='Number of random teams to draw for --mode teams when no --team is given')
+    parser.add_argument('--team-size', type=int, default=3, help='Size of random teams')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for reproducible results')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Process pool size')
+    parser.add_argument('--max-turns', type=int, default=DEFAULT_MAX_TURNS, help='Turn limit before a draw')
+    parser.add_argument('--base-path', default='.', help='Repository root')
+    args = parser.parse_args()
+
+    data = load_battle_data(args.base_path)
+    names = data.mons.names
+
+    if args.mode == 'pairs':
+        teams = [[i] for i in range(len(names))]
+        labels = names
+    elif args.team:
+        teams = [[data.mons.index[name.strip()] for name in team.split(",")] for team in args.team]
+        labels = [f"T{i}" for i in range(len(teams))]
+    else:
+        team_rng = np.random.default_rng(args.seed)
+        teams = [team_rng.choice(len(names), args.team_size, replace=False).tolist() for _ in range(args.random_teams)]
+        labels = [f"T{i}" for i in range(len(teams))]
+
+    if args.mode == 'teams':
+        for label, team in zip(labels, teams):
+            print(f"{label}: {', '.join(names[i] for i in team)}")
+
+    matrix = win_rate_matrix(data, teams, args.games, args.seed, args.workers, args.max_turns)
+    print(f"\nWin rate of row (player 0) vs column, {args.games} games each, seed {args.seed}:")
+    print(format_matrix(labels, matrix))
+    print("\nAverage win rate:")
+    for label, rate in sorted(zip(labels, matrix.mean(axis=1)), key=lambda x: -x[1]):
+        print(f"  {label}: {rate:.3f}")
+
+
+if __name__ == "__main__":
+    main()
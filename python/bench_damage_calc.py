@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Check the batched damage calculator against the scalar transcription and measure its throughput.
+
+Run from the repository root:
+    python python/bench_damage_calc.py --matchups 1000000
+"""
+
+import argparse
+import os
+import random
+import time
+
+import numpy as np
+
+from damage_calc import calculate_damage, calculate_damage_reference, rolls_from_rng, score_matchups
+from game_data import NUM_TYPES, TYPE_NONE, load_mon_table, load_move_table, load_type_chart
+
+
+def random_inputs(n: int, rng: np.random.Generator) -> dict:
+    """Random calculateDamageView inputs over realistic stat ranges"""
+    return {
+        "base_power": rng.integers(0, 200, n),
+        "accuracy": rng.choice([50, 85, 90, 100], n),
+        "volatility": rng.integers(0, 20, n),
+        "attack_type": rng.integers(0, NUM_TYPES, n),
+        "attack_stat": rng.integers(0, 500, n),
+        "defence_stat": rng.integers(0, 500, n),
+        "defender_type1": rng.integers(0, NUM_TYPES, n),
+        "defender_type2": np.where(rng.random(n) < 0.5, TYPE_NONE, rng.integers(0, NUM_TYPES, n)),
+        "crit_rate": rng.integers(0, 30, n),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the batched damage calculator')
+    parser.add_argument('--matchups', type=int, default=1_000_000, help='Batch size for the throughput run')
+    parser.add_argument('--check', type=int, default=20_000, help='Number of cases checked against the reference')
+    parser.add_argument('--base-path', default='.', help='Repository root')
+    args = parser.parse_args()
+
+    type_chart = load_type_chart(os.path.join(args.base_path, "drool", "types.csv"))
+    np_rng = np.random.default_rng(0)
+    py_rng = random.Random(0)
+
+    # Exactness: random uint256 rng values through the scalar transcription
+    inputs = random_inputs(args.check, np_rng)
+    rngs = [[py_rng.getrandbits(256) for _ in range(args.check)] for _ in range(3)]
+    rolls = rolls_from_rng(*rngs, volatility=inputs["volatility"])
+    damage, event = calculate_damage(type_chart, inputs["base_power"], inputs["accuracy"], inputs["volatility"],
+                                     inputs["attack_type"], inputs["attack_stat"], inputs["defence_stat"],
+                                     inputs["defender_type1"], inputs["defender_type2"], *rolls,
+                                     crit_rate=inputs["crit_rate"])
+    for i in range(args.check):
+        expected = calculate_damage_reference(type_chart, *(int(inputs[k][i]) for k in (
+            "base_power", "accuracy", "volatility", "attack_type", "attack_stat", "defence_stat",
+            "defender_type1", "defender_type2")), rngs[0][i], rngs[1][i], rngs[2][i], int(inputs["crit_rate"][i]))
+        assert (int(damage[i]), int(event[i])) == expected, (i, expected, damage[i], event[i])
+    print(f"Checked {args.check} random cases against calculate_damage_reference: exact match")
+
+    # Throughput: real roster, every (move, defender) pair repeated up to the batch size
+    mons = load_mon_table(os.path.join(args.base_path, "drool", "mons.csv"))
+    moves = load_move_table(os.path.join(args.base_path, "drool", "moves.csv"), mons)
+    n = args.matchups
+    move_index = np_rng.integers(0, len(moves), n)
+    defender_index = np_rng.integers(0, len(mons), n)
+    accuracy_roll = np_rng.integers(0, 100, n)
+    volatility_roll = np_rng.integers(0, 100, n)
+    volatility_offset = np_rng.integers(0, 11, n)
+    crit_roll = np_rng.integers(0, 100, n)
+
+    best = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        score_matchups(mons, moves, type_chart, move_index, defender_index,
+                       accuracy_roll, volatility_roll, volatility_offset, crit_roll)
+        best = min(best, time.perf_counter() - start)
+    print(f"Scored {n} matchups in {best * 1000:.1f} ms ({n / best / 1e6:.1f}M matchups/s)")
+
+
+if __name__ == "__main__":
+    main()
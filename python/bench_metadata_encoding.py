@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Compare the literal and hex metadata encodings of the generated SetupMons script.
+
+Reports source size for each --metadata-encoding and, when forge is on PATH, the time forge
+takes to compile each variant. Run from the repository root:
+    python python/bench_metadata_encoding.py --forge
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import time
+
+from build_cache import BuildCache
+from mon_stats_to_sol import (DEFAULT_CACHE_PATH, METADATA_ENCODINGS, collect_all_contracts,
+                              generate_solidity_script, metadata_array_lines, mon_metadata_entries,
+                              read_abilities_csv, read_mons_csv, read_moves_csv)
+from solidity_index import SolidityIndex
+from sprite_pipeline import analyze_sprite_images
+
+
+def forge_compile_seconds(base_path: str, script_name: str, solidity_code: str) -> float:
+    """Time a forced forge build of one script written next to SetupMons.s.sol"""
+    path = os.path.join(base_path, "script", f"{script_name}.s.sol")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(solidity_code)
+    try:
+        start = time.perf_counter()
+        subprocess.run(["forge", "build", "--force", path], cwd=base_path, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return time.perf_counter() - start
+    finally:
+        os.remove(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark metadata encodings of the SetupMons script')
+    parser.add_argument('--forge', action='store_true', help='Also time forge builds of each variant')
+    args = parser.parse_args()
+
+    base_path = "."
+    cache = BuildCache(os.path.join(base_path, DEFAULT_CACHE_PATH))
+    mons = read_mons_csv(os.path.join(base_path, "drool", "mons.csv"))
+    read_moves_csv(os.path.join(base_path, "drool", "moves.csv"), mons)
+    read_abilities_csv(os.path.join(base_path, "drool", "abilities.csv"), mons)
+    sprite_data, palette_data, sprite_headers = analyze_sprite_images(base_path, cache)
+    for mon_name, mon in mons.items():
+        mon.sprite_data = sprite_data.get(mon_name.lower(), [])
+        mon.palette_data = palette_data.get(mon_name.lower(), [])
+        mon.sprite_header = sprite_headers.get(mon_name.lower())
+    index = SolidityIndex(base_path, cache)
+    contracts = collect_all_contracts(mons, base_path, index)
+    cache.save()
+
+    words = sum(len(mon_metadata_entries(mon)) for mon in mons.values())
+    print(f"{len(mons)} mons, {words} metadata words")
+
+    forge = args.forge and shutil.which("forge")
+    if args.forge and not forge:
+        print("forge not found on PATH; skipping compile timing")
+
+    for encoding in METADATA_ENCODINGS:
+        script_name = f"SetupMonsBench{encoding.capitalize()}"
+        solidity_code = generate_solidity_script(mons, contracts, base_path, True, index, script_name=script_name,
+                                                 metadata_encoding=encoding)
+        metadata_lines = [line for mon in mons.values()
+                          for line in metadata_array_lines(mon_metadata_entries(mon), encoding)]
+        metadata_bytes = sum(len(line) + 1 for line in metadata_lines)
+        statements = sum(1 for line in metadata_lines if line.rstrip().endswith(';'))
+        report = (f"{encoding:>8}: {len(solidity_code.encode('utf-8')):7,} bytes of Solidity, "
+                  f"{len(solidity_code.splitlines()):5,} lines; metadata {metadata_bytes:7,} bytes in "
+                  f"{len(metadata_lines):4} lines / {statements:4} statements")
+        if forge:
+            report += f", forge build {forge_compile_seconds(base_path, script_name, solidity_code):6.2f} s"
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark SetupMons generation on a synthetic roster, with and without the roster's reverse indexes.
+
+Run from the repository root:
+    python python/bench_roster_index.py --mons 5000
+"""
+
+import argparse
+import time
+from typing import Dict
+
+from mon_stats_to_sol import (ContractInfo, MonData, Roster, contract_name_from_move_or_ability,
+                              generate_solidity_script, get_mon_directory_name)
+
+
+def build_synthetic_roster(num_mons: int, moves_per_mon: int, abilities_per_mon: int) -> Roster:
+    """Build a roster of unique mons with unique moves/abilities and their (undeployed) contracts"""
+    mons = Roster()
+    for mon_id in range(num_mons):
+        name = f"Mon{mon_id}"
+        mons[name] = MonData(mon_id, name, 300, 5, 200, 150, 150, 150, 150, "Fire", "NA")
+        for i in range(moves_per_mon):
+            mons.add_move(name, f"Move {mon_id} {i}")
+        for i in range(abilities_per_mon):
+            mons.add_ability(name, f"Ability {mon_id} {i}")
+
+    for mon in mons.values():
+        mon_contracts = {}
+        for move_or_ability in mon.moves + mon.abilities:
+            contract_name = contract_name_from_move_or_ability(move_or_ability)
+            mon_contracts[contract_name] = ContractInfo(move_or_ability, f"src/mons/{contract_name}.sol", [])
+        mons.mon_contracts[mon.name] = mon_contracts
+        mons.contracts.update(mon_contracts)
+    return mons
+
+
+def resolve_owners_scan(mons: Roster, contracts: Dict[str, ContractInfo]) -> Dict[str, str]:
+    """Reference implementation: the nested mons/moves scan generate_solidity_script used to run"""
+    owners = {}
+    for contract in contracts.values():
+        for mon in mons.values():
+            if contract.name in mon.moves or contract.name in mon.abilities:
+                owners[contract.name] = get_mon_directory_name(mon.name)
+                break
+    return owners
+
+
+def resolve_owners_indexed(mons: Roster, contracts: Dict[str, ContractInfo]) -> Dict[str, str]:
+    """Owner resolution through the roster's move/ability -> mon indexes"""
+    owners = {}
+    for contract in contracts.values():
+        owner = mons.owner_of(contract.name)
+        if owner:
+            owners[contract.name] = get_mon_directory_name(owner.name)
+    return owners
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark roster reverse indexes on a synthetic roster')
+    parser.add_argument('--mons', type=int, default=5000, help='Number of synthetic mons')
+    parser.add_argument('--moves', type=int, default=4, help='Moves per mon')
+    parser.add_argument('--abilities', type=int, default=1, help='Abilities per mon')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    mons = build_synthetic_roster(args.mons, args.moves, args.abilities)
+    print(f"Built roster of {len(mons)} mons / {len(mons.contracts)} contracts in "
+          f"{(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    indexed = resolve_owners_indexed(mons, mons.contracts)
+    indexed_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = resolve_owners_scan(mons, mons.contracts)
+    scan_time = time.perf_counter() - start
+    assert indexed == scanned
+
+    print(f"Owner resolution, nested scan: {scan_time * 1000:10.1f} ms")
+    print(f"Owner resolution, indexed:     {indexed_time * 1000:10.1f} ms ({scan_time / indexed_time:.0f}x)")
+
+    start = time.perf_counter()
+    script = generate_solidity_script(mons, mons.contracts, ".")
+    print(f"Full generate_solidity_script: {(time.perf_counter() - start) * 1000:10.1f} ms "
+          f"({len(script) / 1e6:.1f} MB of Solidity)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Compare MonData objects with the columnar RosterStore on a synthetic roster.
+
+Builds the same random roster both ways and times the same queries on each (top mons by BST,
+a full speed ranking, a type filter and mean BST per primary type), checking the answers
+agree. --check-codegen also checks that SetupMons generated from the real CSVs through
+RosterStore.to_roster() is identical to the MonData path, moves.csv rows included.
+
+Run from the repository root:
+    python python/bench_roster_store.py --mons 100000 --check-codegen
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+import numpy as np
+
+from game_data import NUM_TYPES, TYPE_INDEX, TYPE_NONE
+from roster_store import BST_COLUMNS, NamePool, RosterStore, STAT_COLUMNS, csr, type_name
+
+
+def build_synthetic_store(num_mons: int, moves_per_mon: int, move_pool_size: int, seed: int) -> RosterStore:
+    rng = np.random.default_rng(seed)
+    columns = {column: rng.integers(100, 400, num_mons) for column in STAT_COLUMNS}
+    columns["mon_id"] = np.arange(num_mons)
+    columns["stamina"] = np.full(num_mons, 5)
+    type1 = rng.integers(0, NUM_TYPES, num_mons)
+    type2 = np.where(rng.random(num_mons) < 0.4, TYPE_NONE, rng.integers(0, NUM_TYPES, num_mons))
+
+    move_pool = NamePool()
+    for i in range(move_pool_size):
+        move_pool.intern(f"Move {i}")
+    move_offsets = np.arange(num_mons + 1, dtype=np.int64) * moves_per_mon
+    move_ids = rng.integers(0, move_pool_size, num_mons * moves_per_mon).astype(np.int32)
+    ability_pool = NamePool()
+    ability_offsets, ability_ids = csr([[f"Ability {i}"] for i in range(num_mons)], ability_pool)
+    return RosterStore([f"Mon{i}" for i in range(num_mons)], columns, type1, type2,
+                       move_offsets, move_ids, move_pool, ability_offsets, ability_ids, ability_pool)
+
+
+def build_objects(store: RosterStore) -> list:
+    """The same roster as MonData objects"""
+    from mon_stats_to_sol import MonData
+    mons = []
+    for view in store:
+        mon = MonData(view.mon_id, view.name, view.hp, view.stamina, view.speed, view.attack, view.defense,
+                      view.special_attack, view.special_defense, view.type1, view.type2)
+        mon.moves = view.moves
+        mon.abilities = view.abilities
+        mons.append(mon)
+    return mons
+
+
+def measure(build: Callable[[], object]) -> Tuple[object, float, int]:
+    """(result, seconds, peak bytes allocated while building)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def object_queries(mons: list, type_code: int) -> List[object]:
+    def bst(mon):
+        return sum(getattr(mon, column) for column in BST_COLUMNS)
+    top = [mon.name for mon in sorted(mons, key=lambda mon: -bst(mon))[:10]]
+    by_speed = [mon.name for mon in sorted(mons, key=lambda mon: -mon.speed)]
+    name = type_name(type_code)
+    typed = [mon.name for mon in mons if mon.type1 == name or mon.type2 == name]
+    totals = {}
+    for mon in mons:
+        total, count = totals.get(mon.type1, (0, 0))
+        totals[mon.type1] = (total + bst(mon), count + 1)
+    mean_bst = [totals[type_name(code)][0] / totals[type_name(code)][1] if type_name(code) in totals else 0.0
+                for code in range(NUM_TYPES)]
+    return [top, by_speed, typed, mean_bst]
+
+
+def store_queries(store: RosterStore, type_code: int) -> List[object]:
+    bst = store.bst()
+    top = [store.names[row] for row in store.ranked(bst)[:10]]
+    by_speed = [store.names[row] for row in store.ranked(store.columns["speed"])]
+    typed = [store.names[row] for row in np.flatnonzero(store.has_type(type_code))]
+    counts = np.bincount(store.type1, minlength=NUM_TYPES)
+    sums = np.bincount(store.type1, weights=bst, minlength=NUM_TYPES)
+    mean_bst = list(np.divide(sums, counts, out=np.zeros(NUM_TYPES), where=counts > 0)[:NUM_TYPES])
+    return [top, by_speed, typed, mean_bst]
+
+
+def check_codegen(base_path: str) -> None:
+    from mon_stats_to_sol import collect_all_contracts, generate_solidity_script, load_roster
+    from solidity_index import SolidityIndex
+    index = SolidityIndex(base_path)
+    scripts = []
+    rosters = (load_roster(base_path), RosterStore.from_csv(base_path).to_roster())
+    for mons in rosters:
+        contracts = collect_all_contracts(mons, base_path, index)
+        scripts.append(generate_solidity_script(mons, contracts, base_path, False, index))
+    if scripts[0] != scripts[1]:
+        raise AssertionError("SetupMons generated from RosterStore differs from the MonData path")
+    # --standard-attacks classifies moves from their moves.csv rows
+    if rosters[0].move_rows != rosters[1].move_rows:
+        raise AssertionError("RosterStore.to_roster() move_rows differ from the MonData path")
+    print(f"Codegen check: RosterStore.to_roster() generates the same SetupMons ({len(scripts[0]):,} bytes)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the columnar RosterStore against MonData objects')
+    parser.add_argument('--mons', type=int, default=100000, help='Number of synthetic mons')
+    parser.add_argument('--moves', type=int, default=4, help='Moves per mon')
+    parser.add_argument('--move-pool', type=int, default=2000, help='Distinct move names')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--check-codegen', action='store_true',
+                        help='Also check codegen through RosterStore on the real CSVs')
+    args = parser.parse_args()
+
+    store, store_time, store_peak = measure(lambda: build_synthetic_store(args.mons, args.moves, args.move_pool,
+                                                                          args.seed))
+    mons, object_time, object_peak = measure(lambda: build_objects(store))
+    print(f"{args.mons:,} mons, {args.moves} moves each")
+    print(f"  MonData objects: built in {object_time * 1000:8.1f} ms, {object_peak / 1e6:7.1f} MB allocated")
+    print(f"  RosterStore:     built in {store_time * 1000:8.1f} ms, {store_peak / 1e6:7.1f} MB allocated "
+          f"({store.nbytes() / 1e6:.1f} MB in columns)")
+
+    type_code = TYPE_INDEX["Fire"]
+    start = time.perf_counter()
+    expected = object_queries(mons, type_code)
+    object_query_time = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = store_queries(store, type_code)
+    store_query_time = time.perf_counter() - start
+    if actual[:3] != expected[:3] or not np.allclose(actual[3], expected[3]):
+        raise AssertionError("RosterStore queries disagree with the MonData queries")
+    print(f"Queries (top 10 by BST, speed ranking, {len(actual[2]):,} Fire mons, mean BST per type):")
+    print(f"  MonData objects: {object_query_time * 1000:8.1f} ms")
+    print(f"  RosterStore:     {store_query_time * 1000:8.1f} ms ({object_query_time / store_query_time:.0f}x)")
+
+    if args.check_codegen:
+        check_codegen(".")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Compare forge build times of the monolithic SetupMons script and the --sharded scripts.
+
+Edits one mon's stats in memory and reports which generated files change in each layout. With
+--forge (and forge on PATH) it also times a cold `forge build --force` of each layout and the
+incremental `forge build` after writing that one edit: the monolithic script recompiles as a
+whole, a shard edit should only recompile that shard's artifact. Files are written under
+script/ for the builds and restored or removed afterwards.
+
+Run from the repository root:
+    python python/bench_sharded_build.py --forge
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import time
+from typing import Dict, List
+
+from mon_stats_to_sol import collect_all_contracts, generate_solidity_script, load_roster, shard_files
+from solidity_index import SolidityIndex
+
+MONOLITHIC_NAME = "SetupMonsBench.s.sol"  # Written next to SetupMons.s.sol, not over it
+
+
+def forge_build_seconds(base_path: str, paths: List[str], force: bool) -> float:
+    start = time.perf_counter()
+    subprocess.run(["forge", "build", *(["--force"] if force else []), *paths], cwd=base_path, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def write_files(script_dir: str, files: Dict[str, str]) -> None:
+    for name, content in files.items():
+        with open(os.path.join(script_dir, name), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+
+def time_layout(base_path: str, before: Dict[str, str], after: Dict[str, str]) -> Dict[str, float]:
+    """Cold build of before, then the incremental build after writing the files that differ in after"""
+    script_dir = os.path.join(base_path, "script")
+    paths = [os.path.join("script", name) for name in before if name.endswith(".sol")]
+    write_files(script_dir, before)
+    cold = forge_build_seconds(base_path, paths, force=True)
+    write_files(script_dir, {name: content for name, content in after.items() if before.get(name) != content})
+    return {"cold": cold, "edited": forge_build_seconds(base_path, paths, force=False)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark forge builds of monolithic and sharded SetupMons')
+    parser.add_argument('--mon', help='Mon whose HP is edited (default: the first by id)')
+    parser.add_argument('--forge', action='store_true', help='Also time forge builds of each layout')
+    args = parser.parse_args()
+
+    base_path = "."
+    index = SolidityIndex(base_path)
+    mons = load_roster(base_path)
+    contracts = collect_all_contracts(mons, base_path, index)
+    mon = mons[args.mon] if args.mon else min(mons.values(), key=lambda m: m.mon_id)
+
+    def layouts() -> Dict[str, Dict[str, str]]:
+        return {"monolithic": {MONOLITHIC_NAME: generate_solidity_script(mons, contracts, base_path, False, index,
+                                                                          script_name="SetupMonsBench")},
+                "sharded": shard_files(mons, base_path, False, index)}
+
+    before = layouts()
+    mon.hp += 1
+    after = layouts()
+    mon.hp -= 1
+
+    print(f"Editing {mon.name}'s HP:")
+    for name, files in before.items():
+        changed = [file for file, content in files.items() if after[name][file] != content]
+        size = sum(len(content) for content in files.values())
+        print(f"  {name:<10} {len(files):>2} files, {size:>8,} bytes; rewritten: {', '.join(changed)} "
+              f"({sum(len(after[name][file]) for file in changed):,} bytes)")
+
+    forge = args.forge and shutil.which("forge")
+    if args.forge and not forge:
+        print("forge not found on PATH; skipping build timing")
+    if not forge:
+        return
+
+    script_dir = os.path.join(base_path, "script")
+    names = {name for files in before.values() for name in files}
+    saved = {}
+    for name in names:
+        path = os.path.join(script_dir, name)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                saved[name] = f.read()
+    try:
+        for name in before:
+            seconds = time_layout(base_path, before[name], after[name])
+            print(f"  {name:<10} forge build: cold {seconds['cold']:6.2f} s, "
+                  f"after editing {mon.name} {seconds['edited']:6.2f} s")
+    finally:
+        for name in names:
+            path = os.path.join(script_dir, name)
+            if name in saved:
+                write_files(script_dir, {name: saved[name]})
+            elif os.path.exists(path):
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark the vectorized sprite indexer against the original per-pixel loop.
+
+Run from the repository root:
+    python python/bench_sprite_index.py
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+
+from sprite_index import index_frame
+
+
+def index_frame_loop(frame_array: np.ndarray):
+    """Reference implementation: the per-pixel set/dict loop analyze_gif used to run"""
+    pixels = frame_array.reshape(-1, 4)
+    all_colors = set()
+    for pixel in pixels:
+        all_colors.add(tuple(pixel))
+
+    palette = sorted(list(all_colors))
+    color_to_index = {color: idx for idx, color in enumerate(palette)}
+
+    height, width = frame_array.shape[:2]
+    indexed_frame = np.zeros((height, width), dtype=np.uint8)
+    for y in range(height):
+        for x in range(width):
+            indexed_frame[y, x] = color_to_index[tuple(frame_array[y, x])]
+
+    return palette, indexed_frame
+
+
+def random_frame(size: int, num_colors: int, rng: np.random.Generator) -> np.ndarray:
+    """Generate a size x size RGBA frame drawing pixels from a random palette"""
+    palette = rng.integers(0, 256, size=(num_colors, 4), dtype=np.uint8)
+    palette[0] = (0, 0, 0, 0)
+    return palette[rng.integers(0, num_colors, size=(size, size))]
+
+
+def time_call(fn: Callable, frame: np.ndarray, repeats: int) -> float:
+    """Return the best wall time in seconds over the given number of repeats"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(frame)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark sprite palette indexing')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[32, 64, 128, 256, 512],
+                        help='Square frame sizes to benchmark')
+    parser.add_argument('--colors', type=int, default=16, help='Number of colors per frame')
+    parser.add_argument('--repeats', type=int, default=3, help='Repeats per measurement (best is kept)')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'size':>9}  {'loop (ms)':>10}  {'numpy (ms)':>10}  {'speedup':>8}")
+    for size in args.sizes:
+        frame = random_frame(size, args.colors, rng)
+
+        loop_palette, loop_indexed = index_frame_loop(frame)
+        np_palette, np_indexed = index_frame(frame)
+        assert [tuple(int(c) for c in color) for color in loop_palette] == np_palette
+        assert np.array_equal(loop_indexed, np_indexed)
+
+        loop_time = time_call(index_frame_loop, frame, args.repeats)
+        np_time = time_call(index_frame, frame, args.repeats)
+        print(f"{size:>4}x{size:<4}  {loop_time * 1000:>10.2f}  {np_time * 1000:>10.3f}  {loop_time / np_time:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
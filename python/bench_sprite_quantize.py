@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Time palette quantization on every GIF in drool/imgs and report its perceptual error.
+
+Run from the repository root:
+    python python/bench_sprite_quantize.py --colors 4 8 16
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+from PIL import Image
+
+from sprite_quantize import quantize_frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark sprite palette quantization')
+    parser.add_argument('--colors', type=int, nargs='+', default=[4, 8, 16], help='Target palette sizes')
+    parser.add_argument('--imgs-dir', default=os.path.join('drool', 'imgs'), help='Directory of GIFs')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions per sprite')
+    args = parser.parse_args()
+
+    frames = {}
+    for name in sorted(os.listdir(args.imgs_dir)):
+        if name.endswith('.gif'):
+            with Image.open(os.path.join(args.imgs_dir, name)) as img:
+                frames[name] = np.array(img.convert('RGBA'))
+    print(f"Loaded {len(frames)} GIFs")
+
+    for colors in args.colors:
+        times = []
+        mean_errors = []
+        max_errors = []
+        quantized = 0
+        for frame in frames.values():
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                _, report = quantize_frame(frame, colors)
+            times.append((time.perf_counter() - start) / args.repeat)
+            if report['colors_after'] < report['colors_before']:
+                quantized += 1
+                mean_errors.append(report['mean_delta_e'])
+                max_errors.append(report['max_delta_e'])
+
+        error = (f"mean ΔE {np.mean(mean_errors):5.2f}, worst pixel ΔE {np.max(max_errors):5.2f}"
+                 if quantized else "no sprite over budget")
+        print(f"{colors:3d} colors: {quantized:2d}/{len(frames)} quantized, "
+              f"{np.mean(times) * 1000:6.2f} ms/sprite (max {np.max(times) * 1000:6.2f} ms), {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Compare the matplotlib type chart (create_chart) with the raster and SVG renderers.
+
+Renders drool/types.csv with each renderer, then random charts with more types to show how
+each scales, and finally times write_chart's skip when types.csv hasn't changed. matplotlib
+is only run up to --max-matplotlib-types because each figure takes seconds.
+
+Run from the repository root:
+    python python/bench_type_chart.py --types 15 30 60
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import xml.dom.minidom
+from typing import Callable, Dict, List, Tuple
+import numpy as np
+
+from build_cache import BuildCache
+from type_chart_render import RENDERERS, CELL_TEXT, chart_matrix, write_chart
+from type_chart_to_sol import read_csv_for_graph
+
+EXTENSIONS = {"matplotlib": ".png", "raster": ".png", "svg": ".svg"}
+
+
+def synthetic_chart(num_types: int, seed: int) -> Tuple[Dict[str, Dict[str, float]], List[str]]:
+    """Random chart in read_csv_for_graph's format, with types.csv's rough mix of multipliers"""
+    rng = np.random.default_rng(seed)
+    types = [f"Type{i:02d}" for i in range(num_types)]
+    values = rng.choice([1.0, 2.0, 5.0, 0.0], size=(num_types, num_types), p=[0.7, 0.15, 0.13, 0.02])
+    return {attacker: {defender: float(values[i, j]) for j, defender in enumerate(types)}
+            for i, attacker in enumerate(types)}, types
+
+
+def time_renderer(render: Callable[..., None], data, types, output_path: str, runs: int) -> float:
+    """Median seconds of runs renders"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        render(data, types, output_path)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def check_svg(svg_path: str, data, types) -> None:
+    """The SVG must parse and place one glyph per non-neutral cell"""
+    glyphs = len(xml.dom.minidom.parse(svg_path).getElementsByTagName("use"))
+    expected = sum(float(value) in CELL_TEXT for value in chart_matrix(data, types).flat)
+    if glyphs != expected:
+        raise AssertionError(f"SVG has {glyphs} cell glyphs, expected {expected}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark type chart renderers')
+    parser.add_argument('--types-csv', default=os.path.join('drool', 'types.csv'), help='Type chart CSV')
+    parser.add_argument('--types', type=int, nargs='*', default=[30, 60],
+                        help='Type counts of the synthetic charts (default: 30 60)')
+    parser.add_argument('--max-matplotlib-types', type=int, default=30,
+                        help='Largest synthetic chart rendered with matplotlib (default: 30)')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per raster/svg timing (matplotlib runs once)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    charts = [(os.path.basename(args.types_csv), *read_csv_for_graph(args.types_csv))]
+    charts += [(f"{n} random types", *synthetic_chart(n, args.seed)) for n in args.types]
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        print(f"{'chart':<18} {'types':>5} " + " ".join(f"{name + ' ms':>14} {name + ' bytes':>17}"
+                                                     for name in RENDERERS))
+        for label, data, types in charts:
+            row = f"{label:<18} {len(types):>5}"
+            for name, render in RENDERERS.items():
+                output_path = os.path.join(out_dir, f"chart{EXTENSIONS[name]}")
+                if name == "matplotlib" and label != charts[0][0] and len(types) > args.max_matplotlib_types:
+                    row += f" {'-':>14} {'-':>17}"
+                    continue
+                seconds = time_renderer(render, data, types, output_path, 1 if name == "matplotlib" else args.runs)
+                if name == "svg":
+                    check_svg(output_path, data, types)
+                row += f" {seconds * 1000:>14.1f} {os.path.getsize(output_path):>17,}"
+            print(row)
+
+        # write_chart: the first call renders, later calls with the same types.csv only hash files
+        cache = BuildCache(None)
+        output_path = os.path.join(out_dir, "types.png")
+        print("\nwrite_chart with the raster renderer:")
+        for attempt in ("first run", "unchanged"):
+            start = time.perf_counter()
+            rendered = write_chart(args.types_csv, output_path, "raster", cache=cache)
+            print(f"  {attempt:<10} {(time.perf_counter() - start) * 1000:8.2f} ms "
+                  f"({'rendered' if rendered else 'skipped'})")
+
+
+if __name__ == "__main__":
+    main()
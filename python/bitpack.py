@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+from typing import List, Sequence, Union
+import numpy as np
+
+WORD_BITS = 256
+WORD_BYTES = WORD_BITS // 8
+
+
+def pack_int(values: Union[Sequence[int], np.ndarray], bits_per_value: int) -> int:
+    """Pack values into a single integer, LSB first.
+
+    Value i occupies bits [i * bits_per_value, (i + 1) * bits_per_value), which is the
+    layout produced by repeatedly prepending fixed-width binary strings.
+    Runs in linear time using np.packbits instead of string concatenation.
+    """
+    if not 1 <= bits_per_value <= 64:
+        raise ValueError(f"bits_per_value must be between 1 and 64, got {bits_per_value}")
+    values = np.asarray(values, dtype=np.uint64).ravel()
+    if values.size == 0:
+        return 0
+    if int(values.max()) >> bits_per_value:
+        raise ValueError(f"Value {int(values.max())} does not fit in {bits_per_value} bits")
+
+    # (N, bits_per_value) matrix of little-endian bits, flattened into one bitstream
+    shifts = np.arange(bits_per_value, dtype=np.uint64)
+    bits = ((values[:, None] >> shifts) & np.uint64(1)).astype(np.uint8).ravel()
+    return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+
+def split_words(value: int, bit_length: int) -> List[int]:
+    """Split a bit_length-bit integer into uint256 words, most significant bits first.
+
+    The final word is left-aligned (zero padded in its low bits) when bit_length is not a
+    multiple of 256, matching how the generator has always chunked its bit strings.
+    """
+    num_words = -(-bit_length // WORD_BITS)
+    padded = value << (num_words * WORD_BITS - bit_length)
+    raw = padded.to_bytes(num_words * WORD_BYTES, 'big')
+    return [int.from_bytes(raw[i:i + WORD_BYTES], 'big') for i in range(0, len(raw), WORD_BYTES)]
+
+
+def pack_words(values: Union[Sequence[int], np.ndarray], bits_per_value: int) -> List[int]:
+    """Pack values into uint256 words using the sprite/palette layout.
+
+    Values are packed LSB first into one bitstream (see pack_int) which is then split into
+    256-bit words from the most significant end (see split_words).
+    """
+    values = np.asarray(values).ravel()
+    return split_words(pack_int(values, bits_per_value), values.size * bits_per_value)
+
+
+def pack_chunks(values: Union[Sequence[int], np.ndarray], bits_per_value: int, values_per_word: int) -> List[int]:
+    """Pack values values_per_word at a time, each chunk LSB first and left-aligned in its own word.
+
+    This is the palette layout: no value is split across a word boundary.
+    """
+    values = np.asarray(values).ravel()
+    return [pack_words(values[i:i + values_per_word], bits_per_value)[0]
+            for i in range(0, values.size, values_per_word)]
+
+
+def unpack_int(value: int, bits_per_value: int, count: int) -> np.ndarray:
+    """Inverse of pack_int: read count values of bits_per_value bits, LSB first"""
+    if not 1 <= bits_per_value <= 64:
+        raise ValueError(f"bits_per_value must be between 1 and 64, got {bits_per_value}")
+    num_bits = count * bits_per_value
+    raw = np.frombuffer(value.to_bytes(-(-num_bits // 8) or 1, 'little'), dtype=np.uint8)
+    bits = np.unpackbits(raw, bitorder='little')[:num_bits].reshape(count, bits_per_value).astype(np.uint64)
+    return (bits << np.arange(bits_per_value, dtype=np.uint64)).sum(axis=1, dtype=np.uint64)
+
+
+def join_words(words: Sequence[int], bit_length: int) -> int:
+    """Inverse of split_words: reassemble the bit_length-bit integer from its uint256 words"""
+    raw = b"".join(int(w).to_bytes(WORD_BYTES, 'big') for w in words)
+    return int.from_bytes(raw, 'big') >> (len(words) * WORD_BITS - bit_length)
+
+
+def unpack_words(words: Sequence[int], bits_per_value: int, count: int) -> np.ndarray:
+    """Inverse of pack_words: read count values of bits_per_value bits back out of uint256 words"""
+    return unpack_int(join_words(words, count * bits_per_value), bits_per_value, count)
+
+
+def unpack_chunks(words: Sequence[int], bits_per_value: int, values_per_word: int, count: int) -> np.ndarray:
+    """Inverse of pack_chunks: read count values back out of words of values_per_word values each"""
+    chunks = [unpack_words([word], bits_per_value, min(values_per_word, count - i * values_per_word))
+              for i, word in enumerate(words) if i * values_per_word < count]
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint64)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Optional
+
+CACHE_VERSION = 3
+
+
+def content_hash(*parts: bytes) -> str:
+    """Return a sha256 hex digest over the given byte strings (length-prefixed so parts can't collide)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(len(part).to_bytes(8, 'big'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def file_hash(path: str, *extra: bytes) -> str:
+    """Return the content hash of a file's bytes plus any extra key material"""
+    with open(path, 'rb') as f:
+        return content_hash(f.read(), *extra)
+
+
+class BuildCache:
+    """Content-addressed on-disk cache of codegen stage results.
+
+    Results are stored per stage (e.g. "sprites", "contracts") as JSON, keyed by a hash of
+    the stage's inputs. Entries of a stage that was used during a run but not looked up are
+    dropped on save, so the cache file doesn't grow with stale inputs.
+    """
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.used: Dict[str, set] = {}
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self.stages = data.get("stages", {})
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable build cache {self.path}: {e}")
+
+    def get_or_compute(self, stage: str, key: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for (stage, key), computing and storing it on a miss.
+
+        A compute result of None is returned as-is and not cached.
+        """
+        entries = self.stages.setdefault(stage, {})
+        self.used.setdefault(stage, set()).add(key)
+        if key in entries:
+            self.hits[stage] = self.hits.get(stage, 0) + 1
+            return entries[key]
+
+        self.misses[stage] = self.misses.get(stage, 0) + 1
+        result = compute()
+        if result is not None:
+            entries[key] = result
+        return result
+
+    def save(self) -> None:
+        """Write the cache back to disk, pruning stale entries of stages used this run"""
+        if not self.path:
+            return
+        stages = {}
+        for stage, entries in self.stages.items():
+            if stage in self.used:
+                entries = {k: v for k, v in entries.items() if k in self.used[stage]}
+            stages[stage] = entries
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": CACHE_VERSION, "stages": stages}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    def summary(self) -> str:
+        """Return a one-line hit/miss report per stage"""
+        stages = sorted(set(self.hits) | set(self.misses))
+        if not stages:
+            return "no lookups"
+        return ", ".join(f"{stage}: {self.hits.get(stage, 0)} hits / {self.misses.get(stage, 0)} misses"
+                         for stage in stages)
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that text.
+
+    Leaving an identical file untouched keeps its mtime, so forge doesn't recompile it.
+    Returns True if the file was written.
+    """
+    encoded = content.encode('utf-8')
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == encoded:
+                return False
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(encoded)
+    return True
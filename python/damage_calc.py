@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+from typing import Sequence, Tuple, Union
+import numpy as np
+
+from game_data import (CRIT_DENOM, CRIT_NUM, DEFAULT_CRIT_RATE, DEFAULT_VOL, MOVE_CLASS_INDEX, TYPE_NONE,
+                       MonTable, MoveTable)
+
+# Mirrors src/Enums.sol::EngineEventType
+EVENT_MOVE_MISS = 0
+EVENT_MOVE_CRIT = 1
+EVENT_NONE = 2
+
+# Mirrors AttackCalculator.RNG_SCALING_DENOM
+RNG_SCALING_DENOM = 100
+
+UINT32_MAX = 2**32 - 1
+
+# Base power numerator/denominator for each TypeCalculator code: immune, neutral, double, half
+TYPE_CODE_NUM = np.array([0, 1, 2, 1], dtype=np.int64)
+TYPE_CODE_DENOM = np.array([1, 1, 1, 2], dtype=np.int64)
+
+ArrayLike = Union[int, Sequence[int], np.ndarray]
+
+
+def scale_by_type(type_chart: np.ndarray, attack_type: ArrayLike, defender_type: ArrayLike,
+                  base_power: ArrayLike) -> np.ndarray:
+    """Vectorized TypeCalculator.getTypeEffectiveness(attackType, defenderType, basePower)"""
+    code = type_chart[attack_type, defender_type]
+    return np.asarray(base_power, dtype=np.int64) * TYPE_CODE_NUM[code] // TYPE_CODE_DENOM[code]
+
+
+def rolls_from_rng(rng: Sequence[int], rng2: Sequence[int], rng3: Sequence[int],
+                   volatility: ArrayLike = DEFAULT_VOL) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Reduce uint256 rng values to the residues calculateDamageView branches on.
+
+    rng2 and rng3 are keccak256(abi.encode(rng)) and keccak256(abi.encode(rng2)).
+
+    Returns:
+        tuple: (accuracy_roll, volatility_roll, volatility_offset, crit_roll), i.e.
+               rng % 100, rng2 % 100, rng2 % (volatility + 1) and rng3 % 100
+    """
+    moduli = np.broadcast_to(np.asarray(volatility, dtype=np.int64) + 1, (len(rng2),)).tolist()
+    return (
+        np.array([int(r) % 100 for r in rng], dtype=np.int64),
+        np.array([int(r) % 100 for r in rng2], dtype=np.int64),
+        np.array([int(r) % m for r, m in zip(rng2, moduli)], dtype=np.int64),
+        np.array([int(r) % 100 for r in rng3], dtype=np.int64)
+    )
+
+
+def calculate_damage(type_chart: np.ndarray, base_power: ArrayLike, accuracy: ArrayLike, volatility: ArrayLike,
+                     attack_type: ArrayLike, attack_stat: ArrayLike, defence_stat: ArrayLike,
+                     defender_type1: ArrayLike, defender_type2: ArrayLike,
+                     accuracy_roll: ArrayLike, volatility_roll: ArrayLike, volatility_offset: ArrayLike,
+                     crit_roll: ArrayLike, crit_rate: ArrayLike = DEFAULT_CRIT_RATE) -> Tuple[np.ndarray, np.ndarray]:
+    """Batched AttackCalculator.calculateDamageView.
+
+    All arguments broadcast against each other. Stats are the effective values (base value plus
+    state delta); they are wrapped to uint32 and clamped to at least 1 as on-chain. Rolls are the
+    residues returned by rolls_from_rng.
+
+    Returns:
+        tuple: (damage, event) where damage is int32 and event is an EngineEventType value
+
+    Raises:
+        OverflowError: if a hit would overflow uint32 arithmetic (the on-chain call reverts)
+    """
+    base_power, accuracy, volatility, attack_type, attack_stat, defence_stat, defender_type1, defender_type2, \
+        accuracy_roll, volatility_roll, volatility_offset, crit_roll, crit_rate = np.broadcast_arrays(
+            *[np.asarray(a, dtype=np.int64) for a in (
+                base_power, accuracy, volatility, attack_type, attack_stat, defence_stat, defender_type1,
+                defender_type2, accuracy_roll, volatility_roll, volatility_offset, crit_roll, crit_rate)])
+
+    hit = accuracy_roll < accuracy
+
+    # Prevent weird stat bugs from messing up the math
+    attack_stat = attack_stat & UINT32_MAX
+    defence_stat = defence_stat & UINT32_MAX
+    attack_stat = np.where(attack_stat == 0, 1, attack_stat)
+    defence_stat = np.where(defence_stat == 0, 1, defence_stat)
+
+    # Type.None entries of the chart are neutral, so a missing second type leaves power unchanged
+    scaled_base_power = scale_by_type(type_chart, attack_type, defender_type1, base_power)
+    scaled_base_power = scale_by_type(type_chart, attack_type, defender_type2, scaled_base_power)
+
+    rng_scaling = np.where(volatility_roll > 50, 100 + volatility_offset, 100 - volatility_offset)
+    rng_scaling = np.where(volatility > 0, rng_scaling, 100)
+
+    crit = crit_roll <= crit_rate
+    crit_num = np.where(crit, CRIT_NUM, 1)
+    crit_denom = np.where(crit, CRIT_DENOM, 1)
+
+    numerator = crit_num * (scaled_base_power * attack_stat * rng_scaling)
+    denominator = defence_stat * RNG_SCALING_DENOM * crit_denom
+    if np.any(hit & ((numerator > UINT32_MAX) | (denominator > UINT32_MAX) | (rng_scaling < 0))):
+        raise OverflowError("Damage calculation overflows uint32 (calculateDamageView would revert)")
+
+    damage = np.where(hit, numerator // denominator, 0).astype(np.uint32).view(np.int32)
+    event = np.where(hit, np.where(crit, EVENT_MOVE_CRIT, EVENT_NONE), EVENT_MOVE_MISS).astype(np.uint8)
+    return damage, event
+
+
+def calculate_damage_reference(type_chart: np.ndarray, base_power: int, accuracy: int, volatility: int,
+                               attack_type: int, attack_stat: int, defence_stat: int,
+                               defender_type1: int, defender_type2: int, rng: int, rng2: int, rng3: int,
+                               crit_rate: int = DEFAULT_CRIT_RATE) -> Tuple[int, int]:
+    """Line-by-line scalar transcription of calculateDamageView, used to check calculate_damage"""
+    if rng % 100 >= accuracy:
+        return 0, EVENT_MOVE_MISS
+
+    attack_stat &= UINT32_MAX
+    defence_stat &= UINT32_MAX
+    if attack_stat <= 0:
+        attack_stat = 1
+    if defence_stat <= 0:
+        defence_stat = 1
+
+    scaled_base_power = int(scale_by_type(type_chart, attack_type, defender_type1, base_power))
+    if defender_type2 != TYPE_NONE:
+        scaled_base_power = int(scale_by_type(type_chart, attack_type, defender_type2, scaled_base_power))
+
+    rng_scaling = 100
+    if volatility > 0:
+        if rng2 % 100 > 50:
+            rng_scaling = 100 + rng2 % (volatility + 1)
+        else:
+            rng_scaling = 100 - rng2 % (volatility + 1)
+
+    crit_num = 1
+    crit_denom = 1
+    event = EVENT_NONE
+    if rng3 % 100 <= crit_rate:
+        crit_num = CRIT_NUM
+        crit_denom = CRIT_DENOM
+        event = EVENT_MOVE_CRIT
+
+    damage = crit_num * (scaled_base_power * attack_stat * rng_scaling) // (defence_stat * RNG_SCALING_DENOM * crit_denom)
+    return int(np.uint32(damage).view(np.int32)), event
+
+
+def is_damaging(moves: MoveTable) -> np.ndarray:
+    """Mask of moves that go through the attack calculator (Physical/Special with nonzero power)"""
+    return (moves.power > 0) & ((moves.move_class == MOVE_CLASS_INDEX["Physical"]) |
+                                (moves.move_class == MOVE_CLASS_INDEX["Special"]))
+
+
+def score_matchups(mons: MonTable, moves: MoveTable, type_chart: np.ndarray, move_index: ArrayLike,
+                   defender_index: ArrayLike, accuracy_roll: ArrayLike, volatility_roll: ArrayLike,
+                   volatility_offset: ArrayLike, crit_roll: ArrayLike, volatility: ArrayLike = DEFAULT_VOL,
+                   crit_rate: ArrayLike = DEFAULT_CRIT_RATE) -> Tuple[np.ndarray, np.ndarray]:
+    """Damage of moves[move_index] (used by the mon that owns it) against mons[defender_index].
+
+    Uses base stats (no state deltas). Non-damaging moves score 0 with EVENT_NONE.
+    """
+    move_index = np.asarray(move_index)
+    defender_index = np.asarray(defender_index)
+    attacker_index = moves.mon[move_index]
+    physical = moves.move_class[move_index] == MOVE_CLASS_INDEX["Physical"]
+
+    attack_stat = np.where(physical, mons.attack[attacker_index], mons.special_attack[attacker_index])
+    defence_stat = np.where(physical, mons.defense[defender_index], mons.special_defense[defender_index])
+
+    damage, event = calculate_damage(
+        type_chart, moves.power[move_index], moves.accuracy[move_index], volatility, moves.move_type[move_index],
+        attack_stat, defence_stat, mons.type1[defender_index], mons.type2[defender_index],
+        accuracy_roll, volatility_roll, volatility_offset, crit_roll, crit_rate)
+
+    damaging = is_damaging(moves)[move_index]
+    return np.where(damaging, damage, 0).astype(np.int32), np.where(damaging, event, EVENT_NONE).astype(np.uint8)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Dependency graph of the contracts SetupMons deploys.
+
+Every move/ability contract is a node; each constructor parameter is resolved to the concrete
+contract it expects, which becomes a node too (StatBoosts, status effects, weather, or another
+mon's ability). Parameters typed as an interface are resolved by the repo's naming convention:
+the upper-cased parameter name in CamelCase (STORM -> Storm), the same with a Status suffix
+(FROSTBITE -> FrostbiteStatus), then the interface name without its leading I
+(ITypeCalculator -> TypeCalculator).
+
+Contracts named in external_contracts (the engine and type calculator by default, which every
+battle must share) and parameters that resolve to nothing deployable stay vm.envAddress
+lookups. Everything else is deployed exactly once, in topological order.
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from solidity_index import SolidityIndex
+
+DEFAULT_EXTERNAL_CONTRACTS = ("Engine", "TypeCalculator")
+
+INTERFACE_NAME_PATTERN = re.compile(r"^I[A-Z]")
+
+
+class DeployNode:
+    """A contract to deploy and what each of its constructor arguments resolves to"""
+    def __init__(self, name: str, path: str, label: str, owner: Optional[str] = None):
+        self.name = name  # Solidity contract name
+        self.path = path
+        self.label = label  # Name recorded in DeployData
+        self.owner = owner  # Mon whose move/ability this is, None for shared dependencies
+        self.args: List[Tuple[dict, Optional[str]]] = []  # (dependency, node name or None for an env lookup)
+        self.import_paths: List[str] = []
+
+    @property
+    def requires(self) -> List[str]:
+        """Names of the nodes this contract's constructor needs, in argument order"""
+        return list(dict.fromkeys(target for _, target in self.args if target is not None))
+
+    @property
+    def variable_name(self) -> str:
+        """State variable holding this contract once deployed as a shared dependency"""
+        return f"shared{self.name}"
+
+
+class DeployGraph:
+    def __init__(self):
+        self.nodes: Dict[str, DeployNode] = {}
+        self.external: Dict[str, str] = {}  # env name -> external contract it resolved to
+        self.unresolved: Dict[str, str] = {}  # env name -> parameter type nothing deployable matched
+
+    def dependents(self) -> Dict[str, List[str]]:
+        """Node name -> names of the nodes whose constructors take it"""
+        dependents = {name: [] for name in self.nodes}
+        for node in self.nodes.values():
+            for target in node.requires:
+                dependents[target].append(node.name)
+        return dependents
+
+    def shared(self) -> List[str]:
+        """Nodes deployed once up front: dependencies of another node or of no mon"""
+        dependents = self.dependents()
+        return [name for name in self.topological_order()
+                if self.nodes[name].owner is None or dependents[name]]
+
+    def levels(self) -> List[List[str]]:
+        """Group nodes into levels whose members only depend on earlier levels.
+
+        Deploys within a level are independent of each other and can be sent together.
+        Raises ValueError on a dependency cycle.
+        """
+        remaining = {name: set(node.requires) for name, node in self.nodes.items()}
+        levels = []
+        while remaining:
+            ready = sorted(name for name, requires in remaining.items() if not requires)
+            if not ready:
+                raise ValueError(f"Constructor dependency cycle among: {', '.join(sorted(remaining))}")
+            for name in ready:
+                del remaining[name]
+            for requires in remaining.values():
+                requires.difference_update(ready)
+            levels.append(ready)
+        return levels
+
+    def topological_order(self) -> List[str]:
+        return [name for level in self.levels() for name in level]
+
+
+def dependency_candidates(dependency: dict) -> List[str]:
+    """Concrete contract names a constructor dependency may refer to, most specific first"""
+    camel = "".join(part.capitalize() for part in dependency["name"].split("_") if part)
+    candidates = [dependency["type"], camel, camel + "Status"]
+    if INTERFACE_NAME_PATTERN.match(dependency["type"]):
+        candidates.append(dependency["type"][1:])
+    return candidates
+
+
+def resolve_dependency(dependency: dict, index: SolidityIndex) -> Optional[str]:
+    """Return the deployable contract a constructor dependency resolves to, or None"""
+    for candidate in dependency_candidates(dependency):
+        if index.is_deployable(candidate):
+            return candidate
+    return None
+
+
+def build_deploy_graph(contracts: Dict[str, Tuple[str, str, str]], index: SolidityIndex,
+                       external_contracts: Sequence[str] = DEFAULT_EXTERNAL_CONTRACTS) -> DeployGraph:
+    """Build the deploy graph of the mons' move/ability contracts and everything they need.
+
+    Args:
+        contracts: contract name -> (file path, DeployData label, owning mon name)
+        index: Solidity index used to read constructors and find dependency sources
+        external_contracts: contracts that are never deployed here, only read from env
+    """
+    graph = DeployGraph()
+    pending = []
+    for contract_name, (path, label, owner) in contracts.items():
+        graph.nodes[contract_name] = DeployNode(contract_name, path, label, owner)
+        pending.append(contract_name)
+
+    while pending:
+        node = graph.nodes[pending.pop(0)]
+        dependencies, node.import_paths = index.dependencies(node.path)
+        for dependency in dependencies:
+            target = resolve_dependency(dependency, index)
+            if target is None:
+                graph.unresolved[dependency["name"]] = dependency["type"]
+            elif target in external_contracts:
+                graph.external[dependency["name"]] = target
+                target = None
+            elif target not in graph.nodes:
+                graph.nodes[target] = DeployNode(target, index.find_contract(target), target)
+                pending.append(target)
+            node.args.append((dependency, target))
+    return graph
+
+
+def graph_manifest(graph: DeployGraph, base_path: str = ".") -> dict:
+    """Levels, shared dependencies and remaining env lookups of a deploy graph"""
+    dependents = graph.dependents()
+    return {
+        "levels": graph.levels(),
+        "shared": [{
+            "contract": name,
+            "path": os.path.relpath(graph.nodes[name].path, base_path).replace("\\", "/"),
+            "dependents": dependents[name],
+        } for name in graph.shared()],
+        "external": graph.external,
+        "unresolved": graph.unresolved,
+    }
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Gas estimates for the SetupMons deployment and packing mons into gas-bounded batches.
+
+Estimates are deliberately simple upper-bound style models of what a broadcast costs, not a
+replacement for a forge dry run:
+
+- each move/ability contract: a contract-creation transaction (base + CREATE + initcode
+  calldata + code deposit), using the runtime size from forge artifacts when they exist
+- createMon: a transaction whose calldata carries the stats, move/ability addresses and
+  metadata words, plus one fresh SSTORE per storage slot it fills
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+
+# Gas schedule
+TX_BASE_GAS = 21000
+CREATE_GAS = 32000
+CODE_DEPOSIT_GAS_PER_BYTE = 200
+CALLDATA_GAS_PER_BYTE = 16  # Nonzero byte; zero bytes are cheaper, so this over-estimates
+INITCODE_GAS_PER_WORD = 2
+SSTORE_NEW_GAS = 22100  # Zero to nonzero write of a cold slot
+
+# Runtime bytecode size assumed for contracts without a forge artifact
+DEFAULT_RUNTIME_BYTES = 6000
+# Constructor and metadata bytes in initcode on top of the runtime code
+INITCODE_OVERHEAD_BYTES = 200
+
+# Storage slots createMon fills besides metadata: monIds entry and length, packed MonStats
+CREATE_MON_BASE_SLOTS = 3
+# EnumerableSetLib writes about two slots per added address once a set outgrows its inline slots
+SLOTS_PER_SET_ENTRY = 2
+
+# StandardAttackFactory.createAttack on top of the CREATE itself: cold factory account, cold
+# SLOADs of ENGINE and TYPE_CALCULATOR, and the StandardAttackCreated log
+FACTORY_CALL_OVERHEAD_GAS = 2600 + 2 * 2100 + 375 * 2 + 8 * 32
+# ABI-encoded ATTACK_PARAMS: offset, 11 head words, NAME length and one word of NAME
+ATTACK_PARAMS_WORDS = 14
+
+DEFAULT_GAS_BUDGET = 15_000_000
+
+
+def runtime_bytes(contract_name: str, artifacts_dir: Optional[str]) -> int:
+    """Runtime bytecode size from out/<Name>.sol/<Name>.json, or DEFAULT_RUNTIME_BYTES"""
+    if artifacts_dir:
+        artifact_path = os.path.join(artifacts_dir, f"{contract_name}.sol", f"{contract_name}.json")
+        try:
+            with open(artifact_path, 'r', encoding='utf-8') as f:
+                code = json.load(f)["deployedBytecode"]["object"]
+            return len(code.removeprefix("0x")) // 2
+        except (OSError, ValueError, KeyError):
+            pass
+    return DEFAULT_RUNTIME_BYTES
+
+
+def estimate_deploy_gas(code_bytes: int, num_constructor_args: int = 0) -> int:
+    """Gas of a contract-creation transaction for a contract with code_bytes of runtime code"""
+    initcode_bytes = code_bytes + INITCODE_OVERHEAD_BYTES + 32 * num_constructor_args
+    return (TX_BASE_GAS + CREATE_GAS + initcode_bytes * CALLDATA_GAS_PER_BYTE +
+            -(-initcode_bytes // 32) * INITCODE_GAS_PER_WORD + code_bytes * CODE_DEPOSIT_GAS_PER_BYTE)
+
+
+def estimate_factory_create_gas(code_bytes: int, num_param_words: int = ATTACK_PARAMS_WORDS) -> int:
+    """Gas of a factory call that creates a contract with code_bytes of runtime code.
+
+    The initcode lives in the factory, so unlike estimate_deploy_gas only the call's
+    arguments are paid for as calldata.
+    """
+    initcode_bytes = code_bytes + INITCODE_OVERHEAD_BYTES
+    return (TX_BASE_GAS + (4 + 32 * num_param_words) * CALLDATA_GAS_PER_BYTE + FACTORY_CALL_OVERHEAD_GAS +
+            CREATE_GAS + -(-initcode_bytes // 32) * INITCODE_GAS_PER_WORD + code_bytes * CODE_DEPOSIT_GAS_PER_BYTE)
+
+
+def estimate_create_mon_gas(num_moves: int, num_abilities: int, num_metadata_words: int) -> int:
+    """Gas of a registry.createMon transaction"""
+    # Selector, id, 9 stat words, 4 array offsets/lengths pairs, addresses, keys and values
+    calldata_words = 1 + 1 + 9 + 8 + num_moves + num_abilities + 2 * num_metadata_words
+    slots = CREATE_MON_BASE_SLOTS + SLOTS_PER_SET_ENTRY * (num_moves + num_abilities) + num_metadata_words
+    return TX_BASE_GAS + calldata_words * 32 * CALLDATA_GAS_PER_BYTE + slots * SSTORE_NEW_GAS
+
+
+class MonGasEstimate:
+    """Estimated gas of deploying one mon: its contracts plus its createMon call"""
+    def __init__(self, mon_id: int, name: str, contract_gas: Dict[str, int], create_mon_gas: int,
+                 metadata_words: int):
+        self.mon_id = mon_id
+        self.name = name
+        self.contract_gas = contract_gas  # contract name -> deploy gas
+        self.create_mon_gas = create_mon_gas
+        self.metadata_words = metadata_words
+
+    @property
+    def total(self) -> int:
+        return sum(self.contract_gas.values()) + self.create_mon_gas
+
+
+class Batch:
+    """A run of consecutive mons deployed by one script"""
+    def __init__(self, index: int):
+        self.index = index
+        self.mons: List[MonGasEstimate] = []
+
+    @property
+    def gas(self) -> int:
+        return sum(mon.total for mon in self.mons)
+
+    @property
+    def mon_ids(self) -> List[int]:
+        return [mon.mon_id for mon in self.mons]
+
+
+def plan_batches(estimates: Sequence[MonGasEstimate], gas_budget: int = DEFAULT_GAS_BUDGET) -> List[Batch]:
+    """Pack mons, in order, into consecutive batches whose estimated gas stays under gas_budget.
+
+    Order is kept so batch k always covers a contiguous range of the roster and a rerun
+    regenerates the same split. A mon over the budget on its own gets a batch to itself.
+    """
+    batches: List[Batch] = []
+    for estimate in estimates:
+        if not batches or (batches[-1].mons and batches[-1].gas + estimate.total > gas_budget):
+            batches.append(Batch(len(batches)))
+        batches[-1].mons.append(estimate)
+    return batches
+
+
+def batch_manifest(batches: Sequence[Batch], script_paths: Sequence[str], gas_budget: int) -> dict:
+    """Manifest of which script deploys which mon IDs"""
+    return {
+        "gas_budget": gas_budget,
+        "batches": [{
+            "script": path,
+            "mon_ids": batch.mon_ids,
+            "mons": [mon.name for mon in batch.mons],
+            "estimated_gas": batch.gas,
+        } for batch, path in zip(batches, script_paths)]
+    }
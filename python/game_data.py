@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+import csv
+from typing import TYPE_CHECKING, Dict, List
+
+# NumPy is imported inside the loaders: the constants here are also read by the SetupMons
+# generator, which shouldn't pay for importing NumPy
+if TYPE_CHECKING:
+    import numpy as np
+
+# Mirrors src/Enums.sol::Type
+TYPE_NAMES = ["Yin", "Yang", "Earth", "Water", "Fire", "Metal", "Ice", "Nature",
+              "Lightning", "Mythic", "Air", "Mind", "Cyber", "Wild", "Cosmic", "None"]
+TYPE_NONE = TYPE_NAMES.index("None")
+NUM_TYPES = TYPE_NONE  # Number of real (non-None) types
+TYPE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(TYPE_NAMES)}
+
+# Mirrors src/Enums.sol::MoveClass
+MOVE_CLASSES = ["Physical", "Special", "Self", "Other"]
+MOVE_CLASS_INDEX: Dict[str, int] = {name: i for i, name in enumerate(MOVE_CLASSES)}
+
+# Mirrors src/Constants.sol
+DEFAULT_PRIORITY = 3
+DEFAULT_STAMINA = 5
+CRIT_NUM = 3
+CRIT_DENOM = 2
+DEFAULT_CRIT_RATE = 5
+DEFAULT_VOL = 10
+DEFAULT_ACCURACY = 100
+
+# Type chart multipliers as written in types.csv -> 2-bit code used by TypeCalculator.sol
+MULTIPLIER_CODES = {0: 0, 1: 1, 2: 2, 5: 3}
+
+
+def type_code(type_str: str) -> int:
+    """Convert a CSV type string to its src/Enums.sol::Type value ("NA" or "" is Type.None)"""
+    type_str = type_str.strip()
+    if type_str in ("NA", ""):
+        return TYPE_NONE
+    return TYPE_INDEX[type_str]
+
+
+def load_type_chart(file_path: str) -> "np.ndarray":
+    """Read types.csv into a (16, 16) uint8 matrix of TypeCalculator codes indexed [attacker, defender].
+
+    Codes are 0 (immune), 1 (neutral), 2 (double) and 3 (half); any other multiplier raises
+    ValueError. The Type.None row and column are neutral, so applying the None entry leaves
+    base power unchanged.
+    """
+    import numpy as np
+    chart = np.ones((len(TYPE_NAMES), len(TYPE_NAMES)), dtype=np.uint8)
+    with open(file_path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader)  # Skip header
+        for row in reader:
+            if not row or all(cell.strip() == '' for cell in row):
+                continue
+            attacker, defender, multiplier = row
+            if int(multiplier) not in MULTIPLIER_CODES:
+                raise ValueError(f"{file_path}: {attacker.strip()} vs {defender.strip()} has multiplier "
+                                 f"{multiplier.strip()}, expected one of {', '.join(map(str, MULTIPLIER_CODES))}")
+            chart[type_code(attacker), type_code(defender)] = MULTIPLIER_CODES[int(multiplier)]
+    return chart
+
+
+class MonTable:
+    """Column arrays of mon stats from mons.csv, one row per mon in file order"""
+    def __init__(self, names: List[str], columns: Dict[str, "np.ndarray"]):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.mon_id = columns["mon_id"]
+        self.hp = columns["hp"]
+        self.attack = columns["attack"]
+        self.defense = columns["defense"]
+        self.special_attack = columns["special_attack"]
+        self.special_defense = columns["special_defense"]
+        self.speed = columns["speed"]
+        self.type1 = columns["type1"]
+        self.type2 = columns["type2"]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class MoveTable:
+    """Column arrays of moves from moves.csv, one row per move in file order"""
+    def __init__(self, names: List[str], columns: Dict[str, "np.ndarray"]):
+        self.names = names
+        self.mon = columns["mon"]  # Row index into the MonTable of the mon that owns the move
+        self.power = columns["power"]
+        self.stamina = columns["stamina"]
+        self.accuracy = columns["accuracy"]
+        self.priority = columns["priority"]
+        self.move_type = columns["move_type"]
+        self.move_class = columns["move_class"]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def padded_by_mon(self, num_mons: int) -> "np.ndarray":
+        """(num_mons, max_moves) table of move indices per owning mon in file order, -1 for empty slots"""
+        import numpy as np
+        counts = np.bincount(self.mon, minlength=num_mons)
+        table = np.full((num_mons, max(1, int(counts.max(initial=0)))), -1, dtype=np.int64)
+        for mon in range(num_mons):
+            owned = np.flatnonzero(self.mon == mon)
+            table[mon, :len(owned)] = owned
+        return table
+
+
+def load_mon_table(file_path: str) -> MonTable:
+    """Read mons.csv into a MonTable"""
+    import numpy as np
+    names = []
+    rows = []
+    with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile):
+            names.append(row['Name'])
+            rows.append((int(row['Id']), int(row['HP']), int(row['Attack']), int(row['Defense']),
+                         int(row['SpecialAttack']), int(row['SpecialDefense']), int(row['Speed']),
+                         type_code(row['Type1']), type_code(row['Type2'])))
+
+    keys = ["mon_id", "hp", "attack", "defense", "special_attack", "special_defense", "speed", "type1", "type2"]
+    data = np.array(rows, dtype=np.int64).reshape(-1, len(keys))
+    return MonTable(names, {key: data[:, i].copy() for i, key in enumerate(keys)})
+
+
+def load_move_table(file_path: str, mons: MonTable) -> MoveTable:
+    """Read moves.csv into a MoveTable, skipping moves of mons that aren't in the MonTable"""
+    import numpy as np
+    names = []
+    rows = []
+    with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile):
+            mon_name = row['Mon'].strip()
+            if not row['Name'].strip() or mon_name not in mons.index:
+                continue
+            names.append(row['Name'].strip())
+            rows.append((mons.index[mon_name], int(row['Power']), int(row['Stamina']), int(row['Accuracy']),
+                         int(row['Priority']), type_code(row['Type']), MOVE_CLASS_INDEX[row['Class'].strip()]))
+
+    keys = ["mon", "power", "stamina", "accuracy", "priority", "move_type", "move_class"]
+    data = np.array(rows, dtype=np.int64).reshape(-1, len(keys))
+    return MoveTable(names, {key: data[:, i].copy() for i, key in enumerate(keys)})
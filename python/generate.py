@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Single entry point for the code generators, one subcommand each:
+
+    types    src/types/TypeCalculator.sol from drool/types.csv
+    mons     script/SetupMons.s.sol (all of mon_stats_to_sol.py's options)
+    chart    python/types.png from drool/types.csv, skipped if types.csv is unchanged
+    sprites  SVG renders of the sprite metadata words (sprite_svg.py)
+
+Only the chosen subcommand's parser is built and only its modules are imported, so
+`types` and `mons` without --color never load matplotlib, PIL or NumPy. `types` also keeps
+the generated contract in a build cache keyed by types.csv and the generator sources, so
+an unchanged chart is written back without importing NumPy at all.
+
+Run from the repository root (all paths are options with repo-relative defaults):
+    python python/generate.py types
+    python python/generate.py mons --color
+"""
+
+import argparse
+import os
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+from build_cache import BuildCache, file_hash, write_if_changed
+
+PYTHON_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TYPES_CSV = os.path.join("drool", "types.csv")
+DEFAULT_TYPE_CALCULATOR = os.path.join("src", "types", "TypeCalculator.sol")
+DEFAULT_CHART = os.path.join("python", "types.png")
+TYPES_CACHE_PATH = os.path.join(".cache", "type_chart_to_sol.json")
+# Modules whose code decides the TypeCalculator.sol text, part of its cache key
+TYPE_GENERATOR_SOURCES = ["type_chart_to_sol.py", "type_layout.py", "type_tables.py", "game_data.py", "bitpack.py"]
+
+
+def type_calculator_key(types_csv: str, layout_name: str) -> str:
+    sources = [file_hash(os.path.join(PYTHON_DIR, name)).encode() for name in TYPE_GENERATOR_SOURCES]
+    return file_hash(types_csv, layout_name.encode(), *sources)
+
+
+def types_command(parser: argparse.ArgumentParser, argv: List[str]) -> None:
+    parser.add_argument('--types-csv', default=DEFAULT_TYPES_CSV, help=f'Type chart CSV (default: {DEFAULT_TYPES_CSV})')
+    parser.add_argument('--output', default=DEFAULT_TYPE_CALCULATOR,
+                        help=f'Solidity file to write (default: {DEFAULT_TYPE_CALCULATOR})')
+    parser.add_argument('--layout', default='auto',
+                        help='Packed layout of the single-type chart, a name from type_layout.LAYOUTS '
+                             '(default: auto picks the cheapest estimated lookup)')
+    parser.add_argument('--cache', default=TYPES_CACHE_PATH, help=f'Build cache path (default: {TYPES_CACHE_PATH})')
+    parser.add_argument('--no-cache', action='store_true', help='Regenerate without reading or writing the cache')
+    args = parser.parse_args(argv)
+
+    def compute() -> str:
+        # Imported here: generating and verifying the packed tables needs NumPy, a cache hit doesn't
+        from type_chart_to_sol import generate_type_calculator
+        return generate_type_calculator(args.types_csv, args.layout)
+
+    cache = None if args.no_cache else BuildCache(args.cache)
+    try:
+        if cache is None:
+            contract = compute()
+        else:
+            contract = cache.get_or_compute("type_calculator", type_calculator_key(args.types_csv, args.layout), compute)
+    except ValueError as e:
+        sys.exit(str(e))
+    if cache is not None:
+        cache.save()
+    if write_if_changed(args.output, contract):
+        print(f"Generated {args.output}")
+    else:
+        print(f"{args.output} unchanged")
+
+
+def mons_command(parser: argparse.ArgumentParser, argv: List[str]) -> None:
+    import mon_stats_to_sol
+    mon_stats_to_sol.add_arguments(parser)
+    mon_stats_to_sol.run(mon_stats_to_sol.parse_arguments(parser, argv))
+
+
+def chart_command(parser: argparse.ArgumentParser, argv: List[str]) -> None:
+    from type_chart_render import CHART_CACHE_PATH, DEFAULT_CELL_SIZE, RENDERERS, write_chart
+    parser.add_argument('--types-csv', default=DEFAULT_TYPES_CSV, help=f'Type chart CSV (default: {DEFAULT_TYPES_CSV})')
+    parser.add_argument('--output', default=DEFAULT_CHART, help=f'Chart image to write (default: {DEFAULT_CHART})')
+    parser.add_argument('--renderer', choices=list(RENDERERS), default='matplotlib',
+                        help='matplotlib (the committed chart) or the millisecond raster/svg renderers '
+                             '(default: matplotlib)')
+    parser.add_argument('--cell-size', type=int, default=DEFAULT_CELL_SIZE,
+                        help=f'Pixels per cell for raster and svg (default: {DEFAULT_CELL_SIZE})')
+    parser.add_argument('--cache', default=CHART_CACHE_PATH, help=f'Build cache path (default: {CHART_CACHE_PATH})')
+    parser.add_argument('--no-cache', action='store_true', help='Render even if types.csv is unchanged')
+    args = parser.parse_args(argv)
+
+    cache = None if args.no_cache else BuildCache(args.cache)
+    if write_chart(args.types_csv, args.output, args.renderer, args.cell_size, cache):
+        print(f"Generated {args.output}")
+    else:
+        print(f"{args.output} unchanged")
+    if cache is not None:
+        cache.save()
+
+
+def sprites_command(parser: argparse.ArgumentParser, argv: List[str]) -> None:
+    import sprite_svg
+    sprite_svg.add_arguments(parser)
+    sprite_svg.run(parser.parse_args(argv))
+
+
+# Subcommand -> (description, handler that adds its options, parses argv and runs)
+COMMANDS: Dict[str, Tuple[str, Callable[[argparse.ArgumentParser, List[str]], None]]] = {
+    "types": ("Generate TypeCalculator.sol from types.csv", types_command),
+    "mons": ("Generate the SetupMons deployment script(s)", mons_command),
+    "chart": ("Render the type effectiveness chart image", chart_command),
+    "sprites": ("Render sprite metadata words as SVG and compare rect merging", sprites_command),
+}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='Generate Solidity and assets from drool/. Run "<command> --help" for a command\'s options.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="commands:\n" + "\n".join(f"  {name:<9}{description}" for name, (description, _) in COMMANDS.items()))
+    parser.add_argument('command', choices=list(COMMANDS), metavar='command', help='One of: ' + ", ".join(COMMANDS))
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='Options for the command')
+    args = parser.parse_args(argv)
+
+    description, handler = COMMANDS[args.command]
+    handler(argparse.ArgumentParser(prog=f"{parser.prog} {args.command}", description=description), args.args)
+
+
+if __name__ == "__main__":
+    main()
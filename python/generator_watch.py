@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Watch mode for mon_stats_to_sol.py (--watch).
+
+A cold run re-reads every CSV, decodes every GIF and re-scans every Solidity file. The watcher
+does that once, keeps the roster, each mon's compressed sprite and the SolidityIndex in
+memory, and on every save only redoes what the changed files affect:
+
+- drool/mons.csv, moves.csv, abilities.csv: re-read the roster (sprites are kept)
+- drool/imgs/<mon>_mini.gif: recompress that mon's sprite (with --color)
+- src/**/*.sol: re-parse just those files in the index
+- drool/types.csv: regenerate src/types/TypeCalculator.sol
+
+and then rewrites the SetupMons script(s) with the same options as a one-shot run. Changes
+are found by polling file modification times, which costs about a millisecond per check for
+this tree and needs nothing outside the standard library.
+
+With --sprite-dictionary the shared palette and tiles depend on every sprite, so a GIF
+change rebuilds the whole dictionary.
+"""
+
+import argparse
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from build_cache import BuildCache, write_if_changed
+from mon_stats_to_sol import attach_sprite_dictionary, attach_sprites, load_roster, write_setup_mons
+from solidity_index import SolidityIndex
+
+ROSTER_CSVS = ("mons.csv", "moves.csv", "abilities.csv")
+SPRITE_SUFFIX = "_mini.gif"
+
+# (directory relative to the base path, file suffix, recurse into subdirectories)
+WATCHED_SOURCES = [
+    ("drool", ".csv", False),
+    (os.path.join("drool", "imgs"), SPRITE_SUFFIX, False),
+    ("src", ".sol", True),
+]
+
+
+def scan(base_path: str) -> Dict[str, Tuple[int, int]]:
+    """Path -> (mtime_ns, size) of every watched file"""
+    snapshot = {}
+    for directory, suffix, recursive in WATCHED_SOURCES:
+        root_dir = os.path.join(base_path, directory)
+        for root, dirs, files in os.walk(root_dir):
+            if not recursive:
+                dirs.clear()
+            for file_name in files:
+                if file_name.endswith(suffix):
+                    path = os.path.join(root, file_name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def changed_paths(before: Dict[str, Tuple[int, int]], after: Dict[str, Tuple[int, int]]) -> List[str]:
+    """Paths added, removed or modified between two scans"""
+    return sorted(path for path in before.keys() | after.keys() if before.get(path) != after.get(path))
+
+
+def sprite_key(gif_path: str) -> str:
+    """Mon name key of a mini GIF, as analyze_sprite_images uses"""
+    return os.path.basename(gif_path).replace(SPRITE_SUFFIX, '').lower()
+
+
+class GeneratorWatcher:
+    """In-memory generator state, updated file by file"""
+    def __init__(self, args: argparse.Namespace, base_path: str, cache: Optional[BuildCache]):
+        self.args = args
+        self.base_path = base_path
+        self.cache = cache
+        self.codecs = None if args.sprite_codec == 'auto' else [args.sprite_codec]
+        self.types_csv = os.path.join(base_path, "drool", "types.csv")
+        self.type_calculator_path = os.path.join(base_path, "src", "types", "TypeCalculator.sol")
+        self.sprites: Dict[str, dict] = {}  # Mon name key -> load_sprite result
+        self.mons = None
+        self.index: Optional[SolidityIndex] = None
+        self.snapshot: Dict[str, Tuple[int, int]] = {}
+
+    def gif_paths(self) -> List[str]:
+        return sorted(path for path in self.snapshot if path.endswith(SPRITE_SUFFIX))
+
+    def load_sprites(self, gif_paths: List[str]) -> None:
+        from sprite_pipeline import load_sprite
+        for gif_path in gif_paths:
+            result = load_sprite(gif_path, self.cache, self.codecs, self.args.max_colors) \
+                if os.path.exists(gif_path) else None
+            if result:
+                self.sprites[sprite_key(gif_path)] = result
+            else:
+                self.sprites.pop(sprite_key(gif_path), None)
+
+    def attach_sprites(self) -> None:
+        if not self.args.color:
+            return
+        if self.args.sprite_dictionary:
+            from sprite_pipeline import build_roster_sprite_dictionary
+            dictionary = build_roster_sprite_dictionary(self.base_path, self.cache, self.codecs, self.args.max_colors)
+            if dictionary:
+                attach_sprite_dictionary(self.mons, dictionary)
+            return
+        attach_sprites(self.mons, {key: result['sprite'] for key, result in self.sprites.items()},
+                       {key: result['palette'] for key, result in self.sprites.items()},
+                       {key: result['header'] for key, result in self.sprites.items()})
+
+    def write_type_calculator(self) -> None:
+        # Imported here: the type chart script pulls in matplotlib for its chart
+        from type_chart_to_sol import generate_type_calculator
+        if write_if_changed(self.type_calculator_path, generate_type_calculator(self.types_csv)):
+            print(f"Generated {self.type_calculator_path}")
+            self.index.refresh([self.type_calculator_path], self.cache)
+            # Our own write is not an edit to react to
+            self.snapshot.update({path: stat for path, stat in scan(self.base_path).items()
+                                  if path == self.type_calculator_path})
+
+    def build(self) -> None:
+        """Full generation, as a one-shot run does"""
+        self.snapshot = scan(self.base_path)
+        self.mons = load_roster(self.base_path)
+        if self.args.color and not self.args.sprite_dictionary:
+            self.load_sprites(self.gif_paths())
+        self.attach_sprites()
+        self.index = SolidityIndex(self.base_path, self.cache)
+        print(f"Indexed {len(self.index)} Solidity files")
+        self.write_type_calculator()
+        write_setup_mons(self.mons, self.base_path, self.index, self.args)
+
+    def update(self, paths: List[str]) -> None:
+        """Redo only the stages that depend on the changed paths"""
+        names = {os.path.basename(path) for path in paths}
+        gifs = [path for path in paths if path.endswith(SPRITE_SUFFIX)]
+        sources = [path for path in paths if path.endswith(".sol")]
+        roster_changed = bool(names.intersection(ROSTER_CSVS))
+
+        if sources:
+            self.index.refresh(sources, self.cache)
+        if roster_changed:
+            self.mons = load_roster(self.base_path)
+        if gifs and self.args.color and not self.args.sprite_dictionary:
+            self.load_sprites(gifs)
+        if roster_changed or (gifs and self.args.color):
+            self.attach_sprites()
+        if os.path.normpath(self.types_csv) in map(os.path.normpath, paths):
+            self.write_type_calculator()
+        if roster_changed or gifs or sources:
+            write_setup_mons(self.mons, self.base_path, self.index, self.args)
+
+    def run(self, poll_interval: float) -> None:
+        start = time.perf_counter()
+        self.build()
+        if self.cache is not None:
+            self.cache.save()
+        print(f"\nInitial build took {(time.perf_counter() - start) * 1000:.0f} ms; watching for changes "
+              f"(Ctrl-C to stop)")
+        try:
+            while True:
+                time.sleep(poll_interval)
+                current = scan(self.base_path)
+                paths = changed_paths(self.snapshot, current)
+                if not paths:
+                    continue
+                self.snapshot = current
+                start = time.perf_counter()
+                print(f"\nChanged: {', '.join(os.path.relpath(path, self.base_path) for path in paths)}")
+                try:
+                    self.update(paths)
+                except Exception as e:
+                    # Usually a file caught mid-save; keep watching so the next save triggers another attempt
+                    print(f"Regeneration failed: {e!r}")
+                    continue
+                if self.cache is not None:
+                    self.cache.save()
+                print(f"Regenerated in {(time.perf_counter() - start) * 1000:.0f} ms")
+        except KeyboardInterrupt:
+            print("\nStopped watching")
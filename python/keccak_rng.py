@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+from game_data import DEFAULT_VOL
+
+# Keccak-f[1600] round constants
+ROUND_CONSTANTS = np.array([
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008
+], dtype=np.uint64)
+
+# Rotation offsets r[x][y] for lane (x, y)
+ROTATIONS = [
+    [0, 36, 3, 41, 18],
+    [1, 44, 10, 45, 2],
+    [62, 6, 43, 15, 61],
+    [28, 55, 25, 21, 56],
+    [27, 20, 39, 8, 14]
+]
+
+RATE_LANES = 17  # keccak256 absorbs 136 bytes per block
+WORD_BYTES = 32  # abi.encode(uint256) is one 32-byte big-endian word
+
+# Messages permuted together; larger batches spill lane arrays out of cache
+CACHE_BATCH_SIZE = 16384
+
+# Seeds per task when fanning out over a process pool
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def _rotl(lane: np.ndarray, shift: int) -> np.ndarray:
+    if shift == 0:
+        return lane
+    return (lane << np.uint64(shift)) | (lane >> np.uint64(64 - shift))
+
+
+# Rho and pi folded together: lane (x, y) rotated by r[x][y] moves to (y, 2x + 3y)
+RHO_PI = [(x + 5 * y, y + 5 * ((2 * x + 3 * y) % 5), ROTATIONS[x][y]) for x in range(5) for y in range(5)]
+
+
+def keccak_f1600(state: np.ndarray) -> np.ndarray:
+    """Apply the Keccak-f[1600] permutation to a batch of states.
+
+    state is a (25, N) uint64 array with lane (x, y) in row x + 5 * y. Each step works on one
+    lane row at a time, which keeps the working set in cache for batches of a few thousand.
+    Returns a new (25, N) array.
+    """
+    a = list(state)
+    b = [None] * 25
+    for round_constant in ROUND_CONSTANTS:
+        # Theta
+        c = [a[x] ^ a[x + 5] ^ a[x + 10] ^ a[x + 15] ^ a[x + 20] for x in range(5)]
+        d = [c[(x - 1) % 5] ^ _rotl(c[(x + 1) % 5], 1) for x in range(5)]
+        for i in range(25):
+            a[i] = a[i] ^ d[i % 5]
+
+        # Rho and pi
+        for source, target, shift in RHO_PI:
+            b[target] = _rotl(a[source], shift)
+
+        # Chi
+        for y in range(0, 25, 5):
+            for x in range(5):
+                a[y + x] = b[y + x] ^ (~b[y + (x + 1) % 5] & b[y + (x + 2) % 5])
+
+        # Iota
+        a[0] = a[0] ^ round_constant
+    return np.stack(a)
+
+
+def keccak256_words(words: np.ndarray) -> np.ndarray:
+    """keccak256 of a batch of 32-byte messages.
+
+    Args:
+        words: (N, 32) uint8 array, e.g. abi.encode(uint256) of N values
+
+    Returns:
+        (N, 32) uint8 array of digests, which are themselves big-endian uint256 words
+    """
+    words = np.ascontiguousarray(words, dtype=np.uint8).reshape(-1, WORD_BYTES)
+    digests = np.empty_like(words)
+    for start in range(0, len(words), CACHE_BATCH_SIZE):
+        block = words[start:start + CACHE_BATCH_SIZE]
+
+        # A 32-byte message fits in a single block: data, then 0x01 ... 0x80 padding
+        state = np.zeros((25, len(block)), dtype=np.uint64)
+        state[:4] = block.view('<u8').T
+        state[4] ^= np.uint64(0x01)
+        state[RATE_LANES - 1] ^= np.uint64(0x80 << 56)
+
+        state = keccak_f1600(state)
+        digests[start:start + CACHE_BATCH_SIZE] = np.ascontiguousarray(state[:4].T).astype('<u8').view(np.uint8)
+    return digests
+
+
+def encode_uint256(values: Sequence[int]) -> np.ndarray:
+    """abi.encode each uint256 value into an (N, 32) uint8 array"""
+    raw = b"".join(int(v).to_bytes(WORD_BYTES, 'big') for v in values)
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, WORD_BYTES).copy()
+
+
+def decode_uint256(words: np.ndarray) -> List[int]:
+    """Convert an (N, 32) uint8 array of big-endian words back to Python ints"""
+    raw = np.ascontiguousarray(words, dtype=np.uint8).tobytes()
+    return [int.from_bytes(raw[i:i + WORD_BYTES], 'big') for i in range(0, len(raw), WORD_BYTES)]
+
+
+def mod_small(words: np.ndarray, modulus) -> np.ndarray:
+    """Compute uint256 % modulus for a batch of words without leaving NumPy.
+
+    modulus may be a scalar or an array broadcastable to N, and must be below 2**31.
+    """
+    limbs = np.ascontiguousarray(words, dtype=np.uint8).reshape(-1, WORD_BYTES).view('>u8').astype(np.uint64)
+    modulus = np.broadcast_to(np.asarray(modulus, dtype=np.uint64), (limbs.shape[0],))
+
+    # Horner's rule over the four 64-bit limbs, most significant first
+    limb_base = (np.uint64(2**32) % modulus) ** np.uint64(2) % modulus
+    remainder = np.zeros(limbs.shape[0], dtype=np.uint64)
+    for k in range(4):
+        remainder = (remainder * limb_base + limbs[:, k] % modulus) % modulus
+    return remainder.astype(np.int64)
+
+
+def rng_chain(seeds: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (rng, rng2, rng3) for a batch of seeds, as (N, 32) uint8 word arrays.
+
+    rng2 = keccak256(abi.encode(rng)) and rng3 = keccak256(abi.encode(rng2)), as in
+    AttackCalculator.calculateDamageView. seeds may be (N, 32) words or a sequence of ints.
+    """
+    rng = seeds if isinstance(seeds, np.ndarray) and seeds.ndim == 2 else encode_uint256(seeds)
+    rng2 = keccak256_words(rng)
+    rng3 = keccak256_words(rng2)
+    return rng, rng2, rng3
+
+
+def _rng_chain_chunk(seeds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    _, rng2, rng3 = rng_chain(seeds)
+    return rng2, rng3
+
+
+def rng_chain_parallel(seeds: np.ndarray, workers: Optional[int] = None,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """rng_chain, sharded over a process pool in chunks of chunk_size seeds.
+
+    Batches that fit in one chunk (or workers=1) are hashed in-process.
+    """
+    rng = seeds if isinstance(seeds, np.ndarray) and seeds.ndim == 2 else encode_uint256(seeds)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(rng) <= chunk_size:
+        return rng_chain(rng)
+
+    chunks = [rng[i:i + chunk_size] for i in range(0, len(rng), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_rng_chain_chunk, chunks))
+    return rng, np.concatenate([r[0] for r in results]), np.concatenate([r[1] for r in results])
+
+
+def damage_rolls(seeds: np.ndarray, volatility=DEFAULT_VOL, workers: Optional[int] = 1
+                 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Batched equivalent of damage_calc.rolls_from_rng that derives rng2/rng3 from the seeds.
+
+    Returns:
+        tuple: (accuracy_roll, volatility_roll, volatility_offset, crit_roll)
+    """
+    rng, rng2, rng3 = rng_chain_parallel(seeds, workers)
+    return (mod_small(rng, 100), mod_small(rng2, 100),
+            mod_small(rng2, np.asarray(volatility, dtype=np.int64) + 1), mod_small(rng3, 100))
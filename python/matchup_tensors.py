@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Precompute damage for every (attacker, move, defender) triple of the roster.
+
+Writes one .npy tensor per quantity, shaped (attacker, move slot, defender), plus index.json
+with the axis labels, and a compact matchups.json that the drool pages read instead of
+recalculating damage in the browser. Moves are the attacker's moves in moves.csv order; empty
+and non-damaging slots hold 0 damage and -1 hits-to-KO.
+
+Run from the repository root:
+    python python/matchup_tensors.py
+"""
+
+import argparse
+import json
+import os
+from typing import Dict
+
+import numpy as np
+
+from build_cache import content_hash, file_hash, write_if_changed
+from damage_calc import is_damaging, score_matchups
+from game_data import (DEFAULT_CRIT_RATE, DEFAULT_VOL, MOVE_CLASSES, TYPE_NAMES, TYPE_NONE, MonTable, MoveTable,
+                       load_mon_table, load_move_table, load_type_chart)
+
+FORMAT_VERSION = 1
+DEFAULT_OUTPUT_DIR = os.path.join("drool", "matchups")
+INDEX_FILE = "index.json"
+DROOL_FILE = "matchups.json"
+
+# Tensor name -> dtype; all are shaped (attacker, move slot, defender)
+TENSORS = {
+    "damage_base": np.int32,      # A hit with no volatility and no crit
+    "damage_min": np.int32,       # Lowest damage of a hit (volatility rolled down, no crit)
+    "damage_max": np.int32,       # Highest damage of a hit (volatility rolled up, crit)
+    "damage_expected": np.float32,  # Mean over accuracy, volatility and crit rolls
+    "hits_to_ko": np.int16,       # Hits to KO from full HP if every hit rolls damage_min
+    "hits_to_ko_best": np.int16,  # Hits to KO from full HP if every hit rolls damage_max
+}
+
+# Multipliers the drool pages show for each TypeCalculator code: immune, neutral, double, half
+PAGE_MULTIPLIERS = np.array([0.0, 1.0, 2.0, 0.5])
+
+
+def roll_outcomes(volatility: int = DEFAULT_VOL, crit_rate: int = DEFAULT_CRIT_RATE):
+    """Every (volatility_roll, volatility_offset, crit_roll) outcome of a hit and its probability.
+
+    Only the branch each residue takes matters, so one representative residue stands in for each
+    branch: rng2 % 100 above 50 (49 of 100) or not, each rng2 % (volatility + 1) offset, and
+    rng3 % 100 at most crit_rate or not.
+    """
+    direction_roll = np.array([0, 99])
+    direction_weight = np.array([51, 49]) / 100
+    offset = np.arange(volatility + 1)
+    offset_weight = np.full(volatility + 1, 1 / (volatility + 1))
+    crit_roll = np.array([99, 0])
+    crit_weight = np.array([1 - (crit_rate + 1) / 100, (crit_rate + 1) / 100])
+
+    grid = np.meshgrid(direction_roll, offset, crit_roll, indexing='ij')
+    weight = direction_weight[:, None, None] * offset_weight[None, :, None] * crit_weight[None, None, :]
+    return grid[0].ravel(), grid[1].ravel(), grid[2].ravel(), weight.ravel()
+
+
+def hits_to_ko(hp: np.ndarray, damage: np.ndarray) -> np.ndarray:
+    """ceil(hp / damage), or -1 where damage is 0"""
+    hits = -(-hp // np.maximum(damage, 1))
+    return np.where(damage > 0, hits, -1).astype(np.int16)
+
+
+def compute_matchup_tensors(mons: MonTable, moves: MoveTable, type_chart: np.ndarray,
+                            volatility: int = DEFAULT_VOL, crit_rate: int = DEFAULT_CRIT_RATE) -> Dict[str, np.ndarray]:
+    """Compute every tensor in TENSORS for the roster"""
+    slots = moves.padded_by_mon(len(mons))  # (A, K), -1 for empty slots
+    valid = slots >= 0
+    move_index = np.where(valid, slots, 0)[:, :, None, None]  # (A, K, 1, 1)
+    defender_index = np.arange(len(mons))[None, None, :, None]  # (1, 1, D, 1)
+    volatility_roll, volatility_offset, crit_roll, weight = roll_outcomes(volatility, crit_rate)
+
+    # Score hits only (accuracy roll 0); the miss chance is folded into the expectation below
+    damage, _ = score_matchups(mons, moves, type_chart, move_index, defender_index, 0,
+                               volatility_roll, volatility_offset, crit_roll, volatility, crit_rate)
+    damage = np.where(valid[:, :, None, None], damage, 0).astype(np.int64)  # (A, K, D, outcomes)
+    base, _ = score_matchups(mons, moves, type_chart, move_index[..., 0], defender_index[..., 0], 0, 0, 0, 100,
+                             volatility=0)
+    hit_chance = np.where(valid, np.clip(moves.accuracy[slots], 0, 100) / 100, 0)[:, :, None]
+
+    hp = mons.hp[None, None, :]
+    damage_min = damage.min(axis=-1)
+    damage_max = damage.max(axis=-1)
+    return {
+        "damage_base": np.where(valid[:, :, None], base, 0).astype(np.int32),
+        "damage_min": damage_min.astype(np.int32),
+        "damage_max": damage_max.astype(np.int32),
+        "damage_expected": (hit_chance * (damage @ weight)).astype(np.float32),
+        "hits_to_ko": hits_to_ko(hp, damage_min),
+        "hits_to_ko_best": hits_to_ko(hp, damage_max),
+    }
+
+
+def mon_signature(mons: MonTable, i: int) -> str:
+    """Stats and types a matchup depends on, in the form the drool pages rebuild from mons.csv"""
+    type2 = TYPE_NAMES[mons.type2[i]] if mons.type2[i] != TYPE_NONE else "NA"
+    return "|".join(str(v) for v in (mons.hp[i], mons.attack[i], mons.defense[i], mons.special_attack[i],
+                                     mons.special_defense[i], TYPE_NAMES[mons.type1[i]], type2))
+
+
+def move_signature(moves: MoveTable, i: int) -> str:
+    """Move fields a matchup depends on, in the form the drool pages rebuild from moves.csv"""
+    return "|".join(str(v) for v in (moves.power[i], moves.accuracy[i], TYPE_NAMES[moves.move_type[i]],
+                                     MOVE_CLASSES[moves.move_class[i]]))
+
+
+def build_drool_json(mons: MonTable, moves: MoveTable, type_chart: np.ndarray,
+                     tensors: Dict[str, np.ndarray]) -> dict:
+    """Compact per-move rows for drool/mon-analysis.js.
+
+    "damage" and "typeMultiplier" are the unrounded values the page has always shown
+    (power * attack / defence times the float type multiplier); the rest come from the tensors.
+    """
+    slots = moves.padded_by_mon(len(mons))
+    damaging = is_damaging(moves)
+    type1_multiplier = PAGE_MULTIPLIERS[type_chart[:, mons.type1]]  # (types, D)
+    type2_multiplier = np.where(mons.type2 == TYPE_NONE, 1.0, PAGE_MULTIPLIERS[type_chart[:, mons.type2]])
+
+    matchups = {}
+    for a, attacker in enumerate(mons.names):
+        rows = {}
+        for k, m in enumerate(slots[a]):
+            if m < 0 or not damaging[m]:
+                continue
+            physical = MOVE_CLASSES[moves.move_class[m]] == "Physical"
+            attack_stat = mons.attack[a] if physical else mons.special_attack[a]
+            defense_stat = mons.defense if physical else mons.special_defense
+            multiplier = type1_multiplier[moves.move_type[m]] * type2_multiplier[moves.move_type[m]]
+            damage = moves.power[m] * attack_stat / defense_stat * multiplier
+            rows[moves.names[m]] = {
+                "signature": move_signature(moves, m),
+                "typeMultiplier": multiplier.tolist(),
+                "damage": [round(float(d), 4) for d in damage],
+                "min": tensors["damage_min"][a, k].tolist(),
+                "expected": [round(float(d), 2) for d in tensors["damage_expected"][a, k]],
+                "max": tensors["damage_max"][a, k].tolist(),
+                "hitsToKo": tensors["hits_to_ko"][a, k].tolist(),
+            }
+        matchups[attacker] = rows
+
+    return {
+        "version": FORMAT_VERSION,
+        "defenders": mons.names,
+        "signatures": {name: mon_signature(mons, i) for i, name in enumerate(mons.names)},
+        "matchups": matchups,
+    }
+
+
+def build_index(mons: MonTable, moves: MoveTable, inputs_hash: str, tensors: Dict[str, np.ndarray]) -> dict:
+    """Axis labels and file names of the written tensors"""
+    slots = moves.padded_by_mon(len(mons))
+    return {
+        "version": FORMAT_VERSION,
+        "inputs": inputs_hash,
+        "axes": ["attacker", "move", "defender"],
+        "attacker": mons.names,
+        "move": [[moves.names[m] if m >= 0 else None for m in row] for row in slots],
+        "defender": mons.names,
+        "tensors": {name: {"file": f"{name}.npy", "dtype": np.dtype(tensors[name].dtype).name,
+                           "shape": list(tensors[name].shape)} for name in TENSORS},
+    }
+
+
+def load_matchup_tensors(output_dir: str = DEFAULT_OUTPUT_DIR):
+    """Memory-map the tensors written by write_matchup_tensors.
+
+    Returns:
+        tuple: (index, tensors) where index is the parsed index.json and tensors maps each
+               tensor name to a read-only np.memmap-backed array
+    """
+    with open(os.path.join(output_dir, INDEX_FILE), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    tensors = {name: np.load(os.path.join(output_dir, entry["file"]), mmap_mode='r')
+               for name, entry in index["tensors"].items()}
+    return index, tensors
+
+
+def inputs_hash_for(data_dir: str, volatility: int, crit_rate: int) -> str:
+    """Hash of the CSVs and roll parameters the tensors are derived from"""
+    return content_hash(*[file_hash(os.path.join(data_dir, name)).encode() for name in
+                          ("mons.csv", "moves.csv", "types.csv")],
+                        f"{FORMAT_VERSION}:{volatility}:{crit_rate}".encode())
+
+
+def write_matchup_tensors(data_dir: str, output_dir: str, volatility: int = DEFAULT_VOL,
+                          crit_rate: int = DEFAULT_CRIT_RATE, force: bool = False) -> bool:
+    """Build the tensors and JSON files under output_dir.
+
+    Returns:
+        bool: False if the existing outputs were already built from the same inputs
+    """
+    inputs_hash = inputs_hash_for(data_dir, volatility, crit_rate)
+    index_path = os.path.join(output_dir, INDEX_FILE)
+    if not force and os.path.exists(index_path):
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get("inputs") == inputs_hash and all(
+                    os.path.exists(os.path.join(output_dir, entry["file"])) for entry in index["tensors"].values()):
+                return False
+        except (OSError, ValueError, KeyError):
+            pass
+
+    mons = load_mon_table(os.path.join(data_dir, "mons.csv"))
+    moves = load_move_table(os.path.join(data_dir, "moves.csv"), mons)
+    type_chart = load_type_chart(os.path.join(data_dir, "types.csv"))
+    tensors = compute_matchup_tensors(mons, moves, type_chart, volatility, crit_rate)
+
+    os.makedirs(output_dir, exist_ok=True)
+    for name, dtype in TENSORS.items():
+        np.save(os.path.join(output_dir, f"{name}.npy"), tensors[name].astype(dtype))
+    write_if_changed(os.path.join(output_dir, DROOL_FILE),
+                     json.dumps(build_drool_json(mons, moves, type_chart, tensors), separators=(',', ':')) + "\n")
+    # Written last so an interrupted build is redone on the next run
+    write_if_changed(index_path, json.dumps(build_index(mons, moves, inputs_hash, tensors), indent=2) + "\n")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute (attacker, move, defender) damage tensors')
+    parser.add_argument('--data-dir', default='drool', help='Directory containing mons.csv, moves.csv and types.csv')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='Directory to write tensors to')
+    parser.add_argument('--force', action='store_true', help='Rebuild even if the inputs are unchanged')
+    args = parser.parse_args()
+
+    if not write_matchup_tensors(args.data_dir, args.output_dir, force=args.force):
+        print(f"Matchup tensors in {args.output_dir} are up to date")
+        return
+
+    index, tensors = load_matchup_tensors(args.output_dir)
+    shape = tuple(index["tensors"]["damage_base"]["shape"])
+    total = sum(t.nbytes for t in tensors.values())
+    print(f"Wrote {len(tensors)} tensors of shape {shape} ({total} bytes) to {args.output_dir}")
+    print(f"Wrote {os.path.join(args.output_dir, DROOL_FILE)} "
+          f"({os.path.getsize(os.path.join(args.output_dir, DROOL_FILE))} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
 
 import csv
+import json
 import os
 import re
 import argparse
-from typing import Dict, List, Tuple
-from PIL import Image
-import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from build_cache import BuildCache, write_if_changed
+from deploy_graph import DEFAULT_EXTERNAL_CONTRACTS, DeployGraph, build_deploy_graph, graph_manifest
+from deploy_plan import (DEFAULT_GAS_BUDGET, MonGasEstimate, batch_manifest, estimate_create_mon_gas,
+                         estimate_deploy_gas, estimate_factory_create_gas, plan_batches, runtime_bytes)
+from solidity_index import SolidityIndex, parse_solidity_source, resolve_dependencies
+from standard_attacks import (classify_standard_attack, create_standard_attack_function, describe_attack_params,
+                              pack_attack_params)
+
+# The sprite modules (sprite_codecs, sprite_pipeline) load NumPy and PIL, so they are imported
+# inside the functions that only run with sprite data: a script without --color needs neither
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "mon_stats_to_sol.json")
 
 
 class MonData:
@@ -28,7 +40,10 @@ class MonData:
         self.moves: List[str] = []
         self.abilities: List[str] = []
         self.sprite_data: List[int] = []  # uint256 values for compressed sprite data
+        self.sprite_header: Optional[int] = None  # IMG_HDR word naming the sprite codec
         self.palette_data: List[int] = []  # uint256 values for compressed palette data
+        self.tile_map_data: List[int] = []  # uint256 values of tile references (sprite dictionary mode)
+        self.palette_ref_data: List[int] = []  # uint256 values of shared palette references (sprite dictionary mode)
 
 
 class ContractInfo:
@@ -38,6 +53,7 @@ class ContractInfo:
         self.contract_path = contract_path
         self.dependencies = dependencies
         self.import_paths = import_paths or []  # File paths of contracts that need to be imported
+        self.standard_attack: Optional[dict] = None  # ATTACK_PARAMS if created through StandardAttackFactory
         self.variable_name = self._generate_variable_name()
 
     def _generate_variable_name(self) -> str:
@@ -58,9 +74,52 @@ class ContractInfo:
         return result
 
 
-def read_mons_csv(file_path: str) -> Dict[str, MonData]:
-    """Read mons.csv and return a dictionary of mon name -> MonData"""
-    mons = {}
+class Roster(Dict[str, MonData]):
+    """Dictionary of mon name -> MonData that also carries reverse indexes.
+
+    move_to_mon and ability_to_mon are filled in as the CSVs are loaded, contracts and
+    mon_contracts by collect_all_contracts, so script generation never has to scan mons.
+    """
+    def __init__(self):
+        super().__init__()
+        self.move_to_mon: Dict[str, MonData] = {}
+        self.ability_to_mon: Dict[str, MonData] = {}
+        self.move_rows: Dict[str, Dict[str, str]] = {}  # move name -> its moves.csv row
+        self.contracts: Dict[str, ContractInfo] = {}  # contract name -> ContractInfo
+        self.mon_contracts: Dict[str, Dict[str, ContractInfo]] = {}  # mon name -> its contracts
+        self.shared_metadata: List[Tuple[str, int]] = []  # Metadata shared by all mons (sprite dictionary)
+
+    def add_move(self, mon_name: str, move_name: str) -> None:
+        mon = self[mon_name]
+        mon.moves.append(move_name)
+        self.move_to_mon.setdefault(move_name, mon)
+
+    def add_ability(self, mon_name: str, ability_name: str) -> None:
+        mon = self[mon_name]
+        mon.abilities.append(ability_name)
+        self.ability_to_mon.setdefault(ability_name, mon)
+
+    def owner_of(self, name: str) -> Optional[MonData]:
+        """Return the mon a move or ability belongs to"""
+        return self.move_to_mon.get(name) or self.ability_to_mon.get(name)
+
+    def subset(self, names: List[str]) -> "Roster":
+        """Return a Roster of just the named mons, with indexes and contracts restricted to them"""
+        subset = Roster()
+        for name in names:
+            subset[name] = self[name]
+        subset.move_to_mon = {move: mon for move, mon in self.move_to_mon.items() if mon.name in subset}
+        subset.ability_to_mon = {ability: mon for ability, mon in self.ability_to_mon.items() if mon.name in subset}
+        subset.move_rows = {move: row for move, row in self.move_rows.items() if move in subset.move_to_mon}
+        subset.mon_contracts = {name: self.mon_contracts[name] for name in names if name in self.mon_contracts}
+        for mon_contracts in subset.mon_contracts.values():
+            subset.contracts.update(mon_contracts)
+        return subset
+
+
+def read_mons_csv(file_path: str) -> Roster:
+    """Read mons.csv and return a Roster of mon name -> MonData"""
+    mons = Roster()
     with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
         reader = csv.DictReader(csvfile)
         for row in reader:
@@ -81,7 +140,7 @@ def read_mons_csv(file_path: str) -> Dict[str, MonData]:
     return mons
 
 
-def read_moves_csv(file_path: str, mons: Dict[str, MonData]) -> None:
+def read_moves_csv(file_path: str, mons: Roster) -> None:
     """Read moves.csv and populate move data for each mon"""
     with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
         reader = csv.DictReader(csvfile)
@@ -89,10 +148,11 @@ def read_moves_csv(file_path: str, mons: Dict[str, MonData]) -> None:
             move_name = row['Name'].strip()
             mon_name = row['Mon'].strip()
             if move_name and mon_name and mon_name in mons:
-                mons[mon_name].moves.append(move_name)
+                mons.add_move(mon_name, move_name)
+                mons.move_rows.setdefault(move_name, row)
 
 
-def read_abilities_csv(file_path: str, mons: Dict[str, MonData]) -> None:
+def read_abilities_csv(file_path: str, mons: Roster) -> None:
     """Read abilities.csv and populate ability data for each mon"""
     with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
         reader = csv.DictReader(csvfile)
@@ -101,7 +161,7 @@ def read_abilities_csv(file_path: str, mons: Dict[str, MonData]) -> None:
             mon_name = row['Mon'].strip()
 
             if ability_name and mon_name and mon_name in mons:
-                mons[mon_name].abilities.append(ability_name)
+                mons.add_ability(mon_name, ability_name)
 
 
 def convert_type_to_solidity(type_str: str) -> str:
@@ -122,165 +182,27 @@ def get_mon_directory_name(mon_name: str) -> str:
     return mon_name.lower()
 
 
-def analyze_gif(gif_path: str) -> dict:
-    """Analyze a GIF file and extract first frame data."""
-    print(f"\n  Analyzing: {os.path.basename(gif_path)}")
-
-    try:
-        with Image.open(gif_path) as img:
-            # Only extract the first frame
-            frame = img.convert('RGBA')
-            frame_array = np.array(frame)
-
-            # Collect all unique colors from first frame only
-            pixels = frame_array.reshape(-1, 4)  # RGBA
-            all_colors = set()
-            for pixel in pixels:
-                all_colors.add(tuple(pixel))
-
-            print(f"    Dimensions: {frame_array.shape[:2]} ")
-            print(f"    Unique colors: {len(all_colors)}")
-
-            # Check if more than 16 colors
-            if len(all_colors) > 16:
-                print(f"    ⚠️  WARNING: More than 16 colors detected! ({len(all_colors)} colors)")
-                print(f"        Consider reducing colors or using a different compression strategy.")
-
-            # Calculate bits needed
-            bits_needed = max(1, (len(all_colors) - 1).bit_length())
-            print(f"    Bits needed per pixel: {bits_needed}")
-
-            # Create color palette (sorted for consistency)
-            palette = sorted(list(all_colors))
-            color_to_index = {color: idx for idx, color in enumerate(palette)}
-
-            # Convert frame to indexed format
-            height, width = frame_array.shape[:2]
-            indexed_frame = np.zeros((height, width), dtype=np.uint8)
-            for y in range(height):
-                for x in range(width):
-                    color = tuple(frame_array[y, x])
-                    indexed_frame[y, x] = color_to_index[color]
-
-            return {
-                'path': gif_path,
-                'dimensions': frame_array.shape[:2],
-                'unique_colors': len(all_colors),
-                'bits_needed': bits_needed,
-                'palette': palette,
-                'indexed_frame': indexed_frame
-            }
-
-    except Exception as e:
-        print(f"    Error: {e}")
-        return None
-
-
-def compress_to_uint256(indexed_frame, bits_per_pixel: int) -> List[int]:
-    """Convert indexed frame to compressed uint256 values using simple bit packing."""
-    height, width = indexed_frame.shape
-
-    # Pack pixels into bits
-    bit_string = ""
-    for y in range(height):
-        for x in range(width):
-            pixel_value = indexed_frame[y, x]
-            bit_string = format(pixel_value, f'0{bits_per_pixel}b') + bit_string
-
-    # Split into 256-bit chunks (uint256)
-    uint256_values = []
-    for i in range(0, len(bit_string), 256):
-        chunk = bit_string[i:i+256]
-        # Pad with zeros if needed
-        chunk = chunk.ljust(256, '0')
-        # Convert to integer
-        uint_value = int(chunk, 2)
-        uint256_values.append(uint_value)
-
-    return uint256_values
-
-
-def compress_palette_to_uint256(palette: List[Tuple[int, int, int, int]]) -> List[int]:
-    """Convert color palette to compressed uint256 values.
-
-    Packs colors into uint256 words with a maximum of 10 colors per word (240 bits used, 16 bits unused).
-    This ensures no color is split across word boundaries for easier decoding.
-
-    Args:
-        palette: List of RGBA tuples from GIF analysis
-
-    Returns:
-        List of uint256 integers representing compressed palette data
-    """
-    uint256_values = []
-    colors_per_word = 10  # Maximum colors per uint256 (10 * 24 = 240 bits, 16 bits unused)
-
-    # Process colors in chunks of 10
-    for chunk_start in range(0, len(palette), colors_per_word):
-        chunk_end = min(chunk_start + colors_per_word, len(palette))
-        chunk_colors = palette[chunk_start:chunk_end]
-
-        # Build bit string for this chunk
-        bit_string = ""
-        for rgba in chunk_colors:
-            r, g, b, a = rgba
-
-            # Handle transparent color (0,0,0,0) with sentinel value
-            color_as_bits = ""
-            if r == 0 and g == 0 and b == 0 and a == 0:
-                # Use sentinel value: RGB(1,1,1) = 000000010000000100000001 in binary
-                color_as_bits = "000000010000000100000001"  # 24 bits total
-            else:
-                # Encode RGB values (ignore alpha), 8 bits per channel
-                color_as_bits = (format(r, '08b') + format(g, '08b') + format(b, '08b'))  # 24 bits total
-            
-            # Prepend to bit string (since we're packing from LSB to MSB)
-            bit_string = color_as_bits + bit_string
+def mon_metadata_entries(mon: MonData) -> List[Tuple[str, int]]:
+    """(key, value) metadata words for a mon's sprite, in the order they are written"""
+    entries = []
+    if mon.sprite_header is not None:
+        from sprite_codecs import HEADER_KEY
+        entries.append((HEADER_KEY, mon.sprite_header))
+    entries += [(f"IMG_{i}", value) for i, value in enumerate(mon.sprite_data)]
+    entries += [(f"TMAP_{i}", value) for i, value in enumerate(mon.tile_map_data)]
+    entries += [(f"PAL_{i}", value) for i, value in enumerate(mon.palette_data)]
+    entries += [(f"PREF_{i}", value) for i, value in enumerate(mon.palette_ref_data)]
+    return entries
 
-        # Pad to 256 bits (leave unused bits as zeros)
-        bit_string = bit_string.ljust(256, '0')
 
-        # Convert to integer and add to results
-        uint_value = int(bit_string, 2)
-        uint256_values.append(uint_value)
-
-    return uint256_values
-
-
-def analyze_sprite_images(base_path: str) -> Tuple[Dict[str, List[int]], Dict[str, List[int]]]:
-    """Analyze all mini GIF files and return sprite and palette data indexed by monster name."""
-    imgs_dir = os.path.join(base_path, "drool", "imgs")
-    sprite_data = {}
-    palette_data = {}
-
-    if not os.path.exists(imgs_dir):
-        print(f"Warning: Images directory not found: {imgs_dir}")
-        return sprite_data, palette_data
-
-    mini_gifs = [f for f in os.listdir(imgs_dir) if f.endswith('_mini.gif')]
-
-    for gif_file in sorted(mini_gifs):
-        # Extract monster name from filename (e.g., "inutia" from "inutia_mini.gif")
-        mon_name = gif_file.replace('_mini.gif', '').lower()
-
-        gif_path = os.path.join(imgs_dir, gif_file)
-        result = analyze_gif(gif_path)
-
-        if result:
-            # Compress frame to uint256 format
-            compressed_sprite = compress_to_uint256(result['indexed_frame'], result['bits_needed'])
-            sprite_data[mon_name] = compressed_sprite
-
-            # Compress palette to uint256 format
-            compressed_palette = compress_palette_to_uint256(result['palette'])
-            palette_data[mon_name] = compressed_palette
-
-            print(f"    Sprite: {len(compressed_sprite)} uint256 values")
-            print(f"    Palette: {len(compressed_palette)} uint256 values")
-        else:
-            print(f"    Failed to process {gif_file}")
-
-    return sprite_data, palette_data
+def sprite_words_saved(mon: MonData) -> int:
+    """Metadata words saved by the mon's sprite codec versus raw packing without a header"""
+    if mon.sprite_header is None:
+        return 0
+    from sprite_codecs import parse_header
+    fields = parse_header(mon.sprite_header)
+    raw_words = -(-fields['width'] * fields['height'] * fields['bits_per_pixel'] // 256)
+    return raw_words - len(mon.sprite_data) - 1
 
 
 def analyze_contract_dependencies(contract_path: str, base_path: str) -> Tuple[List[str], List[str]]:
@@ -290,56 +212,28 @@ def analyze_contract_dependencies(contract_path: str, base_path: str) -> Tuple[L
         tuple: (dependencies, import_paths) where dependencies is a list of dependency info
                and import_paths is a list of contract file paths that need to be imported
     """
-    dependencies = []
-    import_paths = []
-
     try:
         with open(contract_path, 'r', encoding='utf-8') as f:
             content = f.read()
-
-        # Look for constructor parameters to determine deployment dependencies
-        contracts_imported = set()
-        constructor_match = re.search(r'constructor\s*\([^)]*\)', content, re.MULTILINE | re.DOTALL)
-        if constructor_match:
-            constructor_text = constructor_match.group(0)
-
-            # Extract parameter names that start with underscore
-            param_matches = re.findall(r'(\w+)\s+(\w+)', constructor_text)
-            for param_type, param_name in param_matches:
-                # Remove leading underscore for environment variable name
-                env_name = param_name.upper()
-                if env_name.startswith("_"):
-                    env_name = env_name[1:]
-                dependencies.append({
-                    "name": env_name,
-                    "type": param_type
-                })
-                contracts_imported.add(param_type)
-
-        # Parse import statements to get the contracts that need to be imported
-        import_pattern = r'import\s+\{([^}]+)\}\s+from\s+"([^"]+)"'
-        import_matches = re.findall(import_pattern, content)
-        for contracts_str, import_path in import_matches:    
-            if contracts_str not in contracts_imported:
-                continue
-            # Convert relative import path to absolute file path
-            if import_path.startswith("../../"):
-                path = import_path.replace("../../", "src/")
-                import_paths.append(path)
-            elif not import_path.startswith("forge-std/"):
-                # Handle relative imports without "../"
-                abs_path = os.path.join(os.path.dirname(contract_path), import_path)
-                import_paths.append(abs_path)
+        return resolve_dependencies(parse_solidity_source(content), contract_path)
 
     except FileNotFoundError:
         print(f"Warning: Contract file not found: {contract_path}")
     except Exception as e:
         print(f"Warning: Error analyzing contract {contract_path}: {e}")
 
-    return dependencies, import_paths
+    return [], []
+
 
+def get_contract_dependencies(contract_path: str, base_path: str,
+                              index: Optional[SolidityIndex] = None) -> Tuple[List[str], List[str]]:
+    """Look up a contract's dependencies in the index, falling back to parsing the file directly"""
+    if index is not None:
+        return index.dependencies(contract_path)
+    return analyze_contract_dependencies(contract_path, base_path)
 
-def get_contracts_for_mon(mon: MonData, base_path: str) -> Dict[str, ContractInfo]:
+
+def get_contracts_for_mon(mon: MonData, base_path: str, index: Optional[SolidityIndex] = None) -> Dict[str, ContractInfo]:
     """Get all contracts needed for a specific mon"""
     contracts = {}
     mon_dir = get_mon_directory_name(mon.name)
@@ -350,7 +244,7 @@ def get_contracts_for_mon(mon: MonData, base_path: str) -> Dict[str, ContractInf
         contract_path = os.path.join(base_path, "src", "mons", mon_dir, f"{contract_name}.sol")
 
         if contract_name not in contracts:
-            dependencies, import_paths = analyze_contract_dependencies(contract_path, base_path)
+            dependencies, import_paths = get_contract_dependencies(contract_path, base_path, index)
             contracts[contract_name] = ContractInfo(move_name, contract_path, dependencies, import_paths)
 
     # Collect ability contracts
@@ -359,53 +253,243 @@ def get_contracts_for_mon(mon: MonData, base_path: str) -> Dict[str, ContractInf
         contract_path = os.path.join(base_path, "src", "mons", mon_dir, f"{contract_name}.sol")
 
         if contract_name not in contracts:
-            dependencies, import_paths = analyze_contract_dependencies(contract_path, base_path)
+            dependencies, import_paths = get_contract_dependencies(contract_path, base_path, index)
             contracts[contract_name] = ContractInfo(ability_name, contract_path, dependencies, import_paths)
 
     return contracts
 
 
-def collect_all_contracts(mons: Dict[str, MonData], base_path: str) -> Dict[str, ContractInfo]:
-    """Collect all unique contracts that need to be deployed"""
+def collect_all_contracts(mons: Roster, base_path: str, index: Optional[SolidityIndex] = None) -> Dict[str, ContractInfo]:
+    """Collect all unique contracts that need to be deployed, recording them on the roster"""
     contracts = {}
 
     for mon in mons.values():
-        mon_contracts = get_contracts_for_mon(mon, base_path)
+        mon_contracts = get_contracts_for_mon(mon, base_path, index)
+        mons.mon_contracts[mon.name] = mon_contracts
         contracts.update(mon_contracts)
 
+    mons.contracts = contracts
     return contracts
 
 
-def generate_deploy_function_for_mon(mon: MonData, base_path: str, include_color: bool = False) -> List[str]:
-    """Generate the deploy function for a specific mon"""
+def build_roster_deploy_graph(mons: Roster, index: SolidityIndex,
+                              external_contracts: List[str] = DEFAULT_EXTERNAL_CONTRACTS) -> DeployGraph:
+    """Build the constructor dependency graph of every move/ability contract in the roster"""
+    contracts = {contract_name: (contract.contract_path, contract.name, mons.owner_of(contract.name).name)
+                 for contract_name, contract in mons.contracts.items()}
+    return build_deploy_graph(contracts, index, external_contracts)
+
+
+def classify_standard_attacks(mons: Roster, artifacts_dir: Optional[str] = None) -> List[ContractInfo]:
+    """Mark move contracts that are plain StandardAttacks to be created through StandardAttackFactory.
+
+    Prints which moves qualify (or why a move that looks standard doesn't) and the estimated
+    gas saved versus deploying each move's own contract.
+    """
+    standard = []
+    bespoke_gas = 0
+    factory_gas = 0
+    factory_code_bytes = runtime_bytes("StandardAttack", artifacts_dir)
+    for contract_name, contract in mons.contracts.items():
+        row = mons.move_rows.get(contract.name)
+        if row is None:
+            continue
+        try:
+            with open(contract.contract_path, 'r', encoding='utf-8') as f:
+                source = f.read()
+        except OSError:
+            continue
+        params, reason = classify_standard_attack(source, row)
+        if params is None:
+            if reason != "custom contract":
+                print(f"  {contract.name}: kept as its own contract ({reason})")
+            continue
+        contract.standard_attack = params
+        standard.append(contract)
+        bespoke_gas += estimate_deploy_gas(runtime_bytes(contract_name, artifacts_dir), len(contract.dependencies))
+        factory_gas += estimate_factory_create_gas(factory_code_bytes)
+        print(f"  {contract.name}: standard attack ({describe_attack_params(params)})")
+
+    print(f"{len(standard)} of {len(mons.move_rows)} moves created through StandardAttackFactory: "
+          f"{len(standard)} fewer bespoke contracts to compile and deploy, "
+          f"~{bespoke_gas - factory_gas:,} deploy gas saved (~{bespoke_gas:,} -> ~{factory_gas:,})")
+    return standard
+
+
+def constructor_arguments(dependencies: List[Tuple[dict, Optional[str]]], graph: Optional[DeployGraph]) -> str:
+    """Constructor arguments: shared dependencies deployed by the script, anything else read from env"""
+    args = []
+    for dep, target in dependencies:
+        if target is None:
+            args.append(f"{dep['type']}(vm.envAddress(\"{dep['name']}\"))")
+        elif dep["type"] == target:
+            args.append(graph.nodes[target].variable_name)
+        else:
+            args.append(f"{dep['type']}(address({graph.nodes[target].variable_name}))")
+    return ", ".join(args)
+
+
+METADATA_ENCODINGS = ("literal", "hex")
+NUMBERED_KEY_PATTERN = re.compile(r"^(.*?)(\d+)$")
+
+
+def numbered_key_runs(keys: List[str]) -> List[Tuple[int, str, int, int]]:
+    """Group keys into runs of consecutively numbered keys with the same prefix.
+
+    Returns (position, prefix, first number, run length) tuples; keys that aren't numbered
+    get a run of length 1 with the whole key as the prefix and first number -1.
+    """
+    runs = []
+    for position, key in enumerate(keys):
+        match = NUMBERED_KEY_PATTERN.match(key)
+        if match:
+            prefix, number = match.group(1), int(match.group(2))
+            if runs and runs[-1][1] == prefix and runs[-1][2] >= 0 and runs[-1][2] + runs[-1][3] == number:
+                runs[-1] = runs[-1][:3] + (runs[-1][3] + 1,)
+                continue
+            runs.append((position, prefix, number, 1))
+        else:
+            runs.append((position, key, -1, 1))
+    return runs
+
+
+def hex_metadata_array_lines(entries: List[Tuple[str, int]]) -> List[str]:
+    """Declare keys/values arrays filled from one hex"..." literal of all values.
+
+    Values are concatenated as 32-byte big-endian words and copied out in a loop; runs of
+    numbered keys such as IMG_0..IMG_9 are built in a loop with vm.toString.
+    """
+    count = len(entries)
+    blob = "".join(f"{value:064x}" for _, value in entries)
+    lines = [
+        f"        bytes memory data = hex\"{blob}\";",
+        f"        bytes32[] memory keys = new bytes32[]({count});",
+        f"        bytes32[] memory values = new bytes32[]({count});",
+        f"        for (uint256 i = 0; i < {count}; i++) {{",
+        "            bytes32 word;",
+        "            assembly (\"memory-safe\") {",
+        "                word := mload(add(data, mul(add(i, 1), 32)))",
+        "            }",
+        "            values[i] = word;",
+        "        }",
+    ]
+    for position, prefix, first, length in numbered_key_runs([key for key, _ in entries]):
+        if length == 1:
+            lines.append(f"        keys[{position}] = bytes32(\"{entries[position][0]}\");")
+            continue
+        index = f"{position} + i" if position else "i"
+        number = f"{first} + i" if first else "i"
+        lines.extend([
+            f"        for (uint256 i = 0; i < {length}; i++) {{",
+            f"            keys[{index}] = bytes32(abi.encodePacked(\"{prefix}\", vm.toString({number})));",
+            "        }",
+        ])
+    return lines
+
+
+def metadata_array_lines(entries: List[Tuple[str, int]], encoding: str = "literal") -> List[str]:
+    """Declare and fill keys/values arrays for registry metadata.
+
+    encoding "literal" assigns every key and value in its own statement; "hex" packs the
+    values into one bytes literal (see hex_metadata_array_lines).
+    """
+    if encoding == "hex" and entries:
+        return hex_metadata_array_lines(entries)
+    lines = [
+        f"        bytes32[] memory keys = new bytes32[]({len(entries)});",
+        f"        bytes32[] memory values = new bytes32[]({len(entries)});"
+    ]
+    for i, (key, value) in enumerate(entries):
+        lines.append(f"        keys[{i}] = bytes32(\"{key}\");")
+        lines.append(f"        values[{i}] = bytes32(uint256({value}));")
+    return lines
+
+
+def estimate_mon_gas(mon: MonData, mon_contracts: Dict[str, ContractInfo], include_color: bool = False,
+                     artifacts_dir: Optional[str] = None) -> MonGasEstimate:
+    """Estimate the gas of deploying a mon's contracts and creating it in the registry"""
+    contract_gas = {}
+    for contract in mon_contracts.values():
+        contract_name = contract_name_from_move_or_ability(contract.name)
+        if contract.standard_attack:
+            contract_gas[contract_name] = estimate_factory_create_gas(runtime_bytes("StandardAttack", artifacts_dir))
+        else:
+            contract_gas[contract_name] = estimate_deploy_gas(runtime_bytes(contract_name, artifacts_dir),
+                                                              len(contract.dependencies))
+    metadata_words = len(mon_metadata_entries(mon)) if include_color else 0
+    return MonGasEstimate(mon.mon_id, mon.name, contract_gas,
+                          estimate_create_mon_gas(len(mon.moves), len(mon.abilities), metadata_words), metadata_words)
+
+
+def generate_deploy_function_for_mon(mon: MonData, base_path: str, include_color: bool = False,
+                                     index: Optional[SolidityIndex] = None,
+                                     mon_contracts: Optional[Dict[str, ContractInfo]] = None,
+                                     resumable: bool = False, metadata_encoding: str = "literal",
+                                     graph: Optional[DeployGraph] = None) -> List[str]:
+    """Generate the deploy function for a specific mon.
+
+    A resumable function returns early, deploying nothing, if the mon already exists in the
+    registry, so a batch script that failed part way through can simply be run again.
+
+    With a deploy graph, constructor dependencies come from the script's shared deployments,
+    and the mon's own contracts that other contracts depend on are taken from there too
+    instead of being deployed again.
+    """
     function_name = f"deploy{mon.name.replace(' ', '')}"
     lines = []
 
     lines.append(f"    function {function_name}(DefaultMonRegistry registry) internal returns (DeployData[] memory) {{")
 
-    # Get contracts for this mon
-    mon_contracts = get_contracts_for_mon(mon, base_path)
+    if resumable:
+        lines.extend([
+            "        // Skip mons created by an earlier run of this script",
+            f"        MonStats memory existingStats = registry.getMonStats({mon.mon_id});",
+            "        if (existingStats.hp != 0 && existingStats.stamina != 0) {",
+            "            return new DeployData[](0);",
+            "        }",
+            ""
+        ])
+
+    # Get contracts for this mon, unless they were already collected
+    if mon_contracts is None:
+        mon_contracts = get_contracts_for_mon(mon, base_path, index)
+
+    shared = set(graph.shared()) if graph else set()
 
     # Create array to track deployed contracts
-    num_contracts = len(mon_contracts) if mon_contracts else 0
+    num_contracts = len([name for name in mon_contracts if name not in shared]) if mon_contracts else 0
     lines.append(f"        DeployData[] memory deployedContracts = new DeployData[]({num_contracts});")
     lines.append("        uint256 contractIndex = 0;")
     lines.append("")
 
+    if mon_contracts and any(contract.standard_attack for contract in mon_contracts.values()):
+        lines.append("        StandardAttackFactory standardAttackFactory = "
+                     "StandardAttackFactory(vm.envAddress(\"STANDARD_ATTACK_FACTORY\"));")
+        lines.append("")
+
     if mon_contracts:
         # Deploy contracts
         for contract in mon_contracts.values():
             contract_name = contract_name_from_move_or_ability(contract.name)
 
-            # Build constructor arguments
-            constructor_args = []
-            for dep in contract.dependencies:
-                contract_type = dep["type"]
-                env_name = dep["name"]
-                constructor_args.append(f"{contract_type}(vm.envAddress(\"{env_name}\"))")
+            if contract_name in shared:
+                node = graph.nodes[contract_name]
+                lines.append(f"        {contract_name} {contract.variable_name} = {node.variable_name};")
+                lines.append("")
+                continue
 
-            args_str = ", ".join(constructor_args)
-            lines.append(f"        {contract_name} {contract.variable_name} = new {contract_name}({args_str});")
+            if contract.standard_attack:
+                params = contract.standard_attack
+                lines.append(f"        // {describe_attack_params(params)}")
+                lines.append(f"        StandardAttack {contract.variable_name} = createStandardAttack("
+                             f"standardAttackFactory, \"{params['NAME']}\", {hex(pack_attack_params(params))});")
+            else:
+                # Build constructor arguments
+                if graph:
+                    args_str = constructor_arguments(graph.nodes[contract_name].args, graph)
+                else:
+                    args_str = constructor_arguments([(dep, None) for dep in contract.dependencies], None)
+                lines.append(f"        {contract_name} {contract.variable_name} = new {contract_name}({args_str});")
 
             # Add to deployed contracts array
             lines.append(f"        deployedContracts[contractIndex] = DeployData({{")
@@ -456,27 +540,11 @@ def generate_deploy_function_for_mon(mon: MonData, base_path: str, include_color
 
     # Generate metadata arrays with sprite and palette data (if color flag is enabled)
     if include_color:
-        total_metadata_count = len(mon.sprite_data) + len(mon.palette_data)
-
-        if total_metadata_count > 0:
-            lines.extend([
-                f"        bytes32[] memory keys = new bytes32[]({total_metadata_count});",
-                f"        bytes32[] memory values = new bytes32[]({total_metadata_count});"
-            ])
-
-            metadata_index = 0
+        # Sprite header, sprite data as IMG_0, IMG_1, ..., then palette data as PAL_0, PAL_1, ...
+        entries = mon_metadata_entries(mon)
 
-            # Add sprite data as IMG_0, IMG_1, IMG_2, etc.
-            for i, uint256_value in enumerate(mon.sprite_data):
-                lines.append(f"        keys[{metadata_index}] = bytes32(\"IMG_{i}\");")
-                lines.append(f"        values[{metadata_index}] = bytes32(uint256({uint256_value}));")
-                metadata_index += 1
-
-            # Add palette data as PAL_0, PAL_1, PAL_2, etc.
-            for i, uint256_value in enumerate(mon.palette_data):
-                lines.append(f"        keys[{metadata_index}] = bytes32(\"PAL_{i}\");")
-                lines.append(f"        values[{metadata_index}] = bytes32(uint256({uint256_value}));")
-                metadata_index += 1
+        if entries:
+            lines.extend(metadata_array_lines(entries, metadata_encoding))
         else:
             lines.extend([
                 "        bytes32[] memory keys = new bytes32[](0);",
@@ -499,36 +567,59 @@ def generate_deploy_function_for_mon(mon: MonData, base_path: str, include_color
     return lines
 
 
-def generate_solidity_script(mons: Dict[str, MonData], contracts: Dict[str, ContractInfo], base_path: str, include_color: bool = False) -> str:
-    """Generate the complete Solidity deployment script"""
+SCRIPT_HEADER_LINES = [
+    "// SPDX-License-Identifier: AGPL-3.0",
+    "// Created by mon_stats_to_sol.py",
+    "pragma solidity ^0.8.0;",
+    "",
+]
+
+SCRIPT_BASE_IMPORTS = [
+    "import {Script} from \"forge-std/Script.sol\";",
+    "import {DefaultMonRegistry} from \"../src/teams/DefaultMonRegistry.sol\";",
+    "import {MonStats} from \"../src/Structs.sol\";",
+    "import {Type} from \"../src/Enums.sol\";",
+    "import {IMoveSet} from \"../src/moves/IMoveSet.sol\";",
+    "import {IAbility} from \"../src/abilities/IAbility.sol\";",
+    "",
+]
+
+DEPLOY_DATA_STRUCT = [
+    "struct DeployData {",
+    "    string name;",
+    "    address contractAddress;",
+    "}",
+]
+
+
+def contract_import_lines(mons: Roster, contracts: Dict[str, ContractInfo], base_path: str,
+                          graph: Optional[DeployGraph] = None) -> List[str]:
+    """Sorted import lines for the given move/ability contracts and their constructor dependencies,
+    plus the graph's shared dependencies if a deploy graph is given"""
+    all_import_paths = set()
 
-    # Generate imports
-    imports = [
-        "// SPDX-License-Identifier: AGPL-3.0",
-        "// Created by mon_stats_to_sol.py",
-        "pragma solidity ^0.8.0;",
-        "",
-        "import {Script} from \"forge-std/Script.sol\";",
-        "import {DefaultMonRegistry} from \"../src/teams/DefaultMonRegistry.sol\";",
-        "import {MonStats} from \"../src/Structs.sol\";",
-        "import {Type} from \"../src/Enums.sol\";",
-        "import {IMoveSet} from \"../src/moves/IMoveSet.sol\";",
-        "import {IAbility} from \"../src/abilities/IAbility.sol\";",
-        ""
-    ]
+    if any(contract.standard_attack for contract in contracts.values()):
+        all_import_paths.update([
+            ("StandardAttack", "../src/moves/StandardAttack.sol"),
+            ("StandardAttackFactory", "../src/moves/StandardAttackFactory.sol"),
+            ("ATTACK_PARAMS", "../src/moves/StandardAttackStructs.sol"),
+            ("IEffect", "../src/effects/IEffect.sol"),
+            ("MoveClass", "../src/Enums.sol"),
+        ])
 
-    # Collect all import paths and deduplicate
-    all_import_paths = set()
+    if graph:
+        for name in graph.shared():
+            node = graph.nodes[name]
+            for path in [node.path] + node.import_paths:
+                rel_path = "../" + os.path.relpath(path, base_path).replace("\\", "/")
+                all_import_paths.add((os.path.splitext(os.path.basename(path))[0], rel_path))
 
     # Add contract imports for main contracts (moves/abilities)
     for contract in contracts.values():
-        mon_dir = None
-        for mon in mons.values():
-            if contract.name in mon.moves or contract.name in mon.abilities:
-                mon_dir = get_mon_directory_name(mon.name)
-                break
+        owner = mons.owner_of(contract.name)
 
-        if mon_dir:
+        if owner and not contract.standard_attack:
+            mon_dir = get_mon_directory_name(owner.name)
             contract_name = contract_name_from_move_or_ability(contract.name)
             import_path = f"../src/mons/{mon_dir}/{contract_name}.sol"
             all_import_paths.add((contract_name, import_path))
@@ -545,18 +636,15 @@ def generate_solidity_script(mons: Dict[str, MonData], contracts: Dict[str, Cont
 
     # Sort imports for consistent output
     sorted_imports = sorted(all_import_paths, key=lambda x: x[1])
-    for contract_name, import_path in sorted_imports:
-        imports.append(f"import {{{contract_name}}} from \"{import_path}\";")
+    return [f"import {{{contract_name}}} from \"{import_path}\";" for contract_name, import_path in sorted_imports]
 
-    imports.append("")
 
-    # Generate contract header and main run function
-    contract_lines = [
-        "struct DeployData {",
-        "    string name;",
-        "    address contractAddress;",
-        "}",
-        "contract SetupMons is Script {",
+def generate_run_function(mons: Roster, include_color: bool = False, deploy_shared: bool = False) -> List[str]:
+    """Generate run(), which calls every mon's deploy function and flattens the deployment data.
+
+    With deploy_shared, shared dependencies are deployed first by deploySharedDependencies.
+    """
+    lines = [
         "    function run() external returns (DeployData[] memory deployedContracts) {",
         "        vm.startBroadcast();",
         "",
@@ -568,19 +656,29 @@ def generate_solidity_script(mons: Dict[str, MonData], contracts: Dict[str, Cont
     # Add calls to individual deploy functions and collect deployment data
     sorted_mons = sorted(mons.values(), key=lambda m: m.mon_id)
     num_mons = len(sorted_mons)
+    offset = 1 if deploy_shared else 0
 
-    contract_lines.extend([
+    lines.extend([
         "        // Deploy all mons and collect deployment data",
-        f"        DeployData[][] memory allDeployData = new DeployData[][]({num_mons});",
+        f"        DeployData[][] memory allDeployData = new DeployData[][]({num_mons + offset});",
         ""
     ])
+    if deploy_shared:
+        lines.append("        allDeployData[0] = deploySharedDependencies();")
 
     # Generate calls to collect deployment data from each function
     for i, mon in enumerate(sorted_mons):
         function_name = f"deploy{mon.name.replace(' ', '')}"
-        contract_lines.append(f"        allDeployData[{i}] = {function_name}(registry);")
+        lines.append(f"        allDeployData[{i + offset}] = {function_name}(registry);")
+
+    # Store sprite data shared by every mon once, under a reserved mon id
+    if include_color and mons.shared_metadata:
+        lines.extend([
+            "",
+            "        storeSharedSpriteData(registry);"
+        ])
 
-    contract_lines.extend([
+    lines.extend([
         "",
         "        // Calculate total length for flattened array",
         "        uint256 totalLength = 0;",
@@ -604,11 +702,84 @@ def generate_solidity_script(mons: Dict[str, MonData], contracts: Dict[str, Cont
         "    }",
         ""
     ])
+    return lines
+
+
+def generate_shared_sprite_function(shared_metadata: List[Tuple[str, int]],
+                                    metadata_encoding: str = "literal") -> List[str]:
+    """Generate storeSharedSpriteData, which stores sprite data shared by all mons under a reserved mon id"""
+    lines = ["    function storeSharedSpriteData(DefaultMonRegistry registry) internal {"]
+    lines.extend(metadata_array_lines(shared_metadata, metadata_encoding))
+    lines.extend([
+        "        registry.modifyMonMetadata(type(uint256).max, keys, values);",
+        "    }",
+        ""
+    ])
+    return lines
+
+
+def generate_shared_dependencies_function(graph: DeployGraph) -> List[str]:
+    """Generate deploySharedDependencies, which deploys each shared dependency once, level by level"""
+    shared = set(graph.shared())
+    lines = [
+        "    function deploySharedDependencies() internal returns (DeployData[] memory) {",
+        f"        DeployData[] memory deployedContracts = new DeployData[]({len(shared)});",
+        "        uint256 contractIndex = 0;",
+        ""
+    ]
+    for level, names in enumerate(graph.levels()):
+        level_names = [name for name in names if name in shared]
+        if not level_names:
+            continue
+        lines.append(f"        // Level {level}: independent of each other")
+        for name in level_names:
+            node = graph.nodes[name]
+            lines.append(f"        {node.variable_name} = new {name}({constructor_arguments(node.args, graph)});")
+            lines.append(f"        deployedContracts[contractIndex] = DeployData({{")
+            lines.append(f"            name: \"{node.label}\",")
+            lines.append(f"            contractAddress: address({node.variable_name})")
+            lines.append("        });")
+            lines.append("        contractIndex++;")
+        lines.append("")
+    lines.extend([
+        "        return deployedContracts;",
+        "    }",
+        ""
+    ])
+    return lines
+
+
+def generate_solidity_script(mons: Roster, contracts: Dict[str, ContractInfo], base_path: str, include_color: bool = False,
+                             index: Optional[SolidityIndex] = None, script_name: str = "SetupMons",
+                             resumable: bool = False, metadata_encoding: str = "literal",
+                             graph: Optional[DeployGraph] = None) -> str:
+    """Generate the complete Solidity deployment script.
+
+    With a deploy graph the script deploys shared constructor dependencies itself, once each,
+    instead of reading their addresses from env.
+    """
+    imports = SCRIPT_HEADER_LINES + SCRIPT_BASE_IMPORTS + contract_import_lines(mons, contracts, base_path, graph) + [""]
+    if any(contract.standard_attack for contract in contracts.values()):
+        imports.extend(create_standard_attack_function())
+
+    # Generate contract header and main run function
+    contract_lines = DEPLOY_DATA_STRUCT + [f"contract {script_name} is Script {{"]
+    if graph:
+        contract_lines.extend(f"    {name} {graph.nodes[name].variable_name};" for name in graph.shared())
+        contract_lines.append("")
+    contract_lines.extend(generate_run_function(mons, include_color, deploy_shared=graph is not None))
 
     # Generate individual deploy functions for each mon
     deploy_functions = []
+    if graph:
+        deploy_functions.extend(generate_shared_dependencies_function(graph))
     for mon in sorted(mons.values(), key=lambda m: m.mon_id):
-        deploy_functions.extend(generate_deploy_function_for_mon(mon, base_path, include_color))
+        deploy_functions.extend(generate_deploy_function_for_mon(mon, base_path, include_color, index,
+                                                                 mons.mon_contracts.get(mon.name), resumable,
+                                                                 metadata_encoding, graph))
+
+    if include_color and mons.shared_metadata:
+        deploy_functions.extend(generate_shared_sprite_function(mons.shared_metadata, metadata_encoding))
 
     # Generate contract footer
     contract_footer = ["}"]
@@ -618,56 +789,353 @@ def generate_solidity_script(mons: Dict[str, MonData], contracts: Dict[str, Cont
     return "\n".join(all_lines)
 
 
-def main():
-    """Main function to generate the deployment script"""
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description='Generate Solidity deployment script for mons')
-    parser.add_argument('--color', action='store_true',
-                       help='Include sprite and palette color data in the generated script')
-    args = parser.parse_args()
+def write_batch_scripts(mons: Roster, base_path: str, include_color: bool, index: Optional[SolidityIndex],
+                        gas_budget: int, artifacts_dir: Optional[str] = None,
+                        metadata_encoding: str = "literal") -> List[str]:
+    """Write one resumable SetupMonsBatch<k>.s.sol per gas-bounded batch plus SetupMonsBatches.json"""
+    sorted_mons = sorted(mons.values(), key=lambda m: m.mon_id)
+    estimates = [estimate_mon_gas(mon, mons.mon_contracts.get(mon.name, {}), include_color, artifacts_dir)
+                 for mon in sorted_mons]
+    batches = plan_batches(estimates, gas_budget)
+
+    script_paths = []
+    for batch in batches:
+        script_name = f"SetupMonsBatch{batch.index}"
+        batch_mons = mons.subset([estimate.name for estimate in batch.mons])
+        # Sprite data shared by all mons is stored by the first batch
+        if batch.index == 0:
+            batch_mons.shared_metadata = mons.shared_metadata
+
+        output_path = os.path.join(base_path, "script", f"{script_name}.s.sol")
+        solidity_code = generate_solidity_script(batch_mons, batch_mons.contracts, base_path, include_color, index,
+                                                 script_name=script_name, resumable=True,
+                                                 metadata_encoding=metadata_encoding)
+        status = "Generated" if write_if_changed(output_path, solidity_code) else "Unchanged"
+        over_budget = " (over budget: single mon)" if batch.gas > gas_budget else ""
+        print(f"{status} {output_path}: mon ids {batch.mon_ids}, ~{batch.gas:,} gas{over_budget}")
+        script_paths.append(os.path.relpath(output_path, base_path).replace("\\", "/"))
+
+    manifest_path = os.path.join(base_path, "script", "SetupMonsBatches.json")
+    manifest = batch_manifest(batches, script_paths, gas_budget)
+    write_if_changed(manifest_path, json.dumps(manifest, indent=2) + "\n")
+    total = sum(batch.gas for batch in batches)
+    print(f"Planned {len(batches)} batches for {len(sorted_mons)} mons (~{total:,} gas total, "
+          f"budget {gas_budget:,}); manifest: {manifest_path}")
+    return script_paths
+
+
+def write_deploy_graph_manifest(graph: DeployGraph, base_path: str) -> str:
+    """Print the deploy levels and write them to script/SetupMonsDeployGraph.json"""
+    manifest = graph_manifest(graph, base_path)
+    for level, names in enumerate(manifest["levels"]):
+        print(f"  Level {level}: {len(names)} independent deploys ({', '.join(names)})")
+    print(f"Deploying {len(manifest['shared'])} shared dependencies once each: "
+          f"{', '.join(entry['contract'] for entry in manifest['shared'])}")
+    if manifest["external"]:
+        print(f"Read from env: {', '.join(f'{env} ({name})' for env, name in sorted(manifest['external'].items()))}")
+    for env_name, dep_type in sorted(manifest["unresolved"].items()):
+        print(f"Warning: no deployable contract for {env_name} ({dep_type}); reading it from env")
+
+    manifest_path = os.path.join(base_path, "script", "SetupMonsDeployGraph.json")
+    write_if_changed(manifest_path, json.dumps(manifest, indent=2) + "\n")
+    print(f"Deploy graph manifest: {manifest_path}")
+    return manifest_path
+
+
+SHARD_NAME_PATTERN = re.compile(r"^SetupMon(?:[A-Z]\w*|sSharedSprites)\.s\.sol$")
+SHARED_SPRITES_SHARD = "SetupMonsSharedSprites"
+
+
+def shard_contract_name(mon: MonData) -> str:
+    return f"SetupMon{mon.name.replace(' ', '')}"
+
+
+def generate_shard_run_function(call: str, returns_data: bool = True) -> List[str]:
+    """run() of a shard script: one call between startBroadcast and stopBroadcast"""
+    signature = "run() external returns (DeployData[] memory deployedContracts)" if returns_data else "run() external"
+    return [
+        f"    function {signature} {{",
+        "        vm.startBroadcast();",
+        "        DefaultMonRegistry registry = DefaultMonRegistry(vm.envAddress(\"DEFAULT_MON_REGISTRY\"));",
+        f"        {'deployedContracts = ' if returns_data else ''}{call}(registry);",
+        "        vm.stopBroadcast();",
+        "    }",
+        "",
+    ]
 
-    base_path = "."  # Assume script is run from repository root
 
-    # Read CSV data
+def generate_mon_shard(mon: MonData, mons: Roster, base_path: str, include_color: bool = False,
+                       index: Optional[SolidityIndex] = None, metadata_encoding: str = "literal") -> str:
+    """Generate SetupMon<Name>.s.sol: a standalone script that deploys one mon"""
+    mon_contracts = mons.mon_contracts.get(mon.name, {})
+    lines = SCRIPT_HEADER_LINES + SCRIPT_BASE_IMPORTS[:-1]
+    lines.append("import {DeployData} from \"./DeployData.sol\";")
+    lines.extend(contract_import_lines(mons, mon_contracts, base_path))
+    if any(contract.standard_attack for contract in mon_contracts.values()):
+        lines.extend([""] + create_standard_attack_function()[:-1])
+    lines.extend(["", f"contract {shard_contract_name(mon)} is Script {{"])
+    lines.extend(generate_shard_run_function(f"deploy{mon.name.replace(' ', '')}"))
+    lines.extend(generate_deploy_function_for_mon(mon, base_path, include_color, index, mon_contracts,
+                                                  metadata_encoding=metadata_encoding))
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def generate_shared_sprites_shard(shared_metadata: List[Tuple[str, int]], metadata_encoding: str = "literal") -> str:
+    """Generate SetupMonsSharedSprites.s.sol: a standalone script storing the shared sprite data"""
+    return "\n".join(SCRIPT_HEADER_LINES + SCRIPT_BASE_IMPORTS[:2] +
+                     ["", f"contract {SHARED_SPRITES_SHARD} is Script {{"] +
+                     generate_shard_run_function("storeSharedSpriteData", returns_data=False) +
+                     generate_shared_sprite_function(shared_metadata, metadata_encoding) + ["}"])
+
+
+def shard_manifest(mons: Roster, include_color: bool = False) -> dict:
+    """The shard scripts in the order to run them: mons by id, then the shared sprite data"""
+    scripts = [{"script": f"script/{shard_contract_name(mon)}.s.sol", "contract": shard_contract_name(mon),
+                "mon_ids": [mon.mon_id], "mons": [mon.name]}
+               for mon in sorted(mons.values(), key=lambda m: m.mon_id)]
+    if include_color and mons.shared_metadata:
+        scripts.append({"script": f"script/{SHARED_SPRITES_SHARD}.s.sol", "contract": SHARED_SPRITES_SHARD,
+                        "mon_ids": [], "mons": []})
+    return {"scripts": scripts}
+
+
+def shard_files(mons: Roster, base_path: str, include_color: bool, index: Optional[SolidityIndex],
+                metadata_encoding: str = "literal") -> Dict[str, str]:
+    """File name under script/ -> text of every file the sharded layout writes"""
+    files = {"DeployData.sol": "\n".join(SCRIPT_HEADER_LINES + DEPLOY_DATA_STRUCT)}
+    for mon in sorted(mons.values(), key=lambda m: m.mon_id):
+        files[f"{shard_contract_name(mon)}.s.sol"] = generate_mon_shard(mon, mons, base_path, include_color, index,
+                                                                     metadata_encoding)
+    if include_color and mons.shared_metadata:
+        files[f"{SHARED_SPRITES_SHARD}.s.sol"] = generate_shared_sprites_shard(mons.shared_metadata,
+                                                                             metadata_encoding)
+    files["SetupMonsShards.json"] = json.dumps(shard_manifest(mons, include_color), indent=2) + "\n"
+    return files
+
+
+def write_sharded_scripts(mons: Roster, base_path: str, include_color: bool,
+                          index: Optional[SolidityIndex], metadata_encoding: str = "literal") -> List[str]:
+    """Write one standalone SetupMon<Name>.s.sol script per mon plus SetupMonsShards.json.
+
+    Each shard is a concrete script with its own run(), so it compiles to its own artifact and
+    an edit to one mon leaves the other shards' cached builds valid. Nothing imports the shards;
+    SetupMonsShards.json lists them in the order to run them with `forge script`. Only files
+    whose text changed are rewritten. Shards of mons no longer in the roster, the shared sprite
+    shard when there is no shared data, and a SetupMons.s.sol aggregator left by earlier
+    versions (which inherited every shard) are removed.
+    """
+    script_dir = os.path.join(base_path, "script")
+    files = shard_files(mons, base_path, include_color, index, metadata_encoding)
+    written = [name for name, content in files.items() if write_if_changed(os.path.join(script_dir, name), content)]
+
+    # Remove generated files that are no longer part of the deployment
+    removed = []
+    for name in sorted(os.listdir(script_dir)):
+        if not ((SHARD_NAME_PATTERN.match(name) and name not in files) or name == "SetupMons.s.sol"):
+            continue
+        path = os.path.join(script_dir, name)
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        if not text.startswith("\n".join(SCRIPT_HEADER_LINES[:2])):
+            continue
+        # SetupMons.s.sol only goes if it is the old aggregator, not the monolithic script
+        if name == "SetupMons.s.sol" and "contract SetupMons is Script, SetupMon" not in text:
+            continue
+        os.remove(path)
+        removed.append(name)
+
+    for name in written:
+        print(f"  Wrote {os.path.join(script_dir, name)}")
+    for name in removed:
+        print(f"  Removed stale {os.path.join(script_dir, name)}")
+    print(f"Sharded deployment scripts: {len(written)} of {len(files)} files rewritten, "
+          f"{len(files) - len(written)} unchanged, {len(removed)} removed")
+    print(f"Run the scripts in {os.path.join(script_dir, 'SetupMonsShards.json')} in order with forge script")
+    return written
+
+
+def load_roster(base_path: str) -> Roster:
+    """Read mons.csv, moves.csv and abilities.csv into a Roster"""
     mons = read_mons_csv(os.path.join(base_path, "drool", "mons.csv"))
     read_moves_csv(os.path.join(base_path, "drool", "moves.csv"), mons)
     read_abilities_csv(os.path.join(base_path, "drool", "abilities.csv"), mons)
     print(f"Loaded {len(mons)} mons")
+    return mons
 
-    # Conditionally analyze sprite images if --color flag is set
-    if args.color:
-        print("\nAnalyzing sprite images...")
-        sprite_data, palette_data = analyze_sprite_images(base_path)
-
-        # Populate sprite and palette data in MonData objects
-        for mon_name, mon in mons.items():
-            mon_key = mon_name.lower()
-            if mon_key in sprite_data:
-                mon.sprite_data = sprite_data[mon_key]
-                mon.palette_data = palette_data.get(mon_key, [])
-                print(f"  {mon_name}: {len(mon.sprite_data)} sprite uint256 values, {len(mon.palette_data)} palette uint256 values")
-            else:
-                print(f"  {mon_name}: No sprite data found")
 
-        mons_with_sprites = len([m for m in mons.values() if m.sprite_data])
-        mons_with_palettes = len([m for m in mons.values() if m.palette_data])
-        print(f"Loaded sprite data for {mons_with_sprites} mons, palette data for {mons_with_palettes} mons")
+def attach_sprite_dictionary(mons: Roster, dictionary: dict) -> None:
+    """Populate shared and per-mon metadata from build_roster_sprite_dictionary output"""
+    mons.shared_metadata = [tuple(entry) for entry in dictionary['shared']]
+    for mon_name, mon in mons.items():
+        entry = dictionary['mons'].get(mon_name.lower())
+        if entry is None:
+            print(f"  {mon_name}: No sprite data found")
+            continue
+        mon.sprite_header = entry['header']
+        mon.sprite_data = entry['sprite']
+        mon.tile_map_data = entry['tile_map']
+        mon.palette_ref_data = entry['palette_refs']
+
+    per_mon = sum(len(mon_metadata_entries(mon)) for mon in mons.values())
+    print(f"Sprite metadata words: {sum(dictionary['raw_words'].values())} with raw packing, "
+          f"{sum(dictionary['codec_words'].values())} with per-mon codecs, "
+          f"{len(mons.shared_metadata) + per_mon} with the dictionary "
+          f"({len(mons.shared_metadata)} shared + {per_mon} per mon)")
+
+
+def attach_sprites(mons: Roster, sprite_data: Dict[str, List[int]], palette_data: Dict[str, List[int]],
+                   sprite_headers: Dict[str, int]) -> None:
+    """Populate sprite and palette data in MonData objects from analyze_sprite_images output"""
+    from sprite_codecs import HEADER_KEY
+    for mon_name, mon in mons.items():
+        mon_key = mon_name.lower()
+        if mon_key in sprite_data:
+            mon.sprite_data = sprite_data[mon_key]
+            mon.palette_data = palette_data.get(mon_key, [])
+            mon.sprite_header = sprite_headers.get(mon_key)
+            print(f"  {mon_name}: {len(mon.sprite_data)} sprite uint256 values, {len(mon.palette_data)} palette uint256 values")
+        else:
+            print(f"  {mon_name}: No sprite data found")
 
-    # Collect all contracts
-    contracts = collect_all_contracts(mons, base_path)
+    mons_with_sprites = len([m for m in mons.values() if m.sprite_data])
+    mons_with_palettes = len([m for m in mons.values() if m.palette_data])
+    print(f"Loaded sprite data for {mons_with_sprites} mons, palette data for {mons_with_palettes} mons")
+    print(f"Sprite codecs saved {sum(sprite_words_saved(m) for m in mons.values())} metadata words "
+          f"(net of {HEADER_KEY} words) versus raw packing")
+
+
+def write_setup_mons(mons: Roster, base_path: str, index: SolidityIndex, args: argparse.Namespace) -> None:
+    """Collect the roster's contracts and write the SetupMons script(s) the command line options ask for"""
+    contracts = collect_all_contracts(mons, base_path, index)
     print(f"Found {len(contracts)} unique contracts to deploy")
 
-    # Generate Solidity script
-    solidity_code = generate_solidity_script(mons, contracts, base_path, args.color)
+    if args.standard_attacks:
+        print("\nClassifying standard attacks...")
+        classify_standard_attacks(mons, os.path.join(base_path, args.artifacts_dir))
+
+    graph = None
+    if args.deploy_graph:
+        graph = build_roster_deploy_graph(mons, index, args.external)
+        write_deploy_graph_manifest(graph, base_path)
+
+    if args.batch_gas_budget:
+        write_batch_scripts(mons, base_path, args.color, index, args.batch_gas_budget,
+                            os.path.join(base_path, args.artifacts_dir), args.metadata_encoding)
+    elif args.sharded:
+        write_sharded_scripts(mons, base_path, args.color, index, args.metadata_encoding)
+    else:
+        # Generate Solidity script
+        solidity_code = generate_solidity_script(mons, contracts, base_path, args.color, index,
+                                                 metadata_encoding=args.metadata_encoding, graph=graph)
+
+        # Write to output file
+        output_path = args.output or os.path.join(base_path, "script", "SetupMons.s.sol")
+        if write_if_changed(output_path, solidity_code):
+            print(f"Generated deployment script: {output_path}")
+        else:
+            print(f"Deployment script unchanged: {output_path}")
 
-    # Write to output file
-    output_path = os.path.join(base_path, "script", "SetupMons.s.sol")
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(solidity_code)
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Command line options of the SetupMons generator (also used by generate.py mons)"""
+    parser.add_argument('--base-path', default='.',
+                       help='Repository root: drool/*.csv, drool/imgs and src/ are read and script/ is written '
+                            'under it (default: .)')
+    parser.add_argument('--output',
+                       help='Path of the single SetupMons script (default: <base-path>/script/SetupMons.s.sol)')
+    parser.add_argument('--color', action='store_true',
+                       help='Include sprite and palette color data in the generated script')
+    parser.add_argument('--sprite-codec', default='auto',
+                       help='Sprite codec to use with --color: a name from sprite_codecs.CODECS '
+                            '(default: auto picks the smallest per sprite)')
+    parser.add_argument('--sprite-dictionary', action='store_true',
+                       help='With --color, store a palette and tile table shared by all mons plus per-mon references')
+    parser.add_argument('--max-colors', type=int,
+                       help='Quantize sprites with more colors than this (default: sprite_quantize.DEFAULT_MAX_COLORS)')
+    parser.add_argument('--metadata-encoding', choices=METADATA_ENCODINGS, default='literal',
+                       help='With --color, emit metadata values as one statement each (literal) or as a single '
+                            'hex"..." literal copied out in a loop (hex)')
+    output_mode = parser.add_mutually_exclusive_group()
+    output_mode.add_argument('--sharded', action='store_true',
+                       help='Write one standalone SetupMon<Name>.s.sol script per mon plus SetupMonsShards.json, '
+                            'the order to run them in, rewriting only shards that changed')
+    output_mode.add_argument('--batch-gas-budget', type=int, nargs='?', const=DEFAULT_GAS_BUDGET,
+                       help='Split the deployment into resumable batch scripts under this estimated gas '
+                            f'(default when given without a value: {DEFAULT_GAS_BUDGET})')
+    parser.add_argument('--deploy-graph', action='store_true',
+                       help='Deploy shared constructor dependencies (StatBoosts, status effects, ...) once in the '
+                            'script, in dependency order, instead of reading them from env')
+    parser.add_argument('--standard-attacks', action='store_true',
+                       help='Create moves that are plain StandardAttacks through StandardAttackFactory '
+                            '(STANDARD_ATTACK_FACTORY) instead of deploying their own contracts')
+    parser.add_argument('--external', nargs='+', default=list(DEFAULT_EXTERNAL_CONTRACTS),
+                       help='With --deploy-graph, contracts to keep reading from env '
+                            f'(default: {" ".join(DEFAULT_EXTERNAL_CONTRACTS)})')
+    parser.add_argument('--artifacts-dir', default='out',
+                       help='Forge artifacts directory used for bytecode sizes in gas estimates (default: out)')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH,
+                       help=f'Path of the incremental build cache (default: {DEFAULT_CACHE_PATH})')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Recompute every stage without reading or writing the build cache')
+    parser.add_argument('--watch', action='store_true',
+                       help='Keep running: regenerate SetupMons and TypeCalculator.sol whenever drool/*.csv, '
+                            'drool/imgs/*_mini.gif or src/**/*.sol change')
+    parser.add_argument('--poll-interval', type=float, default=0.1,
+                       help='With --watch, seconds between checks for changed files (default: 0.1)')
+
+
+def parse_arguments(parser: argparse.ArgumentParser, argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse and check options added by add_arguments, filling in the sprite defaults with --color"""
+    args = parser.parse_args(argv)
+    if args.output and (args.sharded or args.batch_gas_budget):
+        parser.error("--output only applies to the single SetupMons.s.sol script")
+    if args.deploy_graph and (args.sharded or args.batch_gas_budget):
+        parser.error("--deploy-graph only applies to the single SetupMons.s.sol script")
+    if args.color:
+        from sprite_codecs import CODECS
+        from sprite_quantize import DEFAULT_MAX_COLORS
+        if args.sprite_codec != 'auto' and args.sprite_codec not in CODECS:
+            parser.error(f"--sprite-codec must be auto or one of: {', '.join(CODECS)}")
+        if args.max_colors is None:
+            args.max_colors = DEFAULT_MAX_COLORS
+    return args
 
-    print(f"Generated deployment script: {output_path}")
+
+def run(args: argparse.Namespace) -> None:
+    """Generate the deployment script(s) for parsed options"""
+    base_path = args.base_path
+    cache = None if args.no_cache else BuildCache(os.path.join(base_path, args.cache))
+
+    if args.watch:
+        # Imported here so one-shot runs don't load the watcher
+        from generator_watch import GeneratorWatcher
+        GeneratorWatcher(args, base_path, cache).run(args.poll_interval)
+        return
+
+    mons = load_roster(base_path)
+
+    # Conditionally analyze sprite images if --color flag is set
+    codecs = None if args.sprite_codec == 'auto' else [args.sprite_codec]
+    if args.color and args.sprite_dictionary:
+        from sprite_pipeline import build_roster_sprite_dictionary
+        print("\nBuilding roster sprite dictionary...")
+        dictionary = build_roster_sprite_dictionary(base_path, cache, codecs, args.max_colors)
+        if dictionary:
+            attach_sprite_dictionary(mons, dictionary)
+    elif args.color:
+        from sprite_pipeline import analyze_sprite_images
+        print("\nAnalyzing sprite images...")
+        attach_sprites(mons, *analyze_sprite_images(base_path, cache, codecs, args.max_colors))
+
+    # Collect all contracts
+    index = SolidityIndex(base_path, cache)
+    print(f"Indexed {len(index)} Solidity files")
+    write_setup_mons(mons, base_path, index, args)
+
+    if cache is not None:
+        cache.save()
+        print(f"Build cache: {cache.summary()}")
 
     if args.color:
         print("Color data included in deployment script")
@@ -678,9 +1146,22 @@ def main():
     print("\nSummary:")
     for mon in sorted(mons.values(), key=lambda m: m.mon_id):
         color_info = ""
-        if args.color and (mon.sprite_data or mon.palette_data):
-            color_info = f" (sprite: {len(mon.sprite_data)} uint256, palette: {len(mon.palette_data)} uint256)"
+        if args.color and mon.tile_map_data:
+            color_info = f" ({len(mon_metadata_entries(mon))} sprite dictionary words)"
+        elif args.color and (mon.sprite_data or mon.palette_data):
+            from sprite_codecs import parse_header
+            codec = parse_header(mon.sprite_header)['codec'] if mon.sprite_header is not None else "none"
+            color_info = (f" (sprite: {len(mon.sprite_data)} uint256 {codec}, {sprite_words_saved(mon)} saved, "
+                          f"palette: {len(mon.palette_data)} uint256)")
         print(f"  {mon.name}: {len(mon.moves)} moves, {len(mon.abilities)} abilities{color_info}")
 
+
+def main():
+    """Main function to generate the deployment script"""
+    parser = argparse.ArgumentParser(description='Generate Solidity deployment script for mons')
+    add_arguments(parser)
+    run(parse_arguments(parser))
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
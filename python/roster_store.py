@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""Columnar roster: one NumPy column per stat instead of one MonData object per mon.
+
+Stats are int32 columns and types are uint8 src/Enums.sol::Type values. Moves and abilities
+are stored CSR style: a row's names are ids[offsets[row]:offsets[row + 1]] into a pool of
+distinct names, so a roster of any size holds each move name once. Whole-roster queries (BST,
+rankings, type filters) are single NumPy expressions.
+
+The existing codegen works on MonData objects, so RosterStore hands out MonView rows: __slots__
+objects that read their fields from the columns on access. to_roster() wraps them in a Roster
+that generate_solidity_script accepts as is, with the moves.csv rows (move_rows) that
+classify_standard_attacks reads.
+"""
+
+import csv
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from game_data import TYPE_NAMES, TYPE_NONE, type_code
+
+STAT_COLUMNS = ["mon_id", "hp", "stamina", "speed", "attack", "defense", "special_attack", "special_defense"]
+# Stats summed into the BST column of mons.csv (stamina is the same for every mon)
+BST_COLUMNS = ["hp", "attack", "defense", "special_attack", "special_defense", "speed"]
+# MonData's sprite fields and their empty values; only mons with sprites store them
+SPRITE_FIELDS = {"sprite_data": list, "sprite_header": lambda: None, "palette_data": list,
+                 "tile_map_data": list, "palette_ref_data": list}
+DEFAULT_STAMINA = 5  # read_mons_csv gives every mon 5 stamina
+
+STAT_DTYPE = np.int32
+TYPE_DTYPE = np.uint8
+ID_DTYPE = np.int32
+
+
+class NamePool:
+    """Distinct strings and their ids, in first-seen order"""
+    def __init__(self):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def intern(self, name: str) -> int:
+        if name not in self.ids:
+            self.ids[name] = len(self.names)
+            self.names.append(name)
+        return self.ids[name]
+
+
+def csr(lists: Sequence[Sequence[str]], pool: NamePool) -> Tuple[np.ndarray, np.ndarray]:
+    """(offsets, ids) of per-row name lists, interning the names into pool"""
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(names) for names in lists])
+    ids = np.fromiter((pool.intern(name) for names in lists for name in names), dtype=ID_DTYPE, count=offsets[-1])
+    return offsets, ids
+
+
+def type_name(code: int) -> str:
+    """CSV spelling of a Type value ("NA" for Type.None), as MonData stores it"""
+    return "NA" if code == TYPE_NONE else TYPE_NAMES[code]
+
+
+class RosterStore:
+    def __init__(self, names: List[str], columns: Dict[str, np.ndarray], type1: np.ndarray, type2: np.ndarray,
+                 move_offsets: np.ndarray, move_ids: np.ndarray, move_pool: NamePool,
+                 ability_offsets: np.ndarray, ability_ids: np.ndarray, ability_pool: NamePool):
+        self.names = names
+        self.index = {name: row for row, name in enumerate(names)}
+        self.columns = {column: np.asarray(columns[column], dtype=STAT_DTYPE) for column in STAT_COLUMNS}
+        self.type1 = np.asarray(type1, dtype=TYPE_DTYPE)
+        self.type2 = np.asarray(type2, dtype=TYPE_DTYPE)
+        self.move_offsets = move_offsets
+        self.move_ids = move_ids
+        self.move_pool = move_pool
+        self.ability_offsets = ability_offsets
+        self.ability_ids = ability_ids
+        self.ability_pool = ability_pool
+        self.sprites: Dict[int, dict] = {}  # Row -> SPRITE_FIELDS values that have been set
+        self.move_rows: Dict[str, Dict[str, str]] = {}  # Move name -> its moves.csv row, as Roster.move_rows
+
+    @classmethod
+    def from_mons(cls, mons: Iterable, move_rows: Optional[Dict[str, Dict[str, str]]] = None) -> "RosterStore":
+        """Build from MonData-like objects (anything with MonData's attributes), keeping the moves.csv
+        rows of their moves if given (a Roster's move_rows)"""
+        mons = list(mons)
+        columns = {column: np.array([getattr(mon, column) for mon in mons], dtype=STAT_DTYPE)
+                   for column in STAT_COLUMNS}
+        move_pool, ability_pool = NamePool(), NamePool()
+        move_offsets, move_ids = csr([mon.moves for mon in mons], move_pool)
+        ability_offsets, ability_ids = csr([mon.abilities for mon in mons], ability_pool)
+        store = cls([mon.name for mon in mons], columns,
+                    [type_code(mon.type1) for mon in mons], [type_code(mon.type2) for mon in mons],
+                    move_offsets, move_ids, move_pool, ability_offsets, ability_ids, ability_pool)
+        store.move_rows = {move: row for move, row in (move_rows or {}).items() if move in move_pool.ids}
+        return store
+
+    @classmethod
+    def from_csv(cls, base_path: str) -> "RosterStore":
+        """Read drool/mons.csv, moves.csv and abilities.csv the way read_*_csv in mon_stats_to_sol.py do"""
+        names = []
+        rows = []
+        type1 = []
+        type2 = []
+        with open(os.path.join(base_path, "drool", "mons.csv"), 'r', newline='', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile):
+                names.append(row['Name'])
+                rows.append((int(row['Id']), int(row['HP']), DEFAULT_STAMINA, int(row['Speed']), int(row['Attack']),
+                             int(row['Defense']), int(row['SpecialAttack']), int(row['SpecialDefense'])))
+                type1.append(type_code(row['Type1']))
+                type2.append(type_code(row['Type2']))
+        data = np.array(rows, dtype=STAT_DTYPE).reshape(-1, len(STAT_COLUMNS))
+        row_of = {name: row for row, name in enumerate(names)}
+
+        def owned_names(file_name: str, csv_rows: Optional[Dict[str, Dict[str, str]]] = None) -> List[List[str]]:
+            """Names per mon row; csv_rows, if given, gets each name's first CSV row"""
+            lists = [[] for _ in names]
+            with open(os.path.join(base_path, "drool", file_name), 'r', newline='', encoding='utf-8') as csvfile:
+                for row in csv.DictReader(csvfile):
+                    name = row['Name'].strip()
+                    mon_name = row['Mon'].strip()
+                    if name and mon_name in row_of:
+                        lists[row_of[mon_name]].append(name)
+                        if csv_rows is not None:
+                            csv_rows.setdefault(name, row)
+            return lists
+
+        move_rows: Dict[str, Dict[str, str]] = {}
+        move_pool, ability_pool = NamePool(), NamePool()
+        move_offsets, move_ids = csr(owned_names("moves.csv", move_rows), move_pool)
+        ability_offsets, ability_ids = csr(owned_names("abilities.csv"), ability_pool)
+        store = cls(names, {column: data[:, i] for i, column in enumerate(STAT_COLUMNS)}, type1, type2,
+                    move_offsets, move_ids, move_pool, ability_offsets, ability_ids, ability_pool)
+        store.move_rows = move_rows
+        return store
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, key: Union[int, str]) -> "MonView":
+        return MonView(self, self.index[key] if isinstance(key, str) else key)
+
+    def __iter__(self) -> Iterator["MonView"]:
+        return (MonView(self, row) for row in range(len(self)))
+
+    def moves_of(self, row: int) -> List[str]:
+        ids = self.move_ids[self.move_offsets[row]:self.move_offsets[row + 1]]
+        return [self.move_pool.names[i] for i in ids]
+
+    def abilities_of(self, row: int) -> List[str]:
+        ids = self.ability_ids[self.ability_offsets[row]:self.ability_offsets[row + 1]]
+        return [self.ability_pool.names[i] for i in ids]
+
+    def move_counts(self) -> np.ndarray:
+        return np.diff(self.move_offsets)
+
+    def bst(self) -> np.ndarray:
+        """Base stat total per row"""
+        return np.sum([self.columns[column] for column in BST_COLUMNS], axis=0, dtype=np.int64)
+
+    def has_type(self, code: int) -> np.ndarray:
+        """Boolean mask of rows with code as either type"""
+        return (self.type1 == code) | (self.type2 == code)
+
+    def ranked(self, values: np.ndarray, descending: bool = True) -> np.ndarray:
+        """Rows ordered by values, ties kept in roster order"""
+        return np.argsort(-values if descending else values, kind='stable')
+
+    def select(self, rows: Union[np.ndarray, Sequence[int]]) -> "RosterStore":
+        """New store of just the given rows (a boolean mask or row indices), in that order"""
+        rows = np.flatnonzero(rows) if np.asarray(rows).dtype == bool else np.asarray(rows, dtype=np.int64)
+
+        def take(offsets: np.ndarray, ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            starts, ends = offsets[rows], offsets[rows + 1]
+            new_offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+            new_offsets[1:] = np.cumsum(ends - starts)
+            # Position of every kept id in the old ids array
+            positions = np.repeat(starts - new_offsets[:-1], ends - starts) + np.arange(new_offsets[-1])
+            return new_offsets, ids[positions]
+
+        move_offsets, move_ids = take(self.move_offsets, self.move_ids)
+        ability_offsets, ability_ids = take(self.ability_offsets, self.ability_ids)
+        selected = RosterStore([self.names[row] for row in rows],
+                               {column: values[rows] for column, values in self.columns.items()},
+                               self.type1[rows], self.type2[rows], move_offsets, move_ids, self.move_pool,
+                               ability_offsets, ability_ids, self.ability_pool)
+        selected.sprites = {new_row: self.sprites[row] for new_row, row in enumerate(rows) if row in self.sprites}
+        kept_moves = {self.move_pool.names[i] for i in move_ids.tolist()}
+        selected.move_rows = {move: row for move, row in self.move_rows.items() if move in kept_moves}
+        return selected
+
+    def nbytes(self) -> int:
+        """Bytes held by the NumPy arrays (names and pools are Python strings on top)"""
+        arrays = list(self.columns.values()) + [self.type1, self.type2, self.move_offsets, self.move_ids,
+                                                self.ability_offsets, self.ability_ids]
+        return sum(array.nbytes for array in arrays)
+
+    def to_roster(self):
+        """Roster of MonView rows with its move/ability indexes and move_rows, for the SetupMons codegen.
+
+        MonView's moves and abilities are read from the columns, so the indexes are filled here
+        the way Roster.add_move and add_ability would rather than by appending through them.
+        """
+        # Imported here: the generator pulls in PIL, which queries on the store don't need
+        from mon_stats_to_sol import Roster
+        roster = Roster()
+        for mon in self:
+            roster[mon.name] = mon
+            for move in mon.moves:
+                roster.move_to_mon.setdefault(move, mon)
+            for ability in mon.abilities:
+                roster.ability_to_mon.setdefault(ability, mon)
+        roster.move_rows = {move: row for move, row in self.move_rows.items() if move in roster.move_to_mon}
+        return roster
+
+
+def _stat_property(column: str) -> property:
+    return property(lambda self: int(self._store.columns[column][self._row]))
+
+
+def _sprite_property(field: str) -> property:
+    def get(self):
+        return self._store.sprites.get(self._row, {}).get(field, SPRITE_FIELDS[field]())
+
+    def set(self, value):
+        self._store.sprites.setdefault(self._row, {})[field] = value
+
+    return property(get, set)
+
+
+class MonView:
+    """One row of a RosterStore, readable like MonData"""
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: RosterStore, row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def name(self) -> str:
+        return self._store.names[self._row]
+
+    @property
+    def type1(self) -> str:
+        return type_name(self._store.type1[self._row])
+
+    @property
+    def type2(self) -> str:
+        return type_name(self._store.type2[self._row])
+
+    @property
+    def moves(self) -> List[str]:
+        return self._store.moves_of(self._row)
+
+    @property
+    def abilities(self) -> List[str]:
+        return self._store.abilities_of(self._row)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, MonView) and other._store is self._store and other._row == self._row
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._row))
+
+
+for _column in STAT_COLUMNS:
+    setattr(MonView, _column, _stat_property(_column))
+for _field in SPRITE_FIELDS:
+    setattr(MonView, _field, _sprite_property(_field))
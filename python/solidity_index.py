@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from build_cache import BuildCache, content_hash
+
+CONTRACT_PATTERN = re.compile(r'^\s*(?:abstract\s+)?(?:contract|library|interface)\s+(\w+)', re.MULTILINE)
+DEPLOYABLE_PATTERN = re.compile(r'^\s*contract\s+(\w+)', re.MULTILINE)
+CONSTRUCTOR_PATTERN = re.compile(r'constructor\s*\([^)]*\)', re.MULTILINE | re.DOTALL)
+PARAM_PATTERN = re.compile(r'(\w+)\s+(\w+)')
+NAMED_IMPORT_PATTERN = re.compile(r'import\s+\{([^}]+)\}\s+from\s+"([^"]+)"')
+
+
+def parse_solidity_source(content: str) -> dict:
+    """Parse the parts of a Solidity source file the codegen needs.
+
+    Returns:
+        dict with 'contracts' (declared contract/library/interface names),
+        'deployable' (the non-abstract contracts among them),
+        'constructor_params' (list of [type, name] pairs of the first constructor) and
+        'imports' (list of [names, import_path] pairs for named imports)
+    """
+    constructor_params = []
+    constructor_match = CONSTRUCTOR_PATTERN.search(content)
+    if constructor_match:
+        constructor_params = [[param_type, param_name]
+                              for param_type, param_name in PARAM_PATTERN.findall(constructor_match.group(0))]
+
+    imports = []
+    for names_str, import_path in NAMED_IMPORT_PATTERN.findall(content):
+        names = [name.strip() for name in names_str.split(",") if name.strip()]
+        imports.append([names, import_path])
+
+    return {
+        "contracts": CONTRACT_PATTERN.findall(content),
+        "deployable": DEPLOYABLE_PATTERN.findall(content),
+        "constructor_params": constructor_params,
+        "imports": imports
+    }
+
+
+def resolve_dependencies(parsed: dict, contract_path: str) -> Tuple[List[dict], List[str]]:
+    """Turn a parsed source into (dependencies, import_paths) for deployment.
+
+    Each constructor parameter becomes a dependency named after the parameter (upper-cased,
+    leading underscore removed). Import paths are only kept for imported contracts used as
+    constructor parameter types.
+    """
+    dependencies = []
+    contracts_imported = set()
+    for param_type, param_name in parsed["constructor_params"]:
+        # Remove leading underscore for environment variable name
+        env_name = param_name.upper()
+        if env_name.startswith("_"):
+            env_name = env_name[1:]
+        dependencies.append({
+            "name": env_name,
+            "type": param_type
+        })
+        contracts_imported.add(param_type)
+
+    import_paths = []
+    for names, import_path in parsed["imports"]:
+        if not any(name in contracts_imported for name in names):
+            continue
+        # Convert relative import path to absolute file path
+        if import_path.startswith("../../"):
+            import_paths.append(import_path.replace("../../", "src/"))
+        elif not import_path.startswith("forge-std/"):
+            # Handle relative imports without "../"
+            import_paths.append(os.path.join(os.path.dirname(contract_path), import_path))
+
+    return dependencies, import_paths
+
+
+class SolidityIndex:
+    """One-pass index of every Solidity file under src/.
+
+    Each file is read and parsed once; lookups by path or contract name are then dict hits.
+    Pass a BuildCache to persist parse results across runs, keyed by file content.
+    """
+    def __init__(self, base_path: str, cache: Optional[BuildCache] = None):
+        self.base_path = base_path
+        self.files: Dict[str, dict] = {}
+        self.contract_paths: Dict[str, str] = {}
+        self._build(cache)
+
+    def _build(self, cache: Optional[BuildCache]) -> None:
+        src_dir = os.path.join(self.base_path, "src")
+        for root, dirs, files in os.walk(src_dir):
+            dirs.sort()
+            for file_name in sorted(files):
+                if file_name.endswith(".sol"):
+                    self._add_file(os.path.join(root, file_name), cache)
+
+    def _add_file(self, path: str, cache: Optional[BuildCache]) -> None:
+        with open(path, 'rb') as f:
+            source = f.read()
+
+        def parse() -> dict:
+            return parse_solidity_source(source.decode('utf-8'))
+
+        if cache is not None:
+            parsed = cache.get_or_compute("solidity", content_hash(source), parse)
+        else:
+            parsed = parse()
+
+        key = os.path.normpath(path)
+        self.files[key] = parsed
+        for contract_name in parsed["contracts"]:
+            self.contract_paths.setdefault(contract_name, key)
+
+    def refresh(self, paths: List[str], cache: Optional[BuildCache] = None) -> None:
+        """Re-parse changed .sol files under src/ and drop deleted ones, leaving the rest of the index as is"""
+        for path in paths:
+            key = os.path.normpath(path)
+            if os.path.exists(path):
+                self._add_file(path, cache)
+            else:
+                self.files.pop(key, None)
+        # A contract may have moved between files, so rebuild the name lookup in scan order
+        self.contract_paths = {}
+        for key, parsed in self.files.items():
+            for contract_name in parsed["contracts"]:
+                self.contract_paths.setdefault(contract_name, key)
+
+    def get(self, path: str) -> Optional[dict]:
+        """Return the parsed source for a file path, or None if it is not under src/"""
+        return self.files.get(os.path.normpath(path))
+
+    def find_contract(self, contract_name: str) -> Optional[str]:
+        """Return the path of the file declaring a contract, library or interface"""
+        return self.contract_paths.get(contract_name)
+
+    def is_deployable(self, contract_name: str) -> bool:
+        """Return True if contract_name is declared as a non-abstract contract under src/"""
+        path = self.find_contract(contract_name)
+        return path is not None and contract_name in self.files[path]["deployable"]
+
+    def dependencies(self, contract_path: str) -> Tuple[List[dict], List[str]]:
+        """Return (dependencies, import_paths) for a contract file, as analyze_contract_dependencies does"""
+        parsed = self.get(contract_path)
+        if parsed is None:
+            print(f"Warning: Contract file not found: {contract_path}")
+            return [], []
+        return resolve_dependencies(parsed, contract_path)
+
+    def __len__(self) -> int:
+        return len(self.files)
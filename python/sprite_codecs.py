@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Sprite codecs for the IMG_n metadata words.
+
+Every codec turns an indexed frame into a stream of fixed-width symbols that is packed with
+bitpack.pack_words, so the word layout is the same one the raw sprites have always used. The
+codec, its parameters and the stream length go in a separate IMG_HDR header word:
+
+    bits   0..7   codec id
+    bits   8..15  bits per pixel
+    bits  16..23  run-length field width (0 for raw)
+    bits  24..31  width
+    bits  32..39  height
+    bits  40..55  number of symbols in the stream
+    bits  56..63  number of IMG_n words
+    bit   64      frame is an XOR delta against the previous animation frame
+
+New codecs subclass SpriteCodec and are added with register_codec.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from bitpack import pack_words, unpack_words
+
+# Mirrors src/lib/MonSVGRenderer.sol
+NUM_IMG_SLOTS = 16
+
+HEADER_KEY = "IMG_HDR"
+DELTA_FLAG = 1 << 64
+
+# Longest run-length field considered; a 32x32 sprite never has a run longer than 2**10
+MAX_RUN_BITS = 10
+
+
+class SpriteCodec:
+    """Encodes an indexed (H, W) frame as a stream of symbols of a fixed bit width"""
+    name = ""
+    codec_id = -1
+
+    def encode(self, indexed_frame: np.ndarray, bits_per_pixel: int) -> Tuple[np.ndarray, int, int]:
+        """Returns (symbols, symbol_bits, run_bits)"""
+        raise NotImplementedError
+
+    def decode(self, symbols: np.ndarray, bits_per_pixel: int, run_bits: int, shape: Tuple[int, int]) -> np.ndarray:
+        raise NotImplementedError
+
+
+class RawCodec(SpriteCodec):
+    """One bits_per_pixel symbol per pixel, row-major (the original flat bit-packing)"""
+    name = "raw"
+    codec_id = 0
+
+    def encode(self, indexed_frame, bits_per_pixel):
+        return np.asarray(indexed_frame).ravel(), bits_per_pixel, 0
+
+    def decode(self, symbols, bits_per_pixel, run_bits, shape):
+        return np.asarray(symbols).reshape(shape)
+
+
+def run_lengths(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split a 1-D array into maximal runs, returning (run values, run lengths)"""
+    if values.size == 0:
+        return values, np.zeros(0, dtype=np.int64)
+    starts = np.flatnonzero(np.concatenate([[True], values[1:] != values[:-1]]))
+    return values[starts], np.diff(np.append(starts, values.size))
+
+
+def rle_encode(values: np.ndarray, bits_per_pixel: int) -> Tuple[np.ndarray, int, int]:
+    """Run-length encode values as (value << run_bits | length - 1) symbols.
+
+    The run field width is chosen to minimise the stream size; runs longer than the field
+    allows are split.
+    """
+    run_values, lengths = run_lengths(np.asarray(values, dtype=np.uint64).ravel())
+    best_bits, best_run_bits = None, 1
+    for run_bits in range(1, MAX_RUN_BITS + 1):
+        total = int(np.sum(-(-lengths // (1 << run_bits)))) * (bits_per_pixel + run_bits)
+        if best_bits is None or total < best_bits:
+            best_bits, best_run_bits = total, run_bits
+
+    # Split long runs into pieces of at most 2**run_bits pixels
+    max_run = 1 << best_run_bits
+    pieces = -(-lengths // max_run)
+    piece_values = np.repeat(run_values, pieces)
+    piece_lengths = np.full(piece_values.size, max_run, dtype=np.int64)
+    last = np.cumsum(pieces) - 1
+    piece_lengths[last] = lengths - (pieces - 1) * max_run
+
+    symbols = (piece_values << np.uint64(best_run_bits)) | (piece_lengths - 1).astype(np.uint64)
+    return symbols, bits_per_pixel + best_run_bits, best_run_bits
+
+
+def rle_decode(symbols: np.ndarray, run_bits: int) -> np.ndarray:
+    symbols = np.asarray(symbols, dtype=np.uint64)
+    lengths = (symbols & np.uint64((1 << run_bits) - 1)).astype(np.int64) + 1
+    return np.repeat(symbols >> np.uint64(run_bits), lengths)
+
+
+class RunLengthCodec(SpriteCodec):
+    """Runs of equal palette indices in row-major order"""
+    name = "rle"
+    codec_id = 1
+
+    def encode(self, indexed_frame, bits_per_pixel):
+        return rle_encode(np.asarray(indexed_frame).ravel(), bits_per_pixel)
+
+    def decode(self, symbols, bits_per_pixel, run_bits, shape):
+        return rle_decode(symbols, run_bits).reshape(shape)
+
+
+class RowDeltaCodec(SpriteCodec):
+    """Each row XORed with the row above it, then run-length encoded.
+
+    Rows that repeat the previous row collapse into runs of zeros, which is common in
+    outlined, vertically symmetric pixel art.
+    """
+    name = "row-delta"
+    codec_id = 2
+
+    def encode(self, indexed_frame, bits_per_pixel):
+        frame = np.asarray(indexed_frame, dtype=np.uint64)
+        delta = frame.copy()
+        delta[1:] ^= frame[:-1]
+        return rle_encode(delta.ravel(), bits_per_pixel)
+
+    def decode(self, symbols, bits_per_pixel, run_bits, shape):
+        delta = rle_decode(symbols, run_bits).reshape(shape)
+        return np.bitwise_xor.accumulate(delta, axis=0)
+
+
+CODECS: Dict[str, SpriteCodec] = {}
+CODECS_BY_ID: Dict[int, SpriteCodec] = {}
+
+
+def register_codec(codec: SpriteCodec) -> None:
+    """Make a codec available to encode_sprite and decode_sprite"""
+    if not 0 <= codec.codec_id <= 0xFF or codec.codec_id in CODECS_BY_ID:
+        raise ValueError(f"Invalid or duplicate codec id {codec.codec_id} for {codec.name}")
+    CODECS[codec.name] = codec
+    CODECS_BY_ID[codec.codec_id] = codec
+
+
+for _codec in (RawCodec(), RunLengthCodec(), RowDeltaCodec()):
+    register_codec(_codec)
+
+
+def make_header(codec: SpriteCodec, bits_per_pixel: int, run_bits: int, shape: Tuple[int, int],
+                num_symbols: int, num_words: int) -> int:
+    """Pack the IMG_HDR word (see the module docstring for the layout)"""
+    height, width = shape
+    fields = [(codec.codec_id, 8), (bits_per_pixel, 8), (run_bits, 8), (width, 8), (height, 8),
+              (num_symbols, 16), (num_words, 8)]
+    header = 0
+    shift = 0
+    for value, bits in fields:
+        if not 0 <= value < 1 << bits:
+            raise ValueError(f"Sprite header field value {value} does not fit in {bits} bits")
+        header |= value << shift
+        shift += bits
+    return header
+
+
+def parse_header(header: int) -> dict:
+    """Unpack an IMG_HDR word into its fields"""
+    return {
+        'codec': CODECS_BY_ID[header & 0xFF].name,
+        'bits_per_pixel': (header >> 8) & 0xFF,
+        'run_bits': (header >> 16) & 0xFF,
+        'width': (header >> 24) & 0xFF,
+        'height': (header >> 32) & 0xFF,
+        'num_symbols': (header >> 40) & 0xFFFF,
+        'num_words': (header >> 56) & 0xFF,
+        'delta': bool(header & DELTA_FLAG),
+    }
+
+
+def encode_sprite(indexed_frame: np.ndarray, bits_per_pixel: int,
+                  codecs: Optional[List[str]] = None) -> dict:
+    """Encode a frame with every candidate codec and keep the one with the fewest words.
+
+    Ties go to the earlier codec in codecs (raw first by default).
+
+    Returns:
+        dict: codec name, header word, IMG_n words, and the raw word count for comparison
+    """
+    indexed_frame = np.asarray(indexed_frame)
+    best = None
+    raw_words = None
+    for name in codecs or list(CODECS):
+        codec = CODECS[name]
+        symbols, symbol_bits, run_bits = codec.encode(indexed_frame, bits_per_pixel)
+        words = pack_words(symbols, symbol_bits)
+        if name == RawCodec.name:
+            raw_words = len(words)
+        if best is None or len(words) < len(best[2]):
+            best = (codec, run_bits, words, len(symbols))
+
+    codec, run_bits, words, num_symbols = best
+    if raw_words is None:
+        raw_words = len(pack_words(indexed_frame, bits_per_pixel))
+    return {
+        'codec': codec.name,
+        'header': make_header(codec, bits_per_pixel, run_bits, indexed_frame.shape, num_symbols, len(words)),
+        'words': words,
+        'raw_words': raw_words,
+    }
+
+
+def decode_sprite(header: int, words: List[int]) -> np.ndarray:
+    """Decode IMG_n words back to the indexed frame using the codec named in the header"""
+    fields = parse_header(header)
+    codec = CODECS[fields['codec']]
+    symbol_bits = fields['bits_per_pixel'] + fields['run_bits']
+    symbols = unpack_words(words, symbol_bits, fields['num_symbols'])
+    return codec.decode(symbols, fields['bits_per_pixel'], fields['run_bits'],
+                        (fields['height'], fields['width']))
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Roster-wide palette and tile dictionary for the sprite metadata words.
+
+Instead of every mon storing its own 24-bit palette and all of its pixels, the dictionary
+stage builds, across the whole roster:
+
+- a shared palette (SPAL_n) of every colour any mon uses, most widely used first
+- a shared tile table (STILE_n) of the tile_size x tile_size tiles that occur at least
+  min_uses times, with pixels as shared palette indices
+
+Each mon then stores only references:
+
+- PREF_n: its local palette as shared palette indices
+- TMAP_n: one entry per tile position, either a shared tile index (< number of shared tiles)
+  or number of shared tiles + the index of one of its own private tiles
+- IMG_HDR / IMG_n: its private tiles in local palette indices, stacked top to bottom into a
+  (tiles * tile_size, tile_size) frame and encoded with sprite_codecs
+
+The shared words are stored once, under the reserved mon id type(uint256).max
+(MonSVGRenderer.SHARED_METADATA_MON_ID).
+"""
+
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+from bitpack import pack_chunks, pack_words, unpack_words
+from sprite_codecs import decode_sprite, encode_sprite
+
+TILE_SIZE = 8
+MIN_SHARED_USES = 2
+COLORS_PER_WORD = 10  # Same layout as the per-mon PAL_n words
+RGB_BITS = 24
+
+
+def split_tiles(frame: np.ndarray, tile_size: int = TILE_SIZE) -> np.ndarray:
+    """Split an (H, W) frame into (H/tile_size * W/tile_size, tile_size, tile_size) tiles, row-major"""
+    height, width = frame.shape
+    if height % tile_size or width % tile_size:
+        raise ValueError(f"Frame of {width}x{height} pixels is not a whole number of {tile_size}x{tile_size} tiles")
+    tiles = frame.reshape(height // tile_size, tile_size, width // tile_size, tile_size).swapaxes(1, 2)
+    return tiles.reshape(-1, tile_size, tile_size)
+
+
+def join_tiles(tiles: np.ndarray, shape: Tuple[int, int]) -> np.ndarray:
+    """Inverse of split_tiles"""
+    height, width = shape
+    tile_size = tiles.shape[-1]
+    grid = tiles.reshape(height // tile_size, width // tile_size, tile_size, tile_size).swapaxes(1, 2)
+    return grid.reshape(height, width)
+
+
+class SpriteDictionary:
+    """Shared palette and tile table for a roster, plus each mon's references into them"""
+    def __init__(self, palette: List[int], tiles: np.ndarray, tile_size: int, mons: Dict[str, dict]):
+        self.palette = palette  # Shared 24-bit colours
+        self.tiles = tiles  # (num_shared_tiles, tile_size, tile_size) shared palette indices
+        self.tile_size = tile_size
+        self.mons = mons  # Mon name -> metadata entries (see build_sprite_dictionary)
+        self.palette_bits = max(1, (len(palette) - 1).bit_length())
+
+    def shared_metadata(self) -> List[Tuple[str, int]]:
+        """(key, value) words stored once under SHARED_METADATA_MON_ID"""
+        entries = [(f"SPAL_{i}", word) for i, word in enumerate(pack_chunks(self.palette, RGB_BITS, COLORS_PER_WORD))]
+        entries += [(f"STILE_{i}", word) for i, word in enumerate(pack_words(self.tiles, self.palette_bits))]
+        return entries
+
+    def decode(self, name: str) -> np.ndarray:
+        """Rebuild a mon's frame as 24-bit colours from its references, to check the encoding"""
+        mon = self.mons[name]
+        height, width = mon['shape']
+        num_tiles = (height // self.tile_size) * (width // self.tile_size)
+        refs = unpack_words(mon['palette_refs'], self.palette_bits, mon['num_colors']).astype(np.int64)
+        tile_map = unpack_words(mon['tile_map'], mon['tile_map_bits'], num_tiles).astype(np.int64)
+
+        private = decode_sprite(mon['header'], mon['sprite']).reshape(-1, self.tile_size, self.tile_size)
+        shared = self.tiles.astype(np.int64)
+        private_as_shared = refs[private.astype(np.int64)] if len(private) else private.astype(np.int64)
+        all_tiles = np.concatenate([shared, private_as_shared]) if len(shared) else private_as_shared
+        indexed = join_tiles(all_tiles[tile_map], (height, width))
+        return np.asarray(self.palette, dtype=np.int64)[indexed]
+
+
+def build_sprite_dictionary(sprites: Dict[str, Tuple[Sequence[int], np.ndarray]], tile_size: int = TILE_SIZE,
+                            min_uses: int = MIN_SHARED_USES, codecs: Optional[List[str]] = None) -> SpriteDictionary:
+    """Build the shared palette and tile table for a roster.
+
+    Args:
+        sprites: mon name -> (palette as 24-bit colours, indexed frame into that palette)
+        tile_size: tile edge length in pixels; frames must be a whole number of tiles
+        min_uses: number of occurrences (across all mons) for a tile to move to the shared table
+        codecs: sprite codecs to try for each mon's private tiles (default: all)
+    """
+    # Shared palette, ordered by the number of mons using each colour so common colours get small indices
+    color_uses = Counter(color for palette, _ in sprites.values() for color in set(palette))
+    palette = [color for color, _ in sorted(color_uses.items(), key=lambda item: (-item[1], item[0]))]
+    color_index = {color: i for i, color in enumerate(palette)}
+
+    # Every mon's tiles in shared palette indices, so identical-looking tiles compare equal
+    mon_tiles = {}
+    for name, (mon_palette, frame) in sprites.items():
+        refs = np.array([color_index[color] for color in mon_palette], dtype=np.int64)
+        mon_tiles[name] = split_tiles(refs[np.asarray(frame, dtype=np.int64)], tile_size)
+    tile_uses = Counter(tile.tobytes() for tiles in mon_tiles.values() for tile in tiles)
+
+    shared_keys = sorted((key for key, uses in tile_uses.items() if uses >= min_uses),
+                         key=lambda key: (-tile_uses[key], key))
+    shared_index = {key: i for i, key in enumerate(shared_keys)}
+    shared_tiles = np.array([np.frombuffer(key, dtype=np.int64).reshape(tile_size, tile_size)
+                             for key in shared_keys], dtype=np.int64).reshape(-1, tile_size, tile_size)
+
+    mons = {}
+    for name, (mon_palette, frame) in sprites.items():
+        frame = np.asarray(frame)
+        local_tiles = split_tiles(frame, tile_size)
+        tile_map = []
+        private = []
+        for tile, local_tile in zip(mon_tiles[name], local_tiles):
+            key = tile.tobytes()
+            if key in shared_index:
+                tile_map.append(shared_index[key])
+            else:
+                tile_map.append(len(shared_keys) + len(private))
+                private.append(local_tile)
+
+        tile_map_bits = max(1, (len(shared_keys) + len(local_tiles) - 1).bit_length())
+        bits_per_pixel = max(1, (len(mon_palette) - 1).bit_length())
+        private_frame = np.concatenate(private) if private else np.zeros((0, tile_size), dtype=frame.dtype)
+        encoded = encode_sprite(private_frame, bits_per_pixel, codecs)
+        mons[name] = {
+            'shape': frame.shape,
+            'num_colors': len(mon_palette),
+            'palette_refs': pack_words([color_index[color] for color in mon_palette],
+                                       max(1, (len(palette) - 1).bit_length())),
+            'tile_map_bits': tile_map_bits,
+            'tile_map': pack_words(tile_map, tile_map_bits),
+            'header': encoded['header'],
+            'sprite': encoded['words'],
+        }
+
+    return SpriteDictionary(palette, shared_tiles, tile_size, mons)
+
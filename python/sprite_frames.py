@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Multi-frame GIF encoding with inter-frame deltas.
+
+Frames are read lazily, one at a time. Frame 0 is encoded in full and every later frame as
+the XOR of its palette indices with the previous frame's, so unchanged pixels become runs of
+zeros, unless encoding it in full is smaller (the IMG_HDR delta flag says which). Each frame
+goes through sprite_codecs.encode_sprite, so frames use the same IMG_HDR + IMG_n packing as
+still sprites.
+
+Run from the repository root to compare against packing every frame in full:
+    python python/sprite_frames.py --pattern _front.gif
+"""
+
+import argparse
+import os
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from bitpack import WORD_BITS
+from sprite_codecs import DELTA_FLAG, decode_sprite, encode_sprite, parse_header
+from sprite_index import pack_rgba, unpack_rgba
+
+
+def iter_gif_frames(gif_path: str) -> Iterator[np.ndarray]:
+    """Yield each frame of a GIF as an (H, W, 4) RGBA array, decoding one frame at a time"""
+    with Image.open(gif_path) as img:
+        for frame_number in range(getattr(img, 'n_frames', 1)):
+            img.seek(frame_number)
+            yield np.array(img.convert('RGBA'))
+
+
+def animation_palette(gif_path: str) -> List[Tuple[int, int, int, int]]:
+    """Sorted RGBA palette covering every frame, built in one streaming pass"""
+    colors = np.zeros(0, dtype=np.uint32)
+    for frame in iter_gif_frames(gif_path):
+        colors = np.union1d(colors, pack_rgba(frame).ravel())
+    return unpack_rgba(colors)
+
+
+def encode_animation(gif_path: str, codecs: Optional[List[str]] = None) -> dict:
+    """Encode every frame of a GIF against a shared palette, later frames as deltas.
+
+    Makes two streaming passes over the file (palette, then frames), so at most two frames
+    are held in memory.
+
+    Returns:
+        dict: 'palette', 'bits_per_pixel', 'frames' (list of encode_sprite results),
+              'naive_words' (IMG_n words if every frame were packed raw without a header) and
+              'keyframe_words' (IMG_HDR + IMG_n words if every frame were encoded in full)
+    """
+    palette = animation_palette(gif_path)
+    packed_palette = pack_rgba(np.array(palette, dtype=np.uint8).reshape(-1, 1, 4)).ravel()
+    bits_per_pixel = max(1, (len(palette) - 1).bit_length())
+
+    frames = []
+    naive_words = 0
+    keyframe_words = 0
+    previous = None
+    for frame in iter_gif_frames(gif_path):
+        indexed = np.searchsorted(packed_palette, pack_rgba(frame))
+        keyframe = encode_sprite(indexed, bits_per_pixel, codecs)
+        encoded = keyframe
+        if previous is not None:
+            delta = encode_sprite(indexed ^ previous, bits_per_pixel, codecs)
+            if len(delta['words']) < len(keyframe['words']):
+                encoded = dict(delta, header=delta['header'] | DELTA_FLAG)
+        frames.append(encoded)
+        naive_words += -(-indexed.size * bits_per_pixel // WORD_BITS)
+        keyframe_words += 1 + len(keyframe['words'])
+        previous = indexed
+
+    return {'palette': palette, 'bits_per_pixel': bits_per_pixel, 'frames': frames, 'naive_words': naive_words,
+            'keyframe_words': keyframe_words}
+
+
+def decode_animation(encoded: dict) -> Iterator[np.ndarray]:
+    """Yield each frame of an encode_animation result as palette indices"""
+    previous = None
+    for frame in encoded['frames']:
+        decoded = decode_sprite(frame['header'], frame['words']).astype(np.int64)
+        previous = decoded ^ previous if parse_header(frame['header'])['delta'] else decoded
+        yield previous
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report words per animation with inter-frame delta encoding')
+    parser.add_argument('--imgs-dir', default=os.path.join('drool', 'imgs'), help='Directory of GIFs')
+    parser.add_argument('--pattern', default='.gif', help='Only encode GIFs whose name ends with this')
+    parser.add_argument('--verify', action='store_true', help='Decode every animation and compare to the source')
+    args = parser.parse_args()
+
+    total_naive = 0
+    total_keyframe = 0
+    total_delta = 0
+    for name in sorted(f for f in os.listdir(args.imgs_dir) if f.endswith(args.pattern)):
+        gif_path = os.path.join(args.imgs_dir, name)
+        encoded = encode_animation(gif_path)
+        # One IMG_HDR word per frame on top of its IMG_n words
+        delta_words = sum(1 + len(frame['words']) for frame in encoded['frames'])
+        codecs = ",".join(frame['codec'] + ("+delta" if parse_header(frame['header'])['delta'] else "")
+                          for frame in encoded['frames'])
+        print(f"  {name}: {len(encoded['frames'])} frames, {len(encoded['palette'])} colors, "
+              f"{encoded['naive_words']} words naive, {encoded['keyframe_words']} all keyframes, "
+              f"{delta_words} with deltas ({codecs})")
+        total_naive += encoded['naive_words']
+        total_keyframe += encoded['keyframe_words']
+        total_delta += delta_words
+
+        if args.verify:
+            palette = np.array(encoded['palette'], dtype=np.uint8)
+            for frame, indexed in zip(iter_gif_frames(gif_path), decode_animation(encoded)):
+                if not np.array_equal(palette[indexed], frame):
+                    raise AssertionError(f"{name}: decoded frame does not match the source")
+
+    print(f"\nTotal: {total_naive} words naive, {total_keyframe} all keyframes, {total_delta} with deltas "
+          f"({total_naive - total_delta} saved)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+from typing import List, Tuple
+import numpy as np
+
+
+def pack_rgba(frame_array: np.ndarray) -> np.ndarray:
+    """Pack an (H, W, 4) RGBA uint8 array into an (H, W) uint32 array.
+
+    R is stored in the most significant byte so that sorting the packed values
+    orders colors the same way as sorting (r, g, b, a) tuples.
+    """
+    rgba = np.ascontiguousarray(frame_array, dtype=np.uint8)
+    return ((rgba[..., 0].astype(np.uint32) << 24) |
+            (rgba[..., 1].astype(np.uint32) << 16) |
+            (rgba[..., 2].astype(np.uint32) << 8) |
+            rgba[..., 3].astype(np.uint32))
+
+
+def unpack_rgba(packed: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    """Convert packed uint32 colors back into a list of (r, g, b, a) tuples"""
+    return [(int(c >> 24) & 0xFF, int(c >> 16) & 0xFF, int(c >> 8) & 0xFF, int(c) & 0xFF)
+            for c in packed.tolist()]
+
+
+def index_frame(frame_array: np.ndarray) -> Tuple[List[Tuple[int, int, int, int]], np.ndarray]:
+    """Build a sorted palette and palette-indexed frame from an RGBA frame.
+
+    Args:
+        frame_array: (H, W, 4) uint8 RGBA pixels
+
+    Returns:
+        tuple: (palette, indexed_frame) where palette is the sorted list of unique
+               RGBA tuples and indexed_frame is an (H, W) array of palette indices
+    """
+    height, width = frame_array.shape[:2]
+    packed = pack_rgba(frame_array).ravel()
+    unique_colors, inverse = np.unique(packed, return_inverse=True)
+
+    index_dtype = np.uint8 if len(unique_colors) <= 256 else np.uint16
+    indexed_frame = inverse.reshape(height, width).astype(index_dtype)
+
+    return unpack_rgba(unique_colors), indexed_frame
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""GIF decoding and sprite compression for mon_stats_to_sol.py --color.
+
+Split out of the generator so runs without --color never import PIL or NumPy: the
+SetupMons script without sprite data is pure text generation.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+from PIL import Image
+import numpy as np
+
+from bitpack import pack_chunks, pack_words
+from build_cache import BuildCache, content_hash, file_hash
+from sprite_codecs import CODECS, NUM_IMG_SLOTS, encode_sprite, parse_header
+from sprite_dictionary import build_sprite_dictionary
+from sprite_index import index_frame
+from sprite_quantize import DEFAULT_MAX_COLORS, quantize_frame
+
+
+def analyze_gif(gif_path: str, max_colors: int = DEFAULT_MAX_COLORS) -> dict:
+    """Analyze a GIF file and extract first frame data, quantizing it to at most max_colors colors."""
+    print(f"\n  Analyzing: {os.path.basename(gif_path)}")
+
+    try:
+        with Image.open(gif_path) as img:
+            # Only extract the first frame
+            frame = img.convert('RGBA')
+            frame_array = np.array(frame)
+
+            # Build the sorted palette and indexed frame in one vectorized pass
+            palette, indexed_frame = index_frame(frame_array)
+
+            print(f"    Dimensions: {frame_array.shape[:2]} ")
+            print(f"    Unique colors: {len(palette)}")
+
+            # Reduce the palette if it is over budget, keeping transparent pixels exact
+            if len(palette) > max_colors:
+                frame_array, report = quantize_frame(frame_array, max_colors)
+                palette, indexed_frame = index_frame(frame_array)
+                print(f"    Quantized {report['colors_before']} -> {report['colors_after']} colors "
+                      f"(mean ΔE {report['mean_delta_e']:.2f}, max ΔE {report['max_delta_e']:.2f})")
+
+            # Calculate bits needed
+            bits_needed = max(1, (len(palette) - 1).bit_length())
+            print(f"    Bits needed per pixel: {bits_needed}")
+
+            return {
+                'path': gif_path,
+                'dimensions': frame_array.shape[:2],
+                'unique_colors': len(palette),
+                'bits_needed': bits_needed,
+                'palette': palette,
+                'indexed_frame': indexed_frame
+            }
+
+    except Exception as e:
+        print(f"    Error: {e}")
+        return None
+
+
+def compress_to_uint256(indexed_frame, bits_per_pixel: int) -> List[int]:
+    """Convert indexed frame to compressed uint256 values using simple bit packing.
+
+    Pixels are packed in row-major order with the first pixel in the least significant
+    bits, then split into uint256 words starting from the most significant end.
+    """
+    return pack_words(indexed_frame, bits_per_pixel)
+
+
+def palette_color_to_rgb(rgba: Tuple[int, int, int, int]) -> int:
+    """Encode an RGBA color as a 24-bit RGB value, mapping transparent to the RGB(1,1,1) sentinel"""
+    r, g, b, a = rgba
+    if r == 0 and g == 0 and b == 0 and a == 0:
+        return 0x010101
+    # Encode RGB values (ignore alpha), 8 bits per channel
+    return (int(r) << 16) | (int(g) << 8) | int(b)
+
+
+def compress_palette_to_uint256(palette: List[Tuple[int, int, int, int]]) -> List[int]:
+    """Convert color palette to compressed uint256 values.
+
+    Packs colors into uint256 words with a maximum of 10 colors per word (240 bits used, 16 bits unused).
+    This ensures no color is split across word boundaries for easier decoding.
+
+    Args:
+        palette: List of RGBA tuples from GIF analysis
+
+    Returns:
+        List of uint256 integers representing compressed palette data
+    """
+    colors_per_word = 10  # Maximum colors per uint256 (10 * 24 = 240 bits, 16 bits unused)
+    rgb_values = [palette_color_to_rgb(rgba) for rgba in palette]
+
+    # Each chunk of 10 colors is packed LSB first and left-aligned in its own word
+    return pack_chunks(rgb_values, 24, colors_per_word)
+
+
+def compress_sprite(gif_path: str, codecs: Optional[List[str]] = None,
+                    max_colors: int = DEFAULT_MAX_COLORS) -> Optional[dict]:
+    """Analyze a GIF file and return its compressed sprite, sprite header and palette uint256 values.
+
+    The sprite is encoded with whichever of the given codecs (default: all) needs the fewest words.
+    """
+    result = analyze_gif(gif_path, max_colors)
+    if not result:
+        return None
+    encoded = encode_sprite(result['indexed_frame'], result['bits_needed'], codecs)
+    return {
+        'sprite': encoded['words'],
+        'header': encoded['header'],
+        'palette': compress_palette_to_uint256(result['palette'])
+    }
+
+
+def load_sprite(gif_path: str, cache: Optional[BuildCache] = None, codecs: Optional[List[str]] = None,
+                max_colors: int = DEFAULT_MAX_COLORS) -> Optional[dict]:
+    """compress_sprite for one GIF, reusing the cached result if its bytes and options are unchanged"""
+    if cache is None:
+        return compress_sprite(gif_path, codecs, max_colors)
+    key = file_hash(gif_path, ",".join(codecs or CODECS).encode(), str(max_colors).encode())
+    return cache.get_or_compute("sprites", key, lambda: compress_sprite(gif_path, codecs, max_colors))
+
+
+def analyze_sprite_images(base_path: str, cache: Optional[BuildCache] = None, codecs: Optional[List[str]] = None,
+                          max_colors: int = DEFAULT_MAX_COLORS
+                          ) -> Tuple[Dict[str, List[int]], Dict[str, List[int]], Dict[str, int]]:
+    """Analyze all mini GIF files and return sprite, palette and sprite header data indexed by monster name.
+
+    If a cache is given, GIFs whose bytes were already compressed are not decoded again.
+    """
+    imgs_dir = os.path.join(base_path, "drool", "imgs")
+    sprite_data = {}
+    palette_data = {}
+    sprite_headers = {}
+
+    if not os.path.exists(imgs_dir):
+        print(f"Warning: Images directory not found: {imgs_dir}")
+        return sprite_data, palette_data, sprite_headers
+
+    mini_gifs = [f for f in os.listdir(imgs_dir) if f.endswith('_mini.gif')]
+
+    for gif_file in sorted(mini_gifs):
+        # Extract monster name from filename (e.g., "inutia" from "inutia_mini.gif")
+        mon_name = gif_file.replace('_mini.gif', '').lower()
+
+        gif_path = os.path.join(imgs_dir, gif_file)
+        result = load_sprite(gif_path, cache, codecs, max_colors)
+
+        if result:
+            sprite_data[mon_name] = result['sprite']
+            palette_data[mon_name] = result['palette']
+            sprite_headers[mon_name] = result['header']
+
+            print(f"    Sprite: {len(result['sprite'])} uint256 values ({parse_header(result['header'])['codec']})")
+            if len(result['sprite']) > NUM_IMG_SLOTS:
+                print(f"    ⚠️  WARNING: Sprite needs more than {NUM_IMG_SLOTS} IMG slots")
+            print(f"    Palette: {len(result['palette'])} uint256 values")
+        else:
+            print(f"    Failed to process {gif_file}")
+
+    return sprite_data, palette_data, sprite_headers
+
+
+def build_roster_sprite_dictionary(base_path: str, cache: Optional[BuildCache] = None,
+                                   codecs: Optional[List[str]] = None,
+                                   max_colors: int = DEFAULT_MAX_COLORS) -> Optional[dict]:
+    """Analyze all mini GIF files together and return the roster-wide sprite dictionary words.
+
+    Returns:
+        dict: 'shared' (key, value) words, per-mon 'mons' entries indexed by monster name,
+              'raw_words' per mon (IMG_n plus PAL_n words with plain bit-packing) and
+              'codec_words' per mon (IMG_HDR, IMG_n and PAL_n words with per-mon codecs)
+    """
+    imgs_dir = os.path.join(base_path, "drool", "imgs")
+    if not os.path.exists(imgs_dir):
+        print(f"Warning: Images directory not found: {imgs_dir}")
+        return None
+    gif_paths = [os.path.join(imgs_dir, f) for f in sorted(os.listdir(imgs_dir)) if f.endswith('_mini.gif')]
+
+    def compute() -> dict:
+        sprites = {}
+        raw_words = {}
+        codec_words = {}
+        for gif_path in gif_paths:
+            result = analyze_gif(gif_path, max_colors)
+            if not result:
+                print(f"    Failed to process {os.path.basename(gif_path)}")
+                continue
+            mon_name = os.path.basename(gif_path).replace('_mini.gif', '').lower()
+            sprites[mon_name] = ([palette_color_to_rgb(rgba) for rgba in result['palette']], result['indexed_frame'])
+            raw_words[mon_name] = (len(compress_to_uint256(result['indexed_frame'], result['bits_needed'])) +
+                                   len(compress_palette_to_uint256(result['palette'])))
+            codec_words[mon_name] = (1 + len(encode_sprite(result['indexed_frame'], result['bits_needed'], codecs)['words']) +
+                                     len(compress_palette_to_uint256(result['palette'])))
+
+        dictionary = build_sprite_dictionary(sprites, codecs=codecs)
+        return {
+            'shared': dictionary.shared_metadata(),
+            'mons': {name: {key: entry[key] for key in ('header', 'sprite', 'tile_map', 'palette_refs')}
+                     for name, entry in dictionary.mons.items()},
+            'raw_words': raw_words,
+            'codec_words': codec_words
+        }
+
+    if cache is None:
+        return compute()
+    key = content_hash(*[file_hash(path).encode() for path in gif_paths], ",".join(codecs or CODECS).encode(),
+                       str(max_colors).encode())
+    return cache.get_or_compute("sprite_dictionary", key, compute)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Palette quantization for sprites with more colors than the --max-colors budget.
+
+quantize_frame works on a frame's unique colors weighted by pixel count: median cut in CIELAB
+(so boxes split by perceptual distance), a few weighted k-means passes to refine the clusters,
+then each cluster replaced by its most common source color, so no new colors appear. Fully
+transparent colors are kept exactly and count toward the budget.
+
+analyze_gif calls it for over-budget frames. To compare budgets on every sprite in drool/imgs,
+run from the repository root:
+    python python/bench_sprite_quantize.py --colors 4 8 16
+"""
+
+from typing import Tuple
+import numpy as np
+
+from sprite_index import pack_rgba
+
+DEFAULT_MAX_COLORS = 16
+DEFAULT_KMEANS_ITERATIONS = 8
+
+# sRGB (D65) -> XYZ, and the D65 reference white
+SRGB_TO_XYZ = np.array([[0.4124564, 0.3575761, 0.1804375],
+                        [0.2126729, 0.7151522, 0.0721750],
+                        [0.0193339, 0.1191920, 0.9503041]])
+D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+
+
+def rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """Convert (..., 3) sRGB values in 0-255 to CIELAB"""
+    c = np.asarray(rgb, dtype=np.float64) / 255.0
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ SRGB_TO_XYZ.T / D65_WHITE
+    f = np.where(xyz > (6 / 29) ** 3, np.cbrt(xyz), xyz / (3 * (6 / 29) ** 2) + 4 / 29)
+    return np.stack([116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])], axis=-1)
+
+
+def median_cut(colors: np.ndarray, weights: np.ndarray, num_colors: int) -> np.ndarray:
+    """Split weighted colors into at most num_colors boxes by median cut.
+
+    The box with the largest weighted channel range is split at the weighted median of that
+    channel until there are num_colors boxes or no box can be split.
+
+    Args:
+        colors: (N, C) unique colors
+        weights: (N,) pixel count of each color
+
+    Returns:
+        (N,) box label of each color
+    """
+    labels = np.zeros(len(colors), dtype=np.int64)
+    for box in range(1, num_colors):
+        best = None
+        for label in range(box):
+            members = np.flatnonzero(labels == label)
+            if len(members) < 2:
+                continue
+            spread = colors[members].max(axis=0) - colors[members].min(axis=0)
+            channel = int(spread.argmax())
+            score = spread[channel] * weights[members].sum()
+            if score > 0 and (best is None or score > best[0]):
+                best = (score, members, channel)
+        if best is None:
+            break
+
+        _, members, channel = best
+        order = members[np.argsort(colors[members, channel], kind='stable')]
+        cumulative = np.cumsum(weights[order])
+        # First color past half the box's pixels starts the new box; keep both halves non-empty
+        split = int(np.clip(np.searchsorted(cumulative, cumulative[-1] / 2, side='right'), 1, len(order) - 1))
+        labels[order[split:]] = box
+    return labels
+
+
+def weighted_centroids(colors: np.ndarray, weights: np.ndarray, labels: np.ndarray, num_labels: int) -> np.ndarray:
+    totals = np.bincount(labels, weights=weights, minlength=num_labels)
+    sums = np.stack([np.bincount(labels, weights=weights * colors[:, c], minlength=num_labels)
+                     for c in range(colors.shape[1])], axis=1)
+    return sums / np.maximum(totals, 1e-12)[:, None]
+
+
+def quantize_frame(frame_array: np.ndarray, max_colors: int = DEFAULT_MAX_COLORS,
+                   kmeans_iterations: int = DEFAULT_KMEANS_ITERATIONS) -> Tuple[np.ndarray, dict]:
+    """Reduce an RGBA frame to at most max_colors colors.
+
+    Fully transparent colors are kept exactly and count towards the budget; the opaque colors
+    are clustered by median cut in CIELAB, refined with a few weighted k-means iterations, and
+    replaced by their cluster's most common member so the palette only holds colors from the
+    source image.
+
+    Returns:
+        tuple: (quantized (H, W, 4) uint8 frame, report) where report has the color counts and
+               the mean/max CIEDE76 error over opaque pixels
+    """
+    frame_array = np.ascontiguousarray(frame_array, dtype=np.uint8)
+    packed = pack_rgba(frame_array).ravel()
+    unique_colors, inverse, counts = np.unique(packed, return_inverse=True, return_counts=True)
+    rgba = frame_array.reshape(-1, 4)[np.unique(inverse, return_index=True)[1]]
+
+    transparent = rgba[:, 3] == 0
+    opaque = np.flatnonzero(~transparent)
+    budget = max_colors - int(transparent.sum())
+    report = {'colors_before': len(unique_colors), 'colors_after': len(unique_colors),
+              'mean_delta_e': 0.0, 'max_delta_e': 0.0}
+    if len(unique_colors) <= max_colors or len(opaque) == 0:
+        return frame_array, report
+    if budget < 1:
+        raise ValueError(f"Cannot quantize to {max_colors} colors: frame has {int(transparent.sum())} transparent colors")
+
+    lab = rgb_to_lab(rgba[opaque, :3])
+    weights = counts[opaque].astype(np.float64)
+    labels = median_cut(lab, weights, budget)
+    num_labels = int(labels.max()) + 1
+
+    for _ in range(kmeans_iterations):
+        centroids = weighted_centroids(lab, weights, labels, num_labels)
+        distances = ((lab[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+        new_labels = distances.argmin(axis=1)
+        # Drop clusters that lost all members so labels stay dense
+        new_labels = np.unique(new_labels, return_inverse=True)[1]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        num_labels = int(labels.max()) + 1
+
+    # Representative of each cluster: its most common member color
+    representative = np.empty(num_labels, dtype=np.int64)
+    for label in range(num_labels):
+        members = np.flatnonzero(labels == label)
+        representative[label] = members[weights[members].argmax()]
+
+    mapping = np.arange(len(unique_colors))
+    mapping[opaque] = opaque[representative[labels]]
+    quantized = rgba[mapping[inverse]].reshape(frame_array.shape)
+
+    delta_e = np.sqrt(((lab - lab[representative[labels]]) ** 2).sum(axis=1))
+    report.update({
+        'colors_after': int(transparent.sum()) + num_labels,
+        'mean_delta_e': float((delta_e * weights).sum() / weights.sum()),
+        'max_delta_e': float(delta_e.max()),
+    })
+    return quantized, report
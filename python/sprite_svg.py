@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Reference SVG renderer for the sprite metadata words written by mon_stats_to_sol.py.
+
+Decodes a mon's IMG_HDR, IMG_n and PAL_n words into 24-bit pixels and draws them as SVG
+<rect>s grouped by fill colour. Transparent pixels (the RGB(1,1,1) palette sentinel) are not
+drawn. Three ways of covering the pixels with rects are compared:
+
+- pixels: one rect per opaque pixel, the naive renderer
+- runs: one rect per horizontal run of a colour
+- rects: greedy merge, repeatedly taking the largest single-colour rectangle not yet drawn
+
+The rect count is the loop count an on-chain renderer pays, and the SVG size is what it
+returns, so this gives an offline measure before tuning src/lib/MonSVGRenderer.sol.
+
+Run from the repository root:
+    python python/sprite_svg.py --out-dir svg
+"""
+
+import argparse
+import os
+from typing import Callable, Dict, List, Tuple
+import numpy as np
+
+from bitpack import unpack_chunks
+from sprite_codecs import decode_sprite
+
+# palette_color_to_rgb's encoding of a fully transparent pixel
+TRANSPARENT_RGB = 0x010101
+TRANSPARENT = -1
+COLORS_PER_WORD = 10  # Same as compress_palette_to_uint256
+RGB_BITS = 24
+
+# (x, y, width, height, 24-bit colour)
+Rect = Tuple[int, int, int, int, int]
+
+
+def decode_mon_pixels(header: int, sprite_words: List[int], palette_words: List[int]) -> np.ndarray:
+    """(H, W) array of 24-bit colours, TRANSPARENT where nothing is drawn.
+
+    The palette only holds colours the sprite uses, so its length is the largest index + 1.
+    """
+    indexed = decode_sprite(header, sprite_words).astype(np.int64)
+    num_colors = int(indexed.max()) + 1 if indexed.size else 0
+    palette = unpack_chunks(palette_words, RGB_BITS, COLORS_PER_WORD, num_colors).astype(np.int64)
+    pixels = palette[indexed]
+    pixels[pixels == TRANSPARENT_RGB] = TRANSPARENT
+    return pixels
+
+
+def pixel_rects(pixels: np.ndarray) -> List[Rect]:
+    ys, xs = np.nonzero(pixels != TRANSPARENT)
+    return [(int(x), int(y), 1, 1, int(pixels[y, x])) for y, x in zip(ys, xs)]
+
+
+def run_rects(pixels: np.ndarray) -> List[Rect]:
+    rects = []
+    for y, row in enumerate(pixels.tolist()):
+        x = 0
+        while x < len(row):
+            end = x + 1
+            while end < len(row) and row[end] == row[x]:
+                end += 1
+            if row[x] != TRANSPARENT:
+                rects.append((x, y, end - x, 1, row[x]))
+            x = end
+    return rects
+
+
+def largest_rectangle(mask: np.ndarray) -> Tuple[int, int, int, int, int]:
+    """(area, x, y, width, height) of the largest all-True rectangle, first found on ties"""
+    best = (0, 0, 0, 0, 0)
+    height, width = mask.shape
+    heights = [0] * width
+    for y, row in enumerate(mask.tolist()):
+        heights = [h + 1 if filled else 0 for h, filled in zip(heights, row)]
+        # Largest rectangle in the histogram of column heights ending at row y
+        stack: List[Tuple[int, int]] = []
+        for x, h in enumerate(heights + [0]):
+            start = x
+            while stack and stack[-1][1] >= h:
+                start, stack_height = stack.pop()
+                area = stack_height * (x - start)
+                if area > best[0]:
+                    best = (area, start, y - stack_height + 1, x - start, stack_height)
+            stack.append((start, h))
+    return best
+
+
+def merged_rects(pixels: np.ndarray) -> List[Rect]:
+    """Greedy cover: draw the largest remaining single-colour rectangle until every pixel is drawn.
+
+    Colours never overlap, so only the colour just drawn needs its largest rectangle recomputed.
+    """
+    masks = {int(color): pixels == color for color in np.unique(pixels) if color != TRANSPARENT}
+    candidates = {color: largest_rectangle(mask) for color, mask in masks.items()}
+    rects = []
+    while candidates:
+        color = max(candidates, key=lambda c: (candidates[c][0], -c))
+        _, x, y, width, height = candidates[color]
+        rects.append((x, y, width, height, color))
+        masks[color][y:y + height, x:x + width] = False
+        if masks[color].any():
+            candidates[color] = largest_rectangle(masks[color])
+        else:
+            del candidates[color]
+    return rects
+
+
+RENDERERS: Dict[str, Callable[[np.ndarray], List[Rect]]] = {
+    "pixels": pixel_rects,
+    "runs": run_rects,
+    "rects": merged_rects,
+}
+
+
+def rasterize(rects: List[Rect], shape: Tuple[int, int]) -> np.ndarray:
+    """Paint rects back onto a TRANSPARENT canvas, to check a renderer covers exactly the pixels"""
+    canvas = np.full(shape, TRANSPARENT, dtype=np.int64)
+    for x, y, width, height, color in rects:
+        canvas[y:y + height, x:x + width] = color
+    return canvas
+
+
+def render_svg(rects: List[Rect], width: int, height: int) -> str:
+    """Compact SVG: one <g> per colour, zero x/y attributes left out"""
+    by_color: Dict[int, List[Rect]] = {}
+    for rect in rects:
+        by_color.setdefault(rect[4], []).append(rect)
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" shape-rendering="crispEdges">']
+    for color, color_rects in by_color.items():
+        parts.append(f'<g fill="#{color:06x}">')
+        for x, y, rect_width, rect_height, _ in color_rects:
+            position = (f' x="{x}"' if x else '') + (f' y="{y}"' if y else '')
+            parts.append(f'<rect{position} width="{rect_width}" height="{rect_height}"/>')
+        parts.append('</g>')
+    parts.append('</svg>')
+    return "".join(parts)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--base-path', default='.', help='Repository root holding drool/imgs (default: .)')
+    parser.add_argument('--out-dir', help='Write <mon>.svg files here, using --renderer')
+    parser.add_argument('--renderer', choices=list(RENDERERS), default='rects', help='Renderer for --out-dir')
+    parser.add_argument('--mon', action='append', help='Only render these mons (repeatable)')
+    parser.add_argument('--cache', help='Build cache path (default: the SetupMons generator\'s cache under --base-path)')
+    parser.add_argument('--no-cache', action='store_true', help='Decode every GIF without the build cache')
+
+
+def run(args: argparse.Namespace) -> None:
+    # Imported here so the rendering functions above don't pull in the whole generator
+    from build_cache import BuildCache
+    from mon_stats_to_sol import DEFAULT_CACHE_PATH
+    from sprite_pipeline import analyze_sprite_images
+
+    base_path = args.base_path
+    cache = None if args.no_cache else BuildCache(args.cache or os.path.join(base_path, DEFAULT_CACHE_PATH))
+    sprite_data, palette_data, sprite_headers = analyze_sprite_images(base_path, cache)
+    if cache is not None:
+        cache.save()
+    names = sorted(name.lower() for name in args.mon) if args.mon else sorted(sprite_data)
+    if args.out_dir:
+        os.makedirs(args.out_dir, exist_ok=True)
+
+    print(f"\n{'mon':<12} {'opaque':>6} " + " ".join(f"{name + ' rects':>11} {name + ' bytes':>11}"
+                                                    for name in RENDERERS))
+    totals = {name: [0, 0] for name in RENDERERS}
+    for name in names:
+        if name not in sprite_data:
+            print(f"{name}: no sprite")
+            continue
+        pixels = decode_mon_pixels(sprite_headers[name], sprite_data[name], palette_data[name])
+        height, width = pixels.shape
+        row = f"{name:<12} {int((pixels != TRANSPARENT).sum()):>6}"
+        for renderer, render in RENDERERS.items():
+            rects = render(pixels)
+            if not np.array_equal(rasterize(rects, pixels.shape), pixels):
+                raise AssertionError(f"{name}: {renderer} rects do not reproduce the sprite")
+            svg = render_svg(rects, width, height)
+            totals[renderer][0] += len(rects)
+            totals[renderer][1] += len(svg)
+            row += f" {len(rects):>11} {len(svg):>11,}"
+            if args.out_dir and renderer == args.renderer:
+                with open(os.path.join(args.out_dir, f"{name}.svg"), 'w', encoding='utf-8') as f:
+                    f.write(svg)
+        print(row)
+    print(f"{'total':<12} {'':>6}" + "".join(f" {rects:>11} {size:>11,}" for rects, size in totals.values()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render sprite metadata words as SVG and compare rect merging')
+    add_arguments(parser)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
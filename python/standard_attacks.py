@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Recognise moves that are plain StandardAttacks and pack their parameters for StandardAttackFactory.
+
+A move qualifies when its contract only forwards constant ATTACK_PARAMS to the StandardAttack
+constructor: it extends StandardAttack, takes just the engine and type calculator, declares no
+functions of its own and has no effect. Its moves.csv row must be marked implemented and agree
+with the contract's power, stamina, accuracy, priority, type and class.
+
+Qualifying moves are created with StandardAttackFactory.createAttack. The numeric parameters
+are packed into one uint256, LSB first in STANDARD_ATTACK_FIELDS order, and unpacked by the
+createStandardAttack free function emitted into the script.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from game_data import (DEFAULT_ACCURACY, DEFAULT_CRIT_RATE, DEFAULT_PRIORITY, DEFAULT_STAMINA, DEFAULT_VOL,
+                       MOVE_CLASS_INDEX, MOVE_CLASSES, TYPE_INDEX, TYPE_NAMES)
+
+# (ATTACK_PARAMS field, bits, Solidity type) in packing order
+STANDARD_ATTACK_FIELDS: List[Tuple[str, int, str]] = [
+    ("BASE_POWER", 32, "uint32"),
+    ("STAMINA_COST", 32, "uint32"),
+    ("ACCURACY", 32, "uint32"),
+    ("PRIORITY", 32, "uint32"),
+    ("MOVE_TYPE", 8, "Type"),
+    ("EFFECT_ACCURACY", 32, "uint32"),
+    ("MOVE_CLASS", 8, "MoveClass"),
+    ("CRIT_RATE", 32, "uint32"),
+    ("VOLATILITY", 32, "uint32"),
+]
+
+# Mirrors src/Constants.sol (as used in ATTACK_PARAMS literals)
+CONSTANTS = {
+    "DEFAULT_PRIORITY": DEFAULT_PRIORITY,
+    "DEFAULT_STAMINA": DEFAULT_STAMINA,
+    "DEFAULT_CRIT_RATE": DEFAULT_CRIT_RATE,
+    "DEFAULT_VOL": DEFAULT_VOL,
+    "DEFAULT_ACCRUACY": DEFAULT_ACCURACY,
+}
+
+STANDARD_ATTACK_CONTRACT_PATTERN = re.compile(r'^\s*contract\s+(\w+)\s+is\s+StandardAttack\s*\{', re.MULTILINE)
+CONSTRUCTOR_PARAMS_PATTERN = re.compile(r'constructor\s*\(([^)]*)\)')
+ATTACK_PARAMS_PATTERN = re.compile(r'ATTACK_PARAMS\s*\(\s*\{(.*?)\}\s*\)', re.DOTALL)
+PARAM_FIELD_PATTERN = re.compile(r'(\w+)\s*:\s*("[^"]*"|[^,\n]+?)\s*(?:,|$)', re.MULTILINE)
+NO_EFFECT = "IEffect(address(0))"
+
+
+def param_value(expression: str) -> Optional[int]:
+    """Evaluate an ATTACK_PARAMS field expression: a number, a known constant or an enum member"""
+    expression = expression.strip()
+    if expression.isdigit():
+        return int(expression)
+    if expression in CONSTANTS:
+        return CONSTANTS[expression]
+    enum_name, _, member = expression.partition(".")
+    if enum_name == "Type" and member in TYPE_INDEX:
+        return TYPE_INDEX[member]
+    if enum_name == "MoveClass" and member in MOVE_CLASS_INDEX:
+        return MOVE_CLASS_INDEX[member]
+    return None
+
+
+def parse_standard_attack(source: str) -> Optional[dict]:
+    """Return the ATTACK_PARAMS of a contract that is nothing but a StandardAttack, else None.
+
+    Returns:
+        dict: NAME plus every STANDARD_ATTACK_FIELDS field as an int
+    """
+    if not STANDARD_ATTACK_CONTRACT_PATTERN.search(source) or re.search(r'\bfunction\b', source):
+        return None
+    constructor = CONSTRUCTOR_PARAMS_PATTERN.search(source)
+    if constructor is None or [param.split()[0] for param in constructor.group(1).split(",") if param.strip()] != \
+            ["IEngine", "ITypeCalculator"]:
+        return None
+    # The constructor body must be empty: everything happens in the StandardAttack call
+    if not re.search(r'\)\s*\)\s*\{\s*\}\s*\}\s*$', source):
+        return None
+    literal = ATTACK_PARAMS_PATTERN.search(source)
+    if literal is None:
+        return None
+
+    fields = dict(PARAM_FIELD_PATTERN.findall(literal.group(1)))
+    if fields.get("EFFECT", "").replace(" ", "") != NO_EFFECT or not fields.get("NAME", "").startswith('"'):
+        return None
+    params = {"NAME": fields["NAME"].strip('"')}
+    for field, _, _ in STANDARD_ATTACK_FIELDS:
+        value = param_value(fields.get(field, ""))
+        if value is None:
+            return None
+        params[field] = value
+    if params["EFFECT_ACCURACY"] != 0:
+        return None
+    return params
+
+
+def csv_mismatches(params: dict, row: Dict[str, str]) -> List[str]:
+    """Fields where a moves.csv row disagrees with a contract's ATTACK_PARAMS (priority is relative to the default)"""
+    expected = {
+        "BASE_POWER": int(row["Power"]),
+        "STAMINA_COST": int(row["Stamina"]),
+        "ACCURACY": int(row["Accuracy"]),
+        "PRIORITY": DEFAULT_PRIORITY + int(row["Priority"]),
+        "MOVE_TYPE": TYPE_INDEX[row["Type"].strip()],
+        "MOVE_CLASS": MOVE_CLASS_INDEX[row["Class"].strip()],
+    }
+    return [field for field, value in expected.items() if params[field] != value]
+
+
+def classify_standard_attack(source: str, row: Dict[str, str]) -> Tuple[Optional[dict], str]:
+    """Return (ATTACK_PARAMS, reason): params if the move can come from StandardAttackFactory, else None"""
+    if row.get("Implementation", "").strip() != "Yes":
+        return None, "not marked implemented in moves.csv"
+    params = parse_standard_attack(source)
+    if params is None:
+        return None, "custom contract"
+    mismatches = csv_mismatches(params, row)
+    if mismatches:
+        return None, f"moves.csv disagrees with the contract on {', '.join(mismatches)}"
+    return params, "standard attack"
+
+
+def pack_attack_params(params: dict) -> int:
+    """Pack the numeric ATTACK_PARAMS fields into one uint256"""
+    packed = 0
+    shift = 0
+    for field, bits, _ in STANDARD_ATTACK_FIELDS:
+        if not 0 <= params[field] < 1 << bits:
+            raise ValueError(f"{field} value {params[field]} does not fit in {bits} bits")
+        packed |= params[field] << shift
+        shift += bits
+    return packed
+
+
+def unpack_attack_params(packed: int) -> dict:
+    """Inverse of pack_attack_params"""
+    params = {}
+    shift = 0
+    for field, bits, _ in STANDARD_ATTACK_FIELDS:
+        params[field] = (packed >> shift) & ((1 << bits) - 1)
+        shift += bits
+    return params
+
+
+def describe_attack_params(params: dict) -> str:
+    """Short human-readable form of ATTACK_PARAMS for comments and reports"""
+    return (f"{TYPE_NAMES[params['MOVE_TYPE']]} {MOVE_CLASSES[params['MOVE_CLASS']]}, power {params['BASE_POWER']}, "
+            f"stamina {params['STAMINA_COST']}, accuracy {params['ACCURACY']}")
+
+
+def create_standard_attack_function() -> List[str]:
+    """Solidity free function that unpacks pack_attack_params output and calls the factory"""
+    lines = [
+        "function createStandardAttack(StandardAttackFactory factory, string memory name, uint256 packed)",
+        "    returns (StandardAttack)",
+        "{",
+        "    return factory.createAttack(",
+        "        ATTACK_PARAMS({",
+        "            NAME: name,",
+    ]
+    shift = 0
+    for field, bits, solidity_type in STANDARD_ATTACK_FIELDS:
+        value = f"packed >> {shift}" if shift else "packed"
+        if solidity_type == "uint32":
+            lines.append(f"            {field}: uint32({value}),")
+        else:
+            lines.append(f"            {field}: {solidity_type}(uint8({value})),")
+        shift += bits
+    lines.extend([
+        f"            EFFECT: {NO_EFFECT}",
+        "        })",
+        "    );",
+        "}",
+        "",
+    ])
+    return lines
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Fast renderers for the type effectiveness chart (python/types.png).
+
+create_chart in type_chart_to_sol.py draws a 15x15 inch, 300 dpi matplotlib figure with one
+ax.text artist per cell, which takes seconds and grows with the square of the type count.
+The renderers here draw the same chart without matplotlib:
+
+- raster: the cell colours are filled straight from the NumPy matrix, and every distinct
+  string ("2", "½", each type name) is rendered to an alpha mask once and then stamped
+  wherever it appears
+- svg: one rect per non-neutral cell grouped by colour, with each cell glyph defined once
+  and placed with <use>
+
+write_chart also skips rendering when types.csv, the renderer and its code are unchanged
+and the output still holds what was rendered for them.
+"""
+
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+from build_cache import BuildCache, file_hash
+
+PYTHON_DIR = os.path.dirname(os.path.abspath(__file__))
+CHART_CACHE_PATH = os.path.join(".cache", "type_chart.json")
+# Modules whose code decides the chart, part of its cache key
+CHART_SOURCES = ["type_chart_render.py", "type_chart_to_sol.py"]
+
+TITLE = "Type Effectiveness Chart"
+# create_custom_cmap's colours at effectiveness 0, 1 and 2
+CHART_COLORS = ["#FF4136", "#FFFFFF", "#2ECC40"]
+# matplotlib's tab20, which colours the axis labels
+LABEL_COLORS = ["#1f77b4", "#aec7e8", "#ff7f0e", "#ffbb78", "#2ca02c", "#98df8a", "#d62728", "#ff9896", "#9467bd",
+                "#c5b0d5", "#8c564b", "#c49c94", "#e377c2", "#f7b6d2", "#7f7f7f", "#c7c7c7", "#bcbd22", "#dbdb8d",
+                "#17becf", "#9edae5"]
+# Text drawn in a cell per effectiveness (neutral cells stay empty)
+CELL_TEXT = {0.0: "0", 0.5: "½", 2.0: "2"}
+LEGEND_VALUES = [0.0, 0.5, 1.0, 2.0]
+# Spellings for fonts without a glyph, and a private use character no font draws, to detect that
+FALLBACK_TEXT = {"½": "1/2"}
+MISSING_GLYPH = "\U000F0000"
+# matplotlib's default font, so the raster looks like create_chart's figure where it is installed
+FONT_FILE = "DejaVuSans-Bold.ttf"
+
+DEFAULT_CELL_SIZE = 40
+
+
+def hex_to_rgb(color: str) -> Tuple[int, int, int]:
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+
+def chart_matrix(data: Dict[str, Dict[str, float]], types: List[str]) -> np.ndarray:
+    """(n, n) effectiveness matrix indexed [attacker, defender], as create_chart builds it"""
+    matrix = np.ones((len(types), len(types)))
+    for i, attacker in enumerate(types):
+        for j, defender in enumerate(types):
+            value = data.get(attacker, {}).get(defender, 1)
+            matrix[i, j] = 0.5 if value == 5 else value
+    return matrix
+
+
+def cell_colors(matrix: np.ndarray) -> np.ndarray:
+    """(..., 3) uint8 colours of effectiveness values, linear between CHART_COLORS like the colormap"""
+    stops = np.array([hex_to_rgb(color) for color in CHART_COLORS], dtype=np.float64)
+    channels = [np.interp(matrix, [0, 1, 2], stops[:, channel]) for channel in range(3)]
+    return np.rint(np.stack(channels, axis=-1)).astype(np.uint8)
+
+
+def label_color(i: int, n: int) -> str:
+    """plt.cm.tab20(i / n): tab20 has 20 entries, so types share colours once there are more than 20"""
+    return LABEL_COLORS[min(int(i / n * len(LABEL_COLORS)), len(LABEL_COLORS) - 1)]
+
+
+class GlyphCache:
+    """Strings rendered to alpha masks once, then stamped wherever they appear"""
+    def __init__(self, size: int):
+        from PIL import ImageFont
+        # The chart's text is bold; fallback fonts are made bold by overlaying the glyphs shifted a pixel
+        self.faux_bold = False
+        try:
+            self.font = ImageFont.truetype(FONT_FILE, size)
+        except OSError:
+            self.faux_bold = True
+            try:
+                self.font = ImageFont.load_default(size=size)
+            except TypeError:
+                # Pillow < 10.1 only has the fixed-size bitmap font
+                self.font = ImageFont.load_default()
+        self.missing = bytes(self.font.getmask(MISSING_GLYPH))
+        self.masks: Dict[str, np.ndarray] = {}
+
+    def drawable(self, text: str) -> str:
+        if text in FALLBACK_TEXT and bytes(self.font.getmask(text)) == self.missing:
+            return FALLBACK_TEXT[text]
+        return text
+
+    def mask(self, text: str) -> np.ndarray:
+        """(h, w) float32 coverage of text in [0, 1], cropped to its ink"""
+        if text not in self.masks:
+            from PIL import Image, ImageDraw
+            drawn = self.drawable(text)
+            left, top, right, bottom = self.font.getbbox(drawn)
+            image = Image.new("L", (right - left + 1, bottom - top), 0)
+            ImageDraw.Draw(image).text((-left, -top), drawn, fill=255, font=self.font)
+            alpha = np.asarray(image, dtype=np.float32) / 255
+            if self.faux_bold:
+                alpha[:, 1:] = np.maximum(alpha[:, 1:], alpha[:, :-1])
+            self.masks[text] = alpha
+        return self.masks[text]
+
+
+def stamp(canvas: np.ndarray, mask: np.ndarray, x: int, y: int, color: str) -> None:
+    """Alpha-blend color through mask onto canvas with the mask's top left corner at (x, y)"""
+    height, width = mask.shape
+    region = canvas[y:y + height, x:x + width].astype(np.float32)
+    alpha = mask[:, :, None]
+    blended = region * (1 - alpha) + np.array(hex_to_rgb(color), dtype=np.float32) * alpha
+    canvas[y:y + height, x:x + width] = np.rint(blended).astype(np.uint8)
+
+
+def stamp_centered(canvas: np.ndarray, mask: np.ndarray, center_x: float, center_y: float, color: str) -> None:
+    stamp(canvas, mask, int(round(center_x - mask.shape[1] / 2)), int(round(center_y - mask.shape[0] / 2)), color)
+
+
+def render_raster(matrix: np.ndarray, types: List[str], cell_size: int = DEFAULT_CELL_SIZE) -> np.ndarray:
+    """(H, W, 3) uint8 image of the chart: title, rotated column labels, row labels, grid and a legend"""
+    n = len(types)
+    pad = max(2, cell_size // 5)
+    cell_glyphs = GlyphCache(max(6, cell_size * 9 // 20))
+    label_glyphs = GlyphCache(max(6, cell_size * 7 // 20))
+    title_glyphs = GlyphCache(max(8, cell_size * 7 // 10))
+
+    labels = [label_glyphs.mask(name.upper()) for name in types]
+    label_length = max((mask.shape[1] for mask in labels), default=0)
+    title = title_glyphs.mask(TITLE)
+    grid = n * cell_size + 1  # Cells plus the closing grid line
+    grid_x = pad + label_length + pad
+    grid_y = pad + title.shape[0] + 2 * pad + label_length + pad
+    legend_y = grid_y + grid + 2 * pad
+    width = max(grid_x + grid, title.shape[1]) + pad
+    height = legend_y + cell_size + pad
+
+    canvas = np.full((height, width, 3), 255, dtype=np.uint8)
+    stamp_centered(canvas, title, width / 2, pad + title.shape[0] / 2, "#000000")
+
+    # Cells: one colour per cell, scaled up to cell_size pixels, then grid lines over them
+    cells = np.repeat(np.repeat(cell_colors(matrix), cell_size, axis=0), cell_size, axis=1)
+    canvas[grid_y:grid_y + n * cell_size, grid_x:grid_x + n * cell_size] = cells
+    for k in range(n + 1):
+        canvas[grid_y + k * cell_size, grid_x:grid_x + grid] = 0
+        canvas[grid_y:grid_y + grid, grid_x + k * cell_size] = 0
+
+    for i in range(n):
+        for j in range(n):
+            text = CELL_TEXT.get(float(matrix[i, j]))
+            if text:
+                stamp_centered(canvas, cell_glyphs.mask(text), grid_x + (j + 0.5) * cell_size,
+                               grid_y + (i + 0.5) * cell_size, "#000000")
+
+    for i, mask in enumerate(labels):
+        color = label_color(i, n)
+        # Row labels right-aligned against the grid, column labels reading upwards above it
+        stamp(canvas, mask, grid_x - pad - mask.shape[1], int(grid_y + (i + 0.5) * cell_size - mask.shape[0] / 2),
+              color)
+        column = np.rot90(mask)
+        stamp(canvas, column, int(grid_x + (i + 0.5) * cell_size - column.shape[1] / 2),
+              grid_y - pad - column.shape[0], color)
+
+    # Legend in place of the colour bar: a swatch per effectiveness with its cell text
+    legend_x = grid_x + (grid - len(LEGEND_VALUES) * cell_size) // 2
+    swatches = cell_colors(np.array(LEGEND_VALUES))
+    for k, value in enumerate(LEGEND_VALUES):
+        x = legend_x + k * cell_size
+        canvas[legend_y:legend_y + cell_size, x:x + cell_size] = 0
+        canvas[legend_y + 1:legend_y + cell_size - 1, x + 1:x + cell_size - 1] = swatches[k]
+        stamp_centered(canvas, cell_glyphs.mask(CELL_TEXT.get(value, "1")), x + cell_size / 2,
+                       legend_y + cell_size / 2, "#000000")
+    return canvas
+
+
+def render_svg(matrix: np.ndarray, types: List[str], cell_size: int = DEFAULT_CELL_SIZE) -> str:
+    """Compact SVG of the chart, drawn in cell units inside one scaled group"""
+    n = len(types)
+    label_size = 0.35
+    # No font metrics here, so label space is estimated from the longest name
+    label_length = max((len(name) for name in types), default=0) * label_size * 0.65 + 0.3
+    title_height = 1.2
+    width = (label_length + n + 0.5) * cell_size
+    height = (title_height + label_length + n + 1.8) * cell_size
+    colors = ["#%02x%02x%02x" % tuple(color) for color in cell_colors(matrix).reshape(-1, 3).tolist()]
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+             f'viewBox="0 0 {width:g} {height:g}" font-family="sans-serif" font-weight="bold">',
+             f'<rect width="{width:g}" height="{height:g}" fill="#fff"/>',
+             f'<text x="{width / 2:g}" y="{0.8 * cell_size:g}" font-size="{0.7 * cell_size:g}" '
+             f'text-anchor="middle">{TITLE}</text>',
+             f'<g transform="translate({label_length * cell_size:g} {(title_height + label_length) * cell_size:g}) '
+             f'scale({cell_size})">',
+             f'<defs>' + "".join(f'<text id="cell-{value:g}" text-anchor="middle" dy="0.35em">{text}</text>'
+                                  for value, text in CELL_TEXT.items()) + '</defs>']
+
+    # Neutral cells are the background; other cells are grouped by colour
+    parts.append(f'<rect width="{n}" height="{n}" fill="{CHART_COLORS[1]}"/>')
+    by_color: Dict[str, List[Tuple[int, int]]] = {}
+    for index, color in enumerate(colors):
+        if matrix.flat[index] != 1:
+            by_color.setdefault(color, []).append(divmod(index, n))
+    for color, cells in by_color.items():
+        parts.append(f'<g fill="{color}">' + "".join(f'<rect x="{j}" y="{i}" width="1" height="1"/>'
+                                                     for i, j in cells) + '</g>')
+
+    parts.append('<g font-size="0.45">' + "".join(
+        f'<use xlink:href="#cell-{float(matrix[i, j]):g}" x="{j + 0.5:g}" y="{i + 0.5:g}"/>'
+        for i in range(n) for j in range(n) if float(matrix[i, j]) in CELL_TEXT) + '</g>')
+    lines = "".join(f"M0 {k}h{n}M{k} 0v{n}" for k in range(n + 1))
+    parts.append(f'<path d="{lines}" stroke="#000" stroke-width="1" vector-effect="non-scaling-stroke" fill="none"/>')
+
+    parts.append(f'<g font-size="{label_size}">')
+    for i, name in enumerate(types):
+        color = label_color(i, n)
+        parts.append(f'<text x="-0.15" y="{i + 0.5:g}" dy="0.35em" text-anchor="end" fill="{color}">'
+                     f'{name.upper()}</text>')
+        parts.append(f'<text transform="translate({i + 0.5:g} -0.15) rotate(-90)" dy="0.35em" '
+                     f'fill="{color}">{name.upper()}</text>')
+    parts.append('</g>')
+
+    legend_x = (n - len(LEGEND_VALUES)) / 2
+    for k, value in enumerate(LEGEND_VALUES):
+        color = "#%02x%02x%02x" % tuple(cell_colors(np.array(value)).tolist())
+        parts.append(f'<rect x="{legend_x + k:g}" y="{n + 0.3:g}" width="1" height="1" fill="{color}" stroke="#000" '
+                     f'stroke-width="1" vector-effect="non-scaling-stroke"/>')
+        parts.append(f'<text x="{legend_x + k + 0.5:g}" y="{n + 0.8:g}" dy="0.35em" font-size="0.45" '
+                     f'text-anchor="middle">{CELL_TEXT.get(value, "1")}</text>')
+    parts.append('</g></svg>')
+    return "".join(parts)
+
+
+def write_raster(data: Dict[str, Dict[str, float]], types: List[str], output_path: str,
+                 cell_size: int = DEFAULT_CELL_SIZE) -> None:
+    from PIL import Image
+    Image.fromarray(render_raster(chart_matrix(data, types), types, cell_size)).save(output_path)
+
+
+def write_svg(data: Dict[str, Dict[str, float]], types: List[str], output_path: str,
+              cell_size: int = DEFAULT_CELL_SIZE) -> None:
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(render_svg(chart_matrix(data, types), types, cell_size))
+
+
+def write_matplotlib(data: Dict[str, Dict[str, float]], types: List[str], output_path: str,
+                     cell_size: int = DEFAULT_CELL_SIZE) -> None:
+    # The figure size is fixed, so cell_size doesn't apply
+    from type_chart_to_sol import create_chart
+    create_chart(data, types, output_path)
+
+
+RENDERERS: Dict[str, Callable[[Dict[str, Dict[str, float]], List[str], str, int], None]] = {
+    "matplotlib": write_matplotlib,
+    "raster": write_raster,
+    "svg": write_svg,
+}
+
+
+def chart_key(types_csv: str, renderer: str, cell_size: int) -> str:
+    sources = [file_hash(os.path.join(PYTHON_DIR, name)).encode() for name in CHART_SOURCES]
+    return file_hash(types_csv, renderer.encode(), str(cell_size).encode(), *sources)
+
+
+def write_chart(types_csv: str, output_path: str, renderer: str = "matplotlib", cell_size: int = DEFAULT_CELL_SIZE,
+                cache: Optional[BuildCache] = None) -> bool:
+    """Render the chart for types_csv to output_path unless it is already up to date.
+
+    The cache maps (types.csv, renderer, cell size, renderer code) to the hash of the file
+    rendered for them, so the chart is skipped when those and the output are all unchanged.
+    Returns True if the chart was rendered.
+    """
+    def render() -> str:
+        from type_chart_to_sol import read_csv_for_graph
+        data, types = read_csv_for_graph(types_csv)
+        RENDERERS[renderer](data, types, output_path, cell_size)
+        return file_hash(output_path)
+
+    if cache is None:
+        render()
+        return True
+    rendered = []
+    expected = cache.get_or_compute("type_chart", chart_key(types_csv, renderer, cell_size),
+                                    lambda: rendered.append(True) or render())
+    if rendered:
+        return True
+    if os.path.exists(output_path) and file_hash(output_path) == expected:
+        return False
+    # Deleted or edited since it was rendered; the renderers are deterministic, so the entry still holds
+    render()
+    return True
@@ -1,75 +1,71 @@
+import argparse
 import csv
-import matplotlib.pyplot as plt
+import os
+import sys
 import numpy as np
-from matplotlib.colors import LinearSegmentedColormap
-
-def multiplier_to_bits(m):
-    if m == 0:
-        return '00'
-    if m == 1:
-        return '01'
-    if m == 2:
-        return '10'
-    if m == 5:
-        return '11'
-    else:
-        raise ValueError(f"Invalid multiplier: {m}")
-
-def parse_csv_for_solidity(file_path):
-    v1 = ''
-    v2 = ''
-    with open(file_path, 'r') as f:
-        reader = csv.reader(f)
-        # Skip the header row
-        next(reader)  
-        for row in reader:
-            # Skip empty rows
-            if not row or all(cell.strip() == '' for cell in row):
-                continue
-            attacker, defender, multiplier = row
-            
-            # We prepend each new value so we can use right shifts later to extract out the right one
-            if len(v1) < 256:
-                v1 = multiplier_to_bits(int(multiplier)) + v1
-            else:
-                v2 = multiplier_to_bits(int(multiplier)) + v2
-    
-    # Prepend v2 with zeroes for the rest of it
-    v2 = ('0' * 62) + v2
-    return (int(v1, 2), int(v2, 2))
 
-def generate_solidity_contract(encoded_uints):
-    contract = f"""
-// SPDX-License-Identifier: AGPL-3.0
+from build_cache import BuildCache, write_if_changed
+from type_chart_render import CHART_CACHE_PATH, DEFAULT_CELL_SIZE, RENDERERS, write_chart
+from type_layout import LAYOUTS, compare_layouts, constant_declaration, print_layout_report, word_selector_lines
+from type_layout import load_type_chart as load_layout_chart
+from type_tables import NUM_TYPE_VALUES, TYPE_BITS, DualTable, accessor_multipliers
+
+def generate_solidity_contract(layout, words, dual_table, dual_words):
+    constants, functions = layout.solidity(words)
+    dual_constants = "\n".join(constant_declaration(f"DUAL_MULTIPLIERS_{i}", f"0x{word:064x}")
+                                for i, word in enumerate(dual_words))
+    expressions = dual_table.expressions()
+    if len(expressions) == 1:
+        dual_cases = f"        return {expressions[0]};"
+    else:
+        dual_cases = "\n".join(
+            f"        {'if' if code == 0 else '} else if'} (code == {code}) {{\n            return {expression};"
+            for code, expression in enumerate(expressions[:-1]))
+        dual_cases += f"\n        }} else {{\n            return {expressions[-1]};\n        }}"
+    per_word, code_bits = dual_table.entries_per_word, dual_table.code_bits
+    dual_selector = word_selector_lines("wordIndex", "DUAL_MULTIPLIERS_", len(dual_words))
+    if len(dual_words) < dual_table.num_entry_words:
+        # Words past the last nonzero one aren't stored: their entries are all code 0
+        dual_selector = [f"        if (wordIndex > {len(dual_words) - 1}) {{", "            return 0;", "        }"] + dual_selector
+    dual_selector = "\n".join(dual_selector)
+    constants = "\n".join(constants)
+    functions = "\n".join(functions)
+    contract = f"""// SPDX-License-Identifier: AGPL-3.0
 pragma solidity ^0.8.0;
 
-import {{ITypeCalculator}} from "./ITypeCalculator.sol";
 import "../Enums.sol";
+import {{ITypeCalculator}} from "./ITypeCalculator.sol";
 
 contract TypeCalculator is ITypeCalculator {{
-    uint256 private constant MULTIPLIERS_1 = {encoded_uints[0]}; // First 128 type combinations
-    uint256 private constant MULTIPLIERS_2 = {encoded_uints[1]}; // Remaining 97 type combinations
-
-    function getTypeEffectiveness(Type attackerType, Type defenderType) external pure returns (uint32) {{
-        uint256 index = uint256(attackerType) * 15 + uint256(defenderType);
-        uint256 shift;
-        uint256 multipliers;
-        
-        if (index < 128) {{
-            shift = index * 2;
-            multipliers = MULTIPLIERS_1;
-        }} else {{
-            shift = (index - 128) * 2;
-            multipliers = MULTIPLIERS_2;
-        }}
-        
-        // Return the last 2 bits of the multipliers for the correct shift
-        return uint32((multipliers >> shift) & 3);
+    // Multiplier code for each attacker and defender, {layout.name} layout (see python/type_layout.py)
+{constants}
+
+    // Combined multiplier code (see python/type_tables.py) for each attacker << {2 * TYPE_BITS} | type1 << {TYPE_BITS} | type2,
+    // {code_bits} bits each, {per_word} per word
+{dual_constants}
+
+{functions}
+
+    function getDualTypeEffectiveness(Type attackerType, Type defenderType1, Type defenderType2, uint32 basePower)
+        external
+        pure
+        returns (uint32)
+    {{
+        uint256 index = (uint256(attackerType) << {2 * TYPE_BITS}) | (uint256(defenderType1) << {TYPE_BITS}) | uint256(defenderType2);
+        uint256 code = (_dualMultipliers(index / {per_word}) >> ((index % {per_word}) * {code_bits})) & {dual_table.mask};
+
+        // Same result as scaling by defenderType1 and then, unless it is Type.None, defenderType2
+{dual_cases}
+    }}
+
+    function _dualMultipliers(uint256 wordIndex) private pure returns (uint256) {{
+{dual_selector}
     }}
 }}
 """
     return contract
 
+
 def read_csv_for_graph(file_path):
     data = {}
     types = set()
@@ -90,10 +86,13 @@ def read_csv_for_graph(file_path):
     return data, sorted(list(types))
 
 def create_custom_cmap():
+    from matplotlib.colors import LinearSegmentedColormap
     colors = ['#FF4136', '#FFFFFF', '#2ECC40']
     return LinearSegmentedColormap.from_list("custom", colors, N=256)
 
-def create_chart(data, types):
+def create_chart(data, types, output_path="types.png"):
+    # Imported here: matplotlib takes longer to import than generating TypeCalculator.sol
+    import matplotlib.pyplot as plt
     n = len(types)
     matrix = np.ones((n, n))
     for i, attacker in enumerate(types):
@@ -152,19 +151,73 @@ def create_chart(data, types):
     ax.grid(which="minor", color="black", linestyle='-', linewidth=1)
     
     fig.tight_layout()
-    plt.savefig("types.png", bbox_inches='tight')
+    plt.savefig(output_path, bbox_inches='tight')
     plt.close()
 
+def generate_type_calculator(types_csv, layout_name='auto'):
+    """TypeCalculator.sol source for types.csv, raising ValueError for an unknown layout or a wrong packed table"""
+    if layout_name != 'auto' and layout_name not in LAYOUTS:
+        raise ValueError(f"Unknown layout {layout_name!r}, expected auto or one of: {', '.join(LAYOUTS)}")
+    chart = load_layout_chart(types_csv)
+    if chart.num_types >= NUM_TYPE_VALUES:
+        raise ValueError(f"{types_csv} has {chart.num_types} types, but src/Enums.sol (game_data.TYPE_NAMES) only has "
+                         f"{NUM_TYPE_VALUES - 1} besides None; add the new types there first")
+    # Try every layout on the single-type chart and report estimated gas per lookup
+    layouts = compare_layouts(chart)
+    print_layout_report(layouts)
+    chosen = layouts[0] if layout_name == 'auto' else next(result for result in layouts
+                                                           if result["layout"].name == layout_name)
+    print(f"Using {chosen['layout'].name} layout: {chosen['layout'].description}")
+
+    # Precompute attacker x (type1, type2) from what the emitted getTypeEffectiveness returns for every
+    # pair of Type values, Type.None included, and check it against calling that accessor twice
+    dual_table = DualTable(accessor_multipliers(chosen["layout"], chosen["words"]))
+    dual_words = dual_table.words()
+    errors = dual_table.verify(dual_words)
+    for error in errors[:10]:
+        print(f"  {error}")
+    if errors:
+        raise ValueError(f"Dual-type table disagrees with sequential getTypeEffectiveness in {len(errors)} cases")
+    print(f"Dual-type table: {len(dual_table.ops)} combined multipliers, {len(dual_words)} words, "
+          f"verified against sequential getTypeEffectiveness")
+
+    return generate_solidity_contract(chosen["layout"], chosen["words"], dual_table, dual_words)
+
+
 def main():
-    csv_file = './data/types.csv'
-    encoded_uints = parse_csv_for_solidity(csv_file)
-    solidity_contract = generate_solidity_contract(encoded_uints)
-    
-    with open('../src/types/TypeCalculator.sol', 'w') as f:
-        f.write(solidity_contract)
+    parser = argparse.ArgumentParser(description='Generate TypeCalculator.sol and the type chart from types.csv')
+    parser.add_argument('--types-csv', default=os.path.join('drool', 'types.csv'), help='Type chart CSV')
+    parser.add_argument('--output', default=os.path.join('src', 'types', 'TypeCalculator.sol'),
+                        help='Solidity file to write')
+    parser.add_argument('--chart', default=os.path.join('python', 'types.png'), help='Chart image to write')
+    parser.add_argument('--renderer', choices=list(RENDERERS), default='matplotlib',
+                        help='Chart renderer: matplotlib (create_chart), or raster/svg from type_chart_render.py, '
+                             'which take milliseconds')
+    parser.add_argument('--cell-size', type=int, default=DEFAULT_CELL_SIZE,
+                        help=f'Pixels per cell for the raster and svg renderers (default: {DEFAULT_CELL_SIZE})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Render the chart even if types.csv is unchanged since it was last rendered')
+    parser.add_argument('--layout', choices=['auto'] + list(LAYOUTS), default='auto',
+                        help='Packed layout of the single-type chart (auto picks the cheapest estimated lookup)')
+    args = parser.parse_args()
+
+    try:
+        solidity_contract = generate_type_calculator(args.types_csv, args.layout)
+    except ValueError as e:
+        sys.exit(str(e))
+    if write_if_changed(args.output, solidity_contract):
+        print(f"Generated {args.output}")
+    else:
+        print(f"{args.output} unchanged")
+
+    cache = None if args.no_cache else BuildCache(CHART_CACHE_PATH)
+    if write_chart(args.types_csv, args.chart, args.renderer, args.cell_size, cache):
+        print(f"Generated {args.chart}")
+    else:
+        print(f"{args.chart} unchanged")
+    if cache is not None:
+        cache.save()
+
 
-    data, types = read_csv_for_graph(csv_file)
-    create_chart(data, types)
-    
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""Packed layouts for the single-type chart read by TypeCalculator.getTypeEffectiveness.
+
+The type count and the multiplier alphabet come from types.csv, so adding a type or a new
+multiplier only needs the CSV (and src/Enums.sol) to change. Each layout in LAYOUTS decides
+how the chart's codes are split across uint256 constants, emits the Solidity that finds an
+entry and estimates the gas of one lookup, so layouts can be compared before choosing one.
+
+A layout's word index and shift are Solidity expressions of `attacker` and `defender`. The
+Python lookup evaluates those same strings, so verifying a layout checks the code that ships.
+"""
+
+import csv
+import math
+from collections import Counter
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, List, Tuple
+import numpy as np
+
+from bitpack import WORD_BITS, pack_int
+from game_data import MULTIPLIER_CODES, TYPE_NAMES
+
+# types.csv has always written half effectiveness as 5
+LEGACY_MULTIPLIERS = {"5": Fraction(1, 2)}
+
+# Alphabet order for multipliers TypeCalculator already knows, so their codes never change
+KNOWN_MULTIPLIERS = [LEGACY_MULTIPLIERS.get(str(value), Fraction(value))
+                     for value, _ in sorted(MULTIPLIER_CODES.items(), key=lambda item: item[1])]
+
+# Rough per-opcode gas (Berlin schedule) for comparing layouts, not for exact accounting
+OPCODE_GAS = {"ADD": 3, "SHL": 3, "SHR": 3, "AND": 3, "MUL": 5, "DIV": 5, "MOD": 5, "PUSH": 3}
+# PUSH constant, LT/EQ, PUSH destination, JUMPI, JUMPDEST
+BRANCH_GAS = 3 + 3 + 3 + 10 + 1
+# Jump into and back out of a private function, with its argument and return address
+INTERNAL_CALL_GAS = 2 * (3 + 8 + 1)
+CODE_DEPOSIT_GAS_PER_BYTE = 200
+
+# forge fmt's line length, used to wrap long constant declarations the same way
+LINE_LENGTH = 120
+
+
+def parse_multiplier(text: str) -> Fraction:
+    text = text.strip()
+    return LEGACY_MULTIPLIERS.get(text, Fraction(text))
+
+
+def multiplier_expression(multiplier: Fraction) -> str:
+    """Solidity expression scaling basePower by multiplier (integer division rounds down)"""
+    if multiplier == 0:
+        return "0"
+    expression = "basePower"
+    if multiplier.numerator != 1:
+        expression += f" * {multiplier.numerator}"
+    if multiplier.denominator != 1:
+        expression += f" / {multiplier.denominator}"
+    return expression
+
+
+class TypeChart:
+    """types.csv as a matrix of alphabet codes indexed [attacker, defender]"""
+    def __init__(self, type_names: List[str], multipliers: List[Fraction], codes: np.ndarray):
+        self.type_names = type_names
+        self.multipliers = multipliers  # Code -> multiplier
+        self.codes = codes
+
+    @property
+    def num_types(self) -> int:
+        return len(self.type_names)
+
+    def code_frequencies(self) -> np.ndarray:
+        return np.bincount(self.codes.ravel(), minlength=len(self.multipliers)) / self.codes.size
+
+
+def load_type_chart(file_path: str) -> TypeChart:
+    """Read types.csv, taking types in order of first appearance as attacker.
+
+    Multipliers TypeCalculator already knows keep their codes; new ones are appended in
+    ascending order. Raises ValueError if any attacker/defender pair is missing.
+    """
+    entries: Dict[Tuple[str, str], Fraction] = {}
+    type_names: List[str] = []
+    with open(file_path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader)  # Skip header
+        for row in reader:
+            if not row or all(cell.strip() == '' for cell in row):
+                continue
+            attacker, defender, multiplier = (cell.strip() for cell in row)
+            if attacker not in type_names:
+                type_names.append(attacker)
+            entries[attacker, defender] = parse_multiplier(multiplier)
+
+    missing = [f"{attacker}/{defender}" for attacker in type_names for defender in type_names
+               if (attacker, defender) not in entries]
+    if missing:
+        raise ValueError(f"{file_path} has no multiplier for {', '.join(missing)}")
+    if type_names != TYPE_NAMES[:len(type_names)]:
+        print(f"Warning: {file_path} types are not in src/Enums.sol order: {', '.join(type_names)}")
+
+    multipliers = KNOWN_MULTIPLIERS + sorted(set(entries.values()).difference(KNOWN_MULTIPLIERS))
+    code = {m: i for i, m in enumerate(multipliers)}
+    codes = np.array([[code[entries[attacker, defender]] for defender in type_names] for attacker in type_names],
+                     dtype=np.uint8)
+    return TypeChart(type_names, multipliers, codes)
+
+
+def is_power_of_two(value: int) -> bool:
+    return value > 0 and value & (value - 1) == 0
+
+
+def scaled(expression: str, factor: int, ops: Counter) -> str:
+    """expression * factor, as a shift when factor is a power of two"""
+    if factor == 1 or expression == "0":
+        return expression
+    ops["PUSH"] += 1
+    if is_power_of_two(factor):
+        ops["SHL"] += 1
+        return f"({expression} << {factor.bit_length() - 1})"
+    ops["MUL"] += 1
+    return f"({expression} * {factor})"
+
+
+def divided(expression: str, divisor: int, ops: Counter) -> str:
+    if divisor == 1:
+        return expression
+    ops["PUSH"] += 1
+    if is_power_of_two(divisor):
+        ops["SHR"] += 1
+        return f"({expression} >> {divisor.bit_length() - 1})"
+    ops["DIV"] += 1
+    return f"({expression} / {divisor})"
+
+
+def modulo(expression: str, divisor: int, ops: Counter) -> str:
+    if divisor == 1:
+        return "0"
+    ops["PUSH"] += 1
+    if is_power_of_two(divisor):
+        ops["AND"] += 1
+        return f"({expression} & {divisor - 1})"
+    ops["MOD"] += 1
+    return f"({expression} % {divisor})"
+
+
+def added(left: str, right: str, ops: Counter) -> str:
+    if left == "0":
+        return right
+    if right == "0":
+        return left
+    ops["ADD"] += 1
+    return f"{left} + {right}"
+
+
+def unwrapped(expression: str) -> str:
+    """expression without a pair of parentheses enclosing all of it"""
+    if not (expression.startswith("(") and expression.endswith(")")):
+        return expression
+    depth = 0
+    for i, char in enumerate(expression):
+        depth += {"(": 1, ")": -1}.get(char, 0)
+        if depth == 0 and i < len(expression) - 1:
+            return expression
+    return expression[1:-1]
+
+
+@lru_cache(maxsize=None)
+def compiled_expression(expression: str):
+    """A layout's Solidity index expression compiled as Python once, since locate runs it per entry"""
+    return compile(expression.replace(" / ", " // "), "<layout>", "eval")
+
+
+def evaluate(expression: str, variables: Dict[str, int]) -> int:
+    """Evaluate a layout's Solidity index expression for uint256 operands"""
+    return eval(compiled_expression(expression), {}, variables)
+
+
+def constant_declaration(name, value, comment=""):
+    """A uint256 constant declaration, wrapped after '=' if the code would exceed LINE_LENGTH"""
+    comment = f" // {comment}" if comment else ""
+    line = f"    uint256 private constant {name} = {value};"
+    if len(line) <= LINE_LENGTH:
+        return line + comment
+    return f"    uint256 private constant {name} =\n        {value};{comment}"
+
+
+def selector_depths(num_words: int, low: int = 0, high: int = None, depth: int = 0) -> List[int]:
+    """Comparisons word_selector_lines makes before returning each word"""
+    if high is None:
+        high = num_words
+    if high - low == 1:
+        return [depth]
+    mid = (low + high) // 2
+    return selector_depths(num_words, low, mid, depth + 1) + selector_depths(num_words, mid, high, depth + 1)
+
+
+def word_selector_lines(name, prefix, num_words, indent="        ", low=0, high=None):
+    """Body of a function returning constant {prefix}{i} for argument {name} = i, as a binary search"""
+    if high is None:
+        high = num_words
+    if high - low == 1:
+        return [f"{indent}return {prefix}{low};"]
+    mid = (low + high) // 2
+    return ([f"{indent}if ({name} < {mid}) {{"] +
+            word_selector_lines(name, prefix, num_words, indent + "    ", low, mid) +
+            [f"{indent}}} else {{"] +
+            word_selector_lines(name, prefix, num_words, indent + "    ", mid, high) +
+            [f"{indent}}}"])
+
+
+class PackedLayout:
+    """Base class: subclasses set entry_bits and build the word index and shift expressions.
+
+    Entries are never split across words. Each entry's bits are [shift, shift + entry_bits).
+    """
+    name = ""
+    description = ""
+
+    def __init__(self, chart: TypeChart):
+        self.chart = chart
+        self.entry_bits = max(1, math.ceil(math.log2(len(chart.multipliers))))
+        self.index_ops = Counter()
+        self.locals: List[Tuple[str, str]] = []  # (uint256 local, expression) computed before the lookup
+        self.word_expression = "0"
+        self.shift_expression = "0"
+
+    @property
+    def mask(self) -> int:
+        return (1 << self.entry_bits) - 1
+
+    def locate(self, attacker: int, defender: int) -> Tuple[int, int]:
+        """(word index, shift) of an entry, computed from the emitted Solidity expressions"""
+        variables = {"attacker": attacker, "defender": defender}
+        for name, expression in self.locals:
+            variables[name] = evaluate(expression, variables)
+        return evaluate(self.word_expression, variables), evaluate(self.shift_expression, variables)
+
+    def words(self) -> List[int]:
+        entries: Dict[int, Dict[int, int]] = {}
+        for attacker in range(self.chart.num_types):
+            for defender in range(self.chart.num_types):
+                word, shift = self.locate(attacker, defender)
+                if shift % self.entry_bits or shift + self.entry_bits > WORD_BITS:
+                    raise ValueError(f"{self.name}: entry at bit {shift} does not fit in a word")
+                entries.setdefault(word, {})[shift // self.entry_bits] = self.chart.codes[attacker, defender]
+        words = []
+        for word in range(max(entries) + 1):
+            slots = entries.get(word, {})
+            values = np.zeros(max(slots, default=-1) + 1, dtype=np.uint8)
+            for slot, code in slots.items():
+                values[slot] = code
+            words.append(pack_int(values, self.entry_bits))
+        return words
+
+    def lookup(self, words: List[int], attacker: int, defender: int) -> int:
+        word, shift = self.locate(attacker, defender)
+        return (words[word] >> shift) & self.mask
+
+    def accessor_multiplier(self, words: List[int], attacker: int, defender: int) -> Fraction:
+        """Multiplier the emitted getTypeEffectiveness applies for any pair of Type values.
+
+        Unlike lookup this also covers values outside the chart (Type.None), reading whatever
+        padding they land on as the EVM would: the word selector returns the last word for
+        larger indices, shifting by 256 or more gives 0, and a code the decode chain doesn't
+        test falls through to its final else (or, with a single code, to the implicit 0).
+        """
+        word, shift = self.locate(attacker, defender)
+        code = (words[min(word, len(words) - 1)] >> shift) & self.mask
+        order = self.decode_order()
+        if len(order) == 1:
+            return self.chart.multipliers[code] if code == order[0] else Fraction(0)
+        return self.chart.multipliers[code if code in order[:-1] else order[-1]]
+
+    def verify(self, words: List[int]) -> List[str]:
+        """Every chart entry that the packed words do not reproduce"""
+        names = self.chart.type_names
+        return [f"{names[attacker]} vs {names[defender]}" for attacker in range(self.chart.num_types)
+                for defender in range(self.chart.num_types)
+                if self.lookup(words, attacker, defender) != self.chart.codes[attacker, defender]]
+
+    def decode_order(self) -> List[int]:
+        """Codes in the order the accessor tests them: most frequent first"""
+        frequencies = self.chart.code_frequencies()
+        return sorted(range(len(self.chart.multipliers)), key=lambda code: (-frequencies[code], code))
+
+    def estimate_gas(self, num_words: int) -> Dict[str, float]:
+        """Estimated gas of one lookup, averaged over the chart's entries, by stage"""
+        index = sum(OPCODE_GAS[op] * count for op, count in self.index_ops.items())
+        if num_words > 1:
+            depths = {}
+            for word, depth in enumerate(selector_depths(num_words)):
+                depths[word] = depth
+            located = [self.locate(a, d)[0] for a in range(self.chart.num_types) for d in range(self.chart.num_types)]
+            select = INTERNAL_CALL_GAS + BRANCH_GAS * float(np.mean([depths[word] for word in located]))
+        else:
+            select = OPCODE_GAS["PUSH"]
+        extract = OPCODE_GAS["SHR"] + OPCODE_GAS["AND"] + OPCODE_GAS["PUSH"]
+        frequencies = self.chart.code_frequencies()
+        order = self.decode_order()
+        decode = BRANCH_GAS * sum(frequencies[code] * min(position + 1, len(order) - 1)
+                                  for position, code in enumerate(order))
+        return {"index": index, "select": select, "extract": extract, "decode": decode,
+                "total": index + select + extract + decode}
+
+    def solidity(self, words: List[int]) -> Tuple[List[str], List[str]]:
+        """(constant declarations, functions) implementing getTypeEffectiveness with this layout"""
+        constants = [constant_declaration(f"MULTIPLIERS_{i}", f"0x{word:064x}") for i, word in enumerate(words)]
+        if len(words) == 1:
+            word = "MULTIPLIERS_0"
+        else:
+            word = f"_multipliers({unwrapped(self.word_expression)})"
+        lines = [
+            "    function getTypeEffectiveness(Type attackerType, Type defenderType, uint32 basePower)",
+            "        external",
+            "        pure",
+            "        returns (uint32)",
+            "    {",
+            "        uint256 attacker = uint256(attackerType);",
+            "        uint256 defender = uint256(defenderType);",
+        ] + [f"        uint256 {name} = {unwrapped(expression)};" for name, expression in self.locals] + [
+            f"        uint256 code = ({word} >> ({unwrapped(self.shift_expression)})) & {self.mask};",
+            "",
+            "        // Most frequent multipliers first",
+        ]
+        order = self.decode_order()
+        for position, code in enumerate(order):
+            expression = multiplier_expression(self.chart.multipliers[code])
+            if position == len(order) - 1 and position > 0:
+                lines.append("        } else {")
+            else:
+                lines.append(f"        {'if' if position == 0 else '} else if'} (code == {code}) {{")
+            lines.append(f"            return {expression};")
+        lines.append("        }")
+        lines.append("    }")
+        if len(words) > 1:
+            lines += ["", "    function _multipliers(uint256 wordIndex) private pure returns (uint256) {"]
+            lines += word_selector_lines("wordIndex", "MULTIPLIERS_", len(words))
+            lines.append("    }")
+        return constants, lines
+
+
+class DenseLayout(PackedLayout):
+    name = "dense"
+    description = "row-major entries packed back to back, as many per word as fit"
+
+    def __init__(self, chart: TypeChart):
+        super().__init__(chart)
+        per_word = WORD_BITS // self.entry_bits
+        self.locals = [("index", added(scaled("attacker", chart.num_types, self.index_ops), "defender",
+                                       self.index_ops))]
+        self.word_expression = divided("index", per_word, self.index_ops)
+        self.shift_expression = scaled(modulo("index", per_word, self.index_ops), self.entry_bits, self.index_ops)
+
+
+class RowAlignedLayout(PackedLayout):
+    name = "row_aligned"
+    description = "whole attacker rows per word, so a row never spans two words"
+
+    def __init__(self, chart: TypeChart, rows_per_word: int = None):
+        super().__init__(chart)
+        row_bits = chart.num_types * self.entry_bits
+        if row_bits > WORD_BITS:
+            raise ValueError(f"{self.name}: a row of {row_bits} bits does not fit in a word")
+        rows_per_word = rows_per_word or WORD_BITS // row_bits
+        self.word_expression = divided("attacker", rows_per_word, self.index_ops)
+        self.shift_expression = added(scaled(modulo("attacker", rows_per_word, self.index_ops), row_bits,
+                                             self.index_ops),
+                                      scaled("defender", self.entry_bits, self.index_ops), self.index_ops)
+
+
+class RowPerWordLayout(RowAlignedLayout):
+    name = "row_per_word"
+    description = "one constant per attacker row"
+
+    def __init__(self, chart: TypeChart):
+        super().__init__(chart, rows_per_word=1)
+
+
+class PowerOfTwoLayout(PackedLayout):
+    name = "pow2"
+    description = "entry width and row stride rounded up to powers of two so indexing is only shifts"
+
+    def __init__(self, chart: TypeChart):
+        super().__init__(chart)
+        self.entry_bits = 1 << (self.entry_bits - 1).bit_length()
+        row_bits = 1 << (chart.num_types * self.entry_bits - 1).bit_length()
+        if row_bits > WORD_BITS:
+            raise ValueError(f"{self.name}: a row of {row_bits} bits does not fit in a word")
+        rows_per_word = WORD_BITS // row_bits
+        self.word_expression = divided("attacker", rows_per_word, self.index_ops)
+        self.shift_expression = added(scaled(modulo("attacker", rows_per_word, self.index_ops), row_bits,
+                                             self.index_ops),
+                                      scaled("defender", self.entry_bits, self.index_ops), self.index_ops)
+
+
+LAYOUTS = {layout.name: layout for layout in (DenseLayout, RowAlignedLayout, RowPerWordLayout, PowerOfTwoLayout)}
+
+
+def compare_layouts(chart: TypeChart) -> List[dict]:
+    """Build, verify and estimate every layout that fits the chart, cheapest lookup first"""
+    results = []
+    for name, layout_class in LAYOUTS.items():
+        try:
+            layout = layout_class(chart)
+        except ValueError as e:
+            print(f"Skipping layout {e}")
+            continue
+        words = layout.words()
+        errors = layout.verify(words)
+        if errors:
+            raise ValueError(f"Layout {name} does not reproduce the chart: {', '.join(errors[:10])}")
+        gas = layout.estimate_gas(len(words))
+        results.append({"layout": layout, "words": words, "gas": gas,
+                        "deploy_gas": len(words) * (WORD_BITS // 8 + 1) * CODE_DEPOSIT_GAS_PER_BYTE})
+    return sorted(results, key=lambda result: (result["gas"]["total"], len(result["words"])))
+
+
+def print_layout_report(results: List[dict]):
+    print(f"{'layout':<13} {'bits':>4} {'words':>5} {'index':>6} {'select':>6} {'extract':>7} "
+          f"{'decode':>6} {'gas/lookup':>10} {'deploy gas':>10}")
+    for result in results:
+        layout, gas = result["layout"], result["gas"]
+        print(f"{layout.name:<13} {layout.entry_bits:>4} {len(result['words']):>5} {gas['index']:>6.0f} "
+              f"{gas['select']:>6.1f} {gas['extract']:>7.0f} {gas['decode']:>6.1f} {gas['total']:>10.1f} "
+              f"{result['deploy_gas']:>10,}")
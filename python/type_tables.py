@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Precomputed dual-type effectiveness for TypeCalculator.getDualTypeEffectiveness.
+
+AttackCalculator used to scale base power by the defender's first type and then, if it has
+one, by its second type, one getTypeEffectiveness call each. Because every step rounds down,
+the combined effect depends on the order (half then double is (bp / 2) * 2, not bp), so the
+table stores which combined op reproduces the two sequential steps exactly. The ops are
+derived from the chart's multipliers (combine), so a new multiplier in types.csv only grows
+the alphabet and the bits per entry.
+
+The steps are what the emitted getTypeEffectiveness returns (accessor_multipliers), not what
+types.csv says: for Type.None, which types.csv doesn't list, the accessor reads padding bits,
+and the table has to give the same result as the calls it replaces.
+
+Entries are indexed attacker << 2 * TYPE_BITS | defenderType1 << TYPE_BITS | defenderType2
+over every Type value (Type.None as a second type means "no second type") and packed
+entries_per_word to a uint256, entry i of a word at bits [i * code_bits, (i + 1) * code_bits).
+Trailing words that would be all zero (attacker Type.None's rows, typically) are left out and
+read as 0, i.e. code 0, by the accessor.
+"""
+
+from fractions import Fraction
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+
+from bitpack import WORD_BITS, pack_int
+from game_data import TYPE_NAMES, TYPE_NONE
+from type_layout import multiplier_expression
+
+NUM_TYPE_VALUES = len(TYPE_NAMES)
+# Bits of one Type value in the combined index
+TYPE_BITS = (NUM_TYPE_VALUES - 1).bit_length()
+
+# Base powers each combined code is checked against: every small value plus uint32 edge cases
+VERIFY_BASE_POWERS = list(range(0, 1024)) + [2**16 - 1, 2**16, 2**30 - 1, 2**31 - 1, 2**32 - 1]
+
+# A combined op: multipliers applied one after another, each rounding down
+Steps = Tuple[Fraction, ...]
+
+
+def scale(base_power, multiplier: Fraction):
+    """base_power * numerator / denominator in integer arithmetic, as the emitted accessor computes it"""
+    return base_power * multiplier.numerator // multiplier.denominator
+
+
+def combine(first: Fraction, second: Optional[Fraction]) -> Steps:
+    """Fewest steps that give the same result as scaling by first and then second (None: no second type).
+
+    The two fold into their product when nothing is rounded in between (first is a whole number),
+    when the second step only divides (floor(floor(x) / q) == floor(x / q)) or when either is 0.
+    Otherwise the order matters and both steps are kept.
+    """
+    if second is None:
+        return (first,)
+    if first == 0 or second == 0:
+        return (Fraction(0),)
+    if first.denominator == 1 or second.numerator == 1:
+        return (first * second,)
+    return (first, second)
+
+
+def apply_steps(steps: Steps, base_power):
+    for multiplier in steps:
+        base_power = scale(base_power, multiplier)
+    return base_power
+
+
+def steps_expression(steps: Steps) -> str:
+    """Solidity expression of basePower for steps, e.g. (basePower / 2) * 2"""
+    expression = multiplier_expression(steps[0])
+    for multiplier in steps[1:]:
+        expression = f"({expression})"
+        if multiplier.numerator != 1:
+            expression += f" * {multiplier.numerator}"
+        if multiplier.denominator != 1:
+            expression += f" / {multiplier.denominator}"
+    return expression
+
+
+def accessor_multipliers(layout, words: List[int]) -> List[List[Fraction]]:
+    """[attacker][defender] multiplier of the emitted getTypeEffectiveness for every pair of Type values"""
+    return [[layout.accessor_multiplier(words, attacker, defender) for defender in range(NUM_TYPE_VALUES)]
+            for attacker in range(NUM_TYPE_VALUES)]
+
+
+def sequential_scale(first: Fraction, second: Optional[Fraction], base_power):
+    """Scale base_power by the type1 multiplier then, if there is a type2, by its multiplier,
+    as AttackCalculator did with two getTypeEffectiveness calls"""
+    scaled = scale(base_power, first)
+    return scaled if second is None else scale(scaled, second)
+
+
+def dual_type_index(attacker: int, type1: int, type2: int) -> int:
+    return (attacker << (2 * TYPE_BITS)) | (type1 << TYPE_BITS) | type2
+
+
+def triple_name(attacker: int, type1: int, type2: int) -> str:
+    return f"{TYPE_NAMES[attacker]} vs {TYPE_NAMES[type1]}/{TYPE_NAMES[type2]}"
+
+
+class DualTable:
+    """Combined op codes for every (attacker, defenderType1, defenderType2) triple.
+
+    ops lists the distinct combined ops, fewest steps and smallest denominators first, so the
+    codes of the original alphabet (0, 1, 2, 4, 1/2, 1/4, (1/2) * 2) don't move when types.csv
+    gains a multiplier.
+    """
+    def __init__(self, multipliers: List[List[Fraction]]):
+        self.multipliers = multipliers
+        # Work on indices into the distinct multipliers, so each pair is combined once rather than
+        # per triple; index len(values) in the second position stands for "no second type"
+        self.values = sorted({multiplier for row in multipliers for multiplier in row})
+        position = {multiplier: i for i, multiplier in enumerate(self.values)}
+        self.first = np.array([[position[multiplier] for multiplier in row] for row in multipliers], dtype=np.intp)
+        self.second = self.first.copy()
+        self.second[:, TYPE_NONE] = len(self.values)
+        pairs = {(i, j) for attacker in range(NUM_TYPE_VALUES)
+                 for i in set(self.first[attacker].tolist()) for j in set(self.second[attacker].tolist())}
+        pair_steps = {pair: combine(*self.pair_multipliers(pair)) for pair in pairs}
+        self.ops: List[Steps] = sorted(set(pair_steps.values()),
+                                       key=lambda op: (len(op), [(m.denominator, m.numerator) for m in op]))
+        code = {op: i for i, op in enumerate(self.ops)}
+        pair_codes = np.zeros((len(self.values), len(self.values) + 1), dtype=np.uint8)
+        for (i, j), op in pair_steps.items():
+            pair_codes[i, j] = code[op]
+        # codes[attacker, type1, type2] = pair_codes[first[attacker, type1], second[attacker, type2]]
+        self.codes = pair_codes[self.first[:, :, None], self.second[:, None, :]]
+        self.code_bits = max(1, (len(self.ops) - 1).bit_length())
+        self.entries_per_word = WORD_BITS // self.code_bits
+
+    def pair_multipliers(self, pair: Tuple[int, int]) -> Tuple[Fraction, Optional[Fraction]]:
+        i, j = pair
+        return self.values[i], self.values[j] if j < len(self.values) else None
+
+    @property
+    def mask(self) -> int:
+        return (1 << self.code_bits) - 1
+
+    def expressions(self) -> List[str]:
+        """Solidity expression of basePower for each code"""
+        return [steps_expression(op) for op in self.ops]
+
+    @property
+    def num_entry_words(self) -> int:
+        """Words needed to hold every entry, before trailing zero words are dropped"""
+        return -(-self.codes.size // self.entries_per_word)
+
+    def words(self) -> List[int]:
+        """Pack the codes (flattened in dual_type_index order) entries_per_word to a word, up to the
+        last word with a nonzero code"""
+        flat = self.codes.ravel()
+        words = [pack_int(flat[i:i + self.entries_per_word], self.code_bits)
+                 for i in range(0, flat.size, self.entries_per_word)]
+        while len(words) > 1 and words[-1] == 0:
+            words.pop()
+        return words
+
+    def lookup(self, words: List[int], attacker: int, type1: int, type2: int) -> int:
+        """Read a combined code back out of packed words, as the Solidity accessor does (0 past the last word)"""
+        index = dual_type_index(attacker, type1, type2)
+        word_index = index // self.entries_per_word
+        word = words[word_index] if word_index < len(words) else 0
+        return (word >> ((index % self.entries_per_word) * self.code_bits)) & self.mask
+
+    def verify(self, words: List[int], base_powers: Iterable[int] = VERIFY_BASE_POWERS) -> List[str]:
+        """Check every packed entry against sequential calls to the emitted single-type accessor.
+
+        A triple's result only depends on the code read back and its (type1, type2) multipliers,
+        so each distinct combination is evaluated over base_powers once: as thorough as checking
+        all 4096 triples, at the cost of a few dozen.
+
+        Overflow is not modelled: results agree wherever no uint32 step overflows, but a folded op
+        can skip a revert (double then half is just basePower, while bp * 2 reverts from 2**31).
+
+        Returns:
+            list: a description of each (attacker, type1, type2, base power) that disagrees
+        """
+        read_back = np.zeros(self.codes.shape, dtype=np.intp)
+        for triple in np.ndindex(*self.codes.shape):
+            read_back[triple] = self.lookup(words, *triple)
+        errors = [f"{triple_name(*triple)}: code {read_back[triple]} is out of range"
+                  for triple in zip(*np.nonzero(read_back >= len(self.ops)))]
+
+        # Group triples by (code read back, type1 multiplier, type2 multiplier)
+        keys = np.stack(np.broadcast_arrays(read_back, self.first[:, :, None], self.second[:, None, :]), axis=-1)
+        base_powers = np.array(list(base_powers), dtype=np.int64)
+        for code, i, j in sorted(set(map(tuple, keys.reshape(-1, 3).tolist()))):
+            if code >= len(self.ops):
+                continue
+            actual = apply_steps(self.ops[code], base_powers)
+            expected = sequential_scale(*self.pair_multipliers((i, j)), base_powers)
+            for k in np.flatnonzero(actual != expected):
+                for triple in zip(*np.nonzero(np.all(keys == (code, i, j), axis=-1))):
+                    errors.append(f"{triple_name(*triple)}, base power {base_powers[k]}: table gives {actual[k]}, "
+                                  f"sequential gives {expected[k]}")
+        return errors
@@ -8,4 +8,18 @@ library MonSVGRenderer {
     uint256 constant HEIGHT = 32;
     uint256 constant WIDTH = 32;
     uint256 constant NUM_IMG_SLOTS = 16;
+
+    // IMG_HDR metadata word, written by python/sprite_codecs.py
+    // bits 0-7 codec, 8-15 bits per pixel, 16-23 run-length field width, 24-31 width,
+    // 32-39 height, 40-55 number of symbols, 56-63 number of IMG_n words, 64 XOR delta against
+    // the previous animation frame
+    bytes32 constant IMG_HEADER_KEY = "IMG_HDR";
+    uint256 constant CODEC_RAW = 0;
+    uint256 constant CODEC_RLE = 1;
+    uint256 constant CODEC_ROW_DELTA = 2;
+
+    // Palette (SPAL_n) and 8x8 tile table (STILE_n) shared by all mons, written by
+    // python/sprite_dictionary.py; mons then store TMAP_n tile and PREF_n palette references
+    uint256 constant SHARED_METADATA_MON_ID = type(uint256).max;
+    uint256 constant TILE_SIZE = 8;
 }
\ No newline at end of file
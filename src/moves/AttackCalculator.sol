@@ -137,23 +137,21 @@ library AttackCalculator {
 
             uint32 scaledBasePower;
             {
-                scaledBasePower = TYPE_CALCULATOR.getTypeEffectiveness(
+                Type defenderType2 = Type(
+                    ENGINE.getMonValueForBattle(
+                        battleKey, defenderPlayerIndex, monIndex[defenderPlayerIndex], MonStateIndexName.Type2
+                    )
+                );
+                scaledBasePower = TYPE_CALCULATOR.getDualTypeEffectiveness(
                     attackType,
                     Type(
                         ENGINE.getMonValueForBattle(
                             battleKey, defenderPlayerIndex, monIndex[defenderPlayerIndex], MonStateIndexName.Type1
                         )
                     ),
+                    defenderType2,
                     basePower
                 );
-                Type defenderType2 = Type(
-                    ENGINE.getMonValueForBattle(
-                        battleKey, defenderPlayerIndex, monIndex[defenderPlayerIndex], MonStateIndexName.Type2
-                    )
-                );
-                if (defenderType2 != Type.None) {
-                    scaledBasePower = TYPE_CALCULATOR.getTypeEffectiveness(attackType, defenderType2, scaledBasePower);
-                }
             }
 
             // Calculate move volatility
@@ -8,4 +8,8 @@ interface ITypeCalculator {
         external
         view
         returns (uint32);
+    function getDualTypeEffectiveness(Type attackerType, Type defenderType1, Type defenderType2, uint32 basePower)
+        external
+        view
+        returns (uint32);
 }
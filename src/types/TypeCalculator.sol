@@ -5,39 +5,293 @@ import "../Enums.sol";
 import {ITypeCalculator} from "./ITypeCalculator.sol";
 
 contract TypeCalculator is ITypeCalculator {
-    uint256 private constant MULTIPLIERS_1 =
-        98387940970013939441334902218489111171706662712193966632938886332804419114328; // First 128 type combinations
-    uint256 private constant MULTIPLIERS_2 = 8859915444081173009646859022170283285020904064171667527525; // Remaining 97 type combinations
+    // Multiplier code for each attacker and defender, pow2 layout (see python/type_layout.py)
+    uint256 private constant MULTIPLIERS_0 = 0x26797fa515a597d5175567551555abf51555de65194656d525d5555235955558;
+    uint256 private constant MULTIPLIERS_1 = 0x0000000016955d55155756b51dd9595509565d6515579d65365dd55a1765d985;
+
+    // Combined multiplier code (see python/type_tables.py) for each attacker << 8 | type1 << 4 | type2,
+    // 3 bits each, 85 per word
+    uint256 private constant DUAL_MULTIPLIERS_0 = 0x1250309449249250309449249250309449249250452692492498000000000000;
+    uint256 private constant DUAL_MULTIPLIERS_1 = 0x124924a06128924924a06128924924a06128924924a06128924924a061289249;
+    uint256 private constant DUAL_MULTIPLIERS_2 = 0x0000000000025934924924c0c25124924940c25124924941149a49249260c251;
+    uint256 private constant DUAL_MULTIPLIERS_3 = 0x121144c24924921144c24924921144c249249210000000000002691492492418;
+    uint256 private constant DUAL_MULTIPLIERS_4 = 0x1249242289849249242289849249242289849249242289849249242289849249;
+    uint256 private constant DUAL_MULTIPLIERS_5 = 0x000000000009a452492490651309249248451309249248534964924920c51309;
+    uint256 private constant DUAL_MULTIPLIERS_6 = 0x12526904d24ca4a4d209a49ac9094482892a12494482892a12494482892a1240;
+    uint256 private constant DUAL_MULTIPLIERS_7 = 0x000000128905125424a4d209a499491289051254249289051254249289051254;
+    uint256 private constant DUAL_MULTIPLIERS_8 = 0x000000000025120a24a84949a41349329225120a24a84925120a24a849000000;
+    uint256 private constant DUAL_MULTIPLIERS_9 = 0x489249245169a44924930c45129249245169a44924930c45124924930c451200;
+    uint256 private constant DUAL_MULTIPLIERS_10 = 0x188a24924926188a24924926188a26492492cba690924926188a26492492cba6;
+    uint256 private constant DUAL_MULTIPLIERS_11 = 0x000000000124924c31144924924c31144924924c31144924924c31144924924c;
+    uint256 private constant DUAL_MULTIPLIERS_12 = 0x2924924db5b64924924db5b64924924db5b64249249494909249249494909000;
+    uint256 private constant DUAL_MULTIPLIERS_13 = 0x29212492492929212492492929212924924db24a4924924db24a4924924db24a;
+    uint256 private constant DUAL_MULTIPLIERS_14 = 0x0000000009249252524249249252524249249252524249249252524249249252;
+    uint256 private constant DUAL_MULTIPLIERS_15 = 0x492c924d2c921261249461249261249461249261249461249261249461248000;
+    uint256 private constant DUAL_MULTIPLIERS_16 = 0x424924c24928c24924c24928c24924c24928c2494914924d149224c24928c249;
+    uint256 private constant DUAL_MULTIPLIERS_17 = 0x0000000049849251849249849251849324b24934b24849849251849249849251;
+    uint256 private constant DUAL_MULTIPLIERS_18 = 0x493693496c92493693496c909252251321249252251321249252251321240000;
+    uint256 private constant DUAL_MULTIPLIERS_19 = 0x149124a44a26424924a44a26424a49369348949124a44a26424924a44a26424c;
+    uint256 private constant DUAL_MULTIPLIERS_20 = 0x000000024948944c84924948944c84924948944c8494926d26912924926d2691;
+    uint256 private constant DUAL_MULTIPLIERS_21 = 0x4d2e92dbb489a68b4892da49a68b4892da451462264891251462264891200000;
+    uint256 private constant DUAL_MULTIPLIERS_22 = 0x69134d169125b48a28c44c91224a28c44c9122669a5d25b769269a5d25b76926;
+    uint256 private constant DUAL_MULTIPLIERS_23 = 0x000000269a2d224b69145188992244a69a2d224b69145188992244cd34ba4b6e;
+    uint256 private constant DUAL_MULTIPLIERS_24 = 0x42898514094914d229a61200000000000024c28985140924c289851409000000;
+    uint256 private constant DUAL_MULTIPLIERS_25 = 0x244985130a28124985130a281324b3496698484985130a28129229a4534c2449;
+    uint256 private constant DUAL_MULTIPLIERS_26 = 0x000000930a26145024930a26145026496692cd3090930a26145025245348a698;
+    uint256 private constant DUAL_MULTIPLIERS_27 = 0x130c24929185130c24929185130c24929229a4514924da29a4514924d8000000;
+    uint256 private constant DUAL_MULTIPLIERS_28 = 0x296692cb2493630a26184925296692cb2493630a26184925230a26184925230a;
+    uint256 private constant DUAL_MULTIPLIERS_29 = 0x000012cd25964926c6144c30924a48a69145249366144c30924a46144c30924a;
+    uint256 private constant DUAL_MULTIPLIERS_30 = 0x131184a24924931184a25249245a29348924931184a24924931184a240000000;
+    uint256 private constant DUAL_MULTIPLIERS_31 = 0x124926230944c92492e964d2249248b45269124926230944c92492e964d21249;
+    uint256 private constant DUAL_MULTIPLIERS_32 = 0x000024924c46128924924c46128924924c46128924924c46128924924c461289;
+    uint256 private constant DUAL_MULTIPLIERS_33 = 0x144c25124224944c25128349269149a44224944c25124224944c251200000000;
+    uint256 private constant DUAL_MULTIPLIERS_34 = 0x044928984a2506924d229348844928984a24844928984a260d249a4b26908449;
+    uint256 private constant DUAL_MULTIPLIERS_35 = 0x00000000000000020d249a452691089251309449089251309449089251309449;
+    uint256 private constant DUAL_MULTIPLIERS_36 = 0x1251249261851251249261851251249261851251249261851251249000000000;
+    uint256 private constant DUAL_MULTIPLIERS_37 = 0x145349349244c30a24a24924c30a24a24924c30a24a24929145349349244c30a;
+    uint256 private constant DUAL_MULTIPLIERS_38 = 0x0009861449449264b2cd24d24909861449449264b2cd24d24909861449449252;
+    uint256 private constant DUAL_MULTIPLIERS_39 = 0x249b29249248a49b29492492c936b21249261252849249261252848000000000;
+    uint256 private constant DUAL_MULTIPLIERS_40 = 0x124c24a509924925926d6424924c24a50924924c24a50924924c24a509492491;
+    uint256 private constant DUAL_MULTIPLIERS_41 = 0x00492498494a12492498494a12492498494a12492498494a12492498494a1249;
+    uint256 private constant DUAL_MULTIPLIERS_42 = 0x1849249291249849249291249849249291249849249291249849240000000000;
+    uint256 private constant DUAL_MULTIPLIERS_43 = 0x224930924925224930924925224930924925224930924c936924964921252249;
+    uint256 private constant DUAL_MULTIPLIERS_44 = 0x024a44926124924a44926124949369248a49249369248a49224a44926124924a;
 
     function getTypeEffectiveness(Type attackerType, Type defenderType, uint32 basePower)
         external
         pure
         returns (uint32)
     {
-        uint256 index = uint256(attackerType) * 15 + uint256(defenderType);
-        uint256 shift;
-        uint256 multipliers;
+        uint256 attacker = uint256(attackerType);
+        uint256 defender = uint256(defenderType);
+        uint256 code = (_multipliers(attacker >> 3) >> (((attacker & 7) << 5) + (defender << 1))) & 3;
 
-        if (index < 128) {
-            shift = index * 2;
-            multipliers = MULTIPLIERS_1;
+        // Most frequent multipliers first
+        if (code == 1) {
+            return basePower;
+        } else if (code == 2) {
+            return basePower * 2;
+        } else if (code == 3) {
+            return basePower / 2;
         } else {
-            shift = (index - 128) * 2;
-            multipliers = MULTIPLIERS_2;
+            return 0;
         }
+    }
 
-        // Check the last 2 bits of the multipliers for the correct shift
-        uint256 typeEffectivenessValue = uint32((multipliers >> shift) & 3);
+    function _multipliers(uint256 wordIndex) private pure returns (uint256) {
+        if (wordIndex < 1) {
+            return MULTIPLIERS_0;
+        } else {
+            return MULTIPLIERS_1;
+        }
+    }
+
+    function getDualTypeEffectiveness(Type attackerType, Type defenderType1, Type defenderType2, uint32 basePower)
+        external
+        pure
+        returns (uint32)
+    {
+        uint256 index = (uint256(attackerType) << 8) | (uint256(defenderType1) << 4) | uint256(defenderType2);
+        uint256 code = (_dualMultipliers(index / 85) >> ((index % 85) * 3)) & 7;
 
-        // Do the lookup to scale the value appropriately
-        if (typeEffectivenessValue == 0) {
+        // Same result as scaling by defenderType1 and then, unless it is Type.None, defenderType2
+        if (code == 0) {
             return 0;
-        } else if (typeEffectivenessValue == 1) {
+        } else if (code == 1) {
             return basePower;
-        } else if (typeEffectivenessValue == 2) {
+        } else if (code == 2) {
             return basePower * 2;
-        } else {
+        } else if (code == 3) {
+            return basePower * 4;
+        } else if (code == 4) {
             return basePower / 2;
+        } else if (code == 5) {
+            return basePower / 4;
+        } else {
+            return (basePower / 2) * 2;
+        }
+    }
+
+    function _dualMultipliers(uint256 wordIndex) private pure returns (uint256) {
+        if (wordIndex > 44) {
+            return 0;
+        }
+        if (wordIndex < 22) {
+            if (wordIndex < 11) {
+                if (wordIndex < 5) {
+                    if (wordIndex < 2) {
+                        if (wordIndex < 1) {
+                            return DUAL_MULTIPLIERS_0;
+                        } else {
+                            return DUAL_MULTIPLIERS_1;
+                        }
+                    } else {
+                        if (wordIndex < 3) {
+                            return DUAL_MULTIPLIERS_2;
+                        } else {
+                            if (wordIndex < 4) {
+                                return DUAL_MULTIPLIERS_3;
+                            } else {
+                                return DUAL_MULTIPLIERS_4;
+                            }
+                        }
+                    }
+                } else {
+                    if (wordIndex < 8) {
+                        if (wordIndex < 6) {
+                            return DUAL_MULTIPLIERS_5;
+                        } else {
+                            if (wordIndex < 7) {
+                                return DUAL_MULTIPLIERS_6;
+                            } else {
+                                return DUAL_MULTIPLIERS_7;
+                            }
+                        }
+                    } else {
+                        if (wordIndex < 9) {
+                            return DUAL_MULTIPLIERS_8;
+                        } else {
+                            if (wordIndex < 10) {
+                                return DUAL_MULTIPLIERS_9;
+                            } else {
+                                return DUAL_MULTIPLIERS_10;
+                            }
+                        }
+                    }
+                }
+            } else {
+                if (wordIndex < 16) {
+                    if (wordIndex < 13) {
+                        if (wordIndex < 12) {
+                            return DUAL_MULTIPLIERS_11;
+                        } else {
+                            return DUAL_MULTIPLIERS_12;
+                        }
+                    } else {
+                        if (wordIndex < 14) {
+                            return DUAL_MULTIPLIERS_13;
+                        } else {
+                            if (wordIndex < 15) {
+                                return DUAL_MULTIPLIERS_14;
+                            } else {
+                                return DUAL_MULTIPLIERS_15;
+                            }
+                        }
+                    }
+                } else {
+                    if (wordIndex < 19) {
+                        if (wordIndex < 17) {
+                            return DUAL_MULTIPLIERS_16;
+                        } else {
+                            if (wordIndex < 18) {
+                                return DUAL_MULTIPLIERS_17;
+                            } else {
+                                return DUAL_MULTIPLIERS_18;
+                            }
+                        }
+                    } else {
+                        if (wordIndex < 20) {
+                            return DUAL_MULTIPLIERS_19;
+                        } else {
+                            if (wordIndex < 21) {
+                                return DUAL_MULTIPLIERS_20;
+                            } else {
+                                return DUAL_MULTIPLIERS_21;
+                            }
+                        }
+                    }
+                }
+            }
+        } else {
+            if (wordIndex < 33) {
+                if (wordIndex < 27) {
+                    if (wordIndex < 24) {
+                        if (wordIndex < 23) {
+                            return DUAL_MULTIPLIERS_22;
+                        } else {
+                            return DUAL_MULTIPLIERS_23;
+                        }
+                    } else {
+                        if (wordIndex < 25) {
+                            return DUAL_MULTIPLIERS_24;
+                        } else {
+                            if (wordIndex < 26) {
+                                return DUAL_MULTIPLIERS_25;
+                            } else {
+                                return DUAL_MULTIPLIERS_26;
+                            }
+                        }
+                    }
+                } else {
+                    if (wordIndex < 30) {
+                        if (wordIndex < 28) {
+                            return DUAL_MULTIPLIERS_27;
+                        } else {
+                            if (wordIndex < 29) {
+                                return DUAL_MULTIPLIERS_28;
+                            } else {
+                                return DUAL_MULTIPLIERS_29;
+                            }
+                        }
+                    } else {
+                        if (wordIndex < 31) {
+                            return DUAL_MULTIPLIERS_30;
+                        } else {
+                            if (wordIndex < 32) {
+                                return DUAL_MULTIPLIERS_31;
+                            } else {
+                                return DUAL_MULTIPLIERS_32;
+                            }
+                        }
+                    }
+                }
+            } else {
+                if (wordIndex < 39) {
+                    if (wordIndex < 36) {
+                        if (wordIndex < 34) {
+                            return DUAL_MULTIPLIERS_33;
+                        } else {
+                            if (wordIndex < 35) {
+                                return DUAL_MULTIPLIERS_34;
+                            } else {
+                                return DUAL_MULTIPLIERS_35;
+                            }
+                        }
+                    } else {
+                        if (wordIndex < 37) {
+                            return DUAL_MULTIPLIERS_36;
+                        } else {
+                            if (wordIndex < 38) {
+                                return DUAL_MULTIPLIERS_37;
+                            } else {
+                                return DUAL_MULTIPLIERS_38;
+                            }
+                        }
+                    }
+                } else {
+                    if (wordIndex < 42) {
+                        if (wordIndex < 40) {
+                            return DUAL_MULTIPLIERS_39;
+                        } else {
+                            if (wordIndex < 41) {
+                                return DUAL_MULTIPLIERS_40;
+                            } else {
+                                return DUAL_MULTIPLIERS_41;
+                            }
+                        }
+                    } else {
+                        if (wordIndex < 43) {
+                            return DUAL_MULTIPLIERS_42;
+                        } else {
+                            if (wordIndex < 44) {
+                                return DUAL_MULTIPLIERS_43;
+                            } else {
+                                return DUAL_MULTIPLIERS_44;
+                            }
+                        }
+                    }
+                }
+            }
         }
     }
 }
@@ -8,4 +8,8 @@ contract TestTypeCalculator is ITypeCalculator {
     function getTypeEffectiveness(Type, Type, uint32 basePower) external pure returns (uint32) {
         return basePower;
     }
+
+    function getDualTypeEffectiveness(Type, Type, Type, uint32 basePower) external pure returns (uint32) {
+        return basePower;
+    }
 }
@@ -0,0 +1,57 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.0;
+
+import {Type} from "../../src/Enums.sol";
+import {TypeCalculator} from "../../src/types/TypeCalculator.sol";
+import {Test} from "forge-std/Test.sol";
+
+contract TypeCalculatorTest is Test {
+    TypeCalculator typeCalc;
+
+    // Largest base power for which no step overflows uint32 (the biggest combined multiplier is 4)
+    uint32 constant MAX_BASE_POWER = type(uint32).max / 4;
+
+    function setUp() public {
+        typeCalc = new TypeCalculator();
+    }
+
+    // What AttackCalculator computed before getDualTypeEffectiveness: one call per defender type
+    function _sequential(Type attackerType, Type defenderType1, Type defenderType2, uint32 basePower)
+        internal
+        view
+        returns (uint32)
+    {
+        uint32 scaled = typeCalc.getTypeEffectiveness(attackerType, defenderType1, basePower);
+        if (defenderType2 != Type.None) {
+            scaled = typeCalc.getTypeEffectiveness(attackerType, defenderType2, scaled);
+        }
+        return scaled;
+    }
+
+    function test_dualTypeMatchesSequentialForAllTypes() public view {
+        uint32[8] memory basePowers = [uint32(0), 1, 2, 3, 7, 80, 255, MAX_BASE_POWER];
+        for (uint256 a; a < 16; ++a) {
+            for (uint256 t1; t1 < 16; ++t1) {
+                for (uint256 t2; t2 < 16; ++t2) {
+                    for (uint256 i; i < basePowers.length; ++i) {
+                        assertEq(
+                            typeCalc.getDualTypeEffectiveness(Type(a), Type(t1), Type(t2), basePowers[i]),
+                            _sequential(Type(a), Type(t1), Type(t2), basePowers[i])
+                        );
+                    }
+                }
+            }
+        }
+    }
+
+    function testFuzz_dualTypeMatchesSequential(uint8 a, uint8 t1, uint8 t2, uint32 basePower) public view {
+        Type attackerType = Type(bound(a, 0, 15));
+        Type defenderType1 = Type(bound(t1, 0, 15));
+        Type defenderType2 = Type(bound(t2, 0, 15));
+        basePower = uint32(bound(basePower, 0, MAX_BASE_POWER));
+        assertEq(
+            typeCalc.getDualTypeEffectiveness(attackerType, defenderType1, defenderType2, basePower),
+            _sequential(attackerType, defenderType1, defenderType2, basePower)
+        );
+    }
+}